@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from exifdata.logging import logger
 
-from exifdata.framework import Metadata
+from exifdata.framework import Metadata, Namespace, Field, Plan
 
 from exifdata.models.exif import EXIF
 from exifdata.models.iptc import IPTC, IPTCFormat
@@ -259,17 +259,37 @@ class Models(object):
 
         return model
 
-    def assign(self, name: str, value: object, models: list[str] = None, **kwargs):
-        """Support assigning a value to any metadata model that has a field with a matching fully-qualified name or registered fully-qualified alias name."""
+    @classmethod
+    def resolve(
+        cls, name: str, models: list[str] = None, modeltypes: list[type] = None
+    ) -> list[tuple[type, Namespace, Field]]:
+        """Resolve a field name, optionally prefixed by a metadata model name, such as
+        'xmp:dc:title' or 'dc:title', to the metadata model types, namespaces and fields
+        that have a matching fully-qualified name or registered fully-qualified alias.
+
+        The field name is resolved against the specified model types, or against all of
+        the supported model types by default; a prefix is only treated as a model name
+        if it names one of these model types, otherwise it is treated as part of the
+        field name, such as the 'exif' namespace prefix of the XMP model's fields."""
+
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        if models is None:
+            pass
+        elif not isinstance(models, (list, tuple, set)):
+            raise TypeError(
+                "The 'models' argument, if specified, must have a list of model names!"
+            )
 
-        logger.debug(
-            "%s.assign(name: %r, value: %r)",
-            self.__class__.__name__,
-            name,
-            value,
-        )
+        if modeltypes is None:
+            modeltypes = cls._modeltypes
+        elif not isinstance(modeltypes, (list, tuple)):
+            raise TypeError(
+                "The 'modeltypes' argument, if specified, must have a list of model types!"
+            )
 
-        found: bool = False
+        resolved: list[tuple[type, Namespace, Field]] = []
 
         fullname: str = name
 
@@ -278,24 +298,111 @@ class Models(object):
         if len(parts := name.split(":", maxsplit=1)) == 2:
             (prefix, name) = parts
 
-        modelprefixes: list[str] = []
+        modelprefixes: list[str] = [
+            modeltype.__name__.lower() for modeltype in modeltypes
+        ]
 
-        for model in self._models:
-            modelprefixes.append(model.name.lower())
-
-        for model in self._models:
-            if models and not model.name in models:
+        for modeltype in modeltypes:
+            if models and not modeltype.__name__ in models:
                 continue
             elif prefix:
                 if prefix.lower() in modelprefixes:
-                    if not model.name.lower() == prefix.lower():
+                    if not modeltype.__name__.lower() == prefix.lower():
                         continue
                 else:
                     name = fullname
 
-            if match := model.field_by_property(property="names", value=name):
+            # Ensure the model has been set up, so that its namespaces are available
+            modeltype._initialize()
+
+            if match := modeltype.field_by_property(property="names", value=name):
                 (namespace, field) = match
 
+                resolved.append((modeltype, namespace, field))
+
+        return resolved
+
+    @classmethod
+    def compile(
+        cls, mapping: list[str] | dict[str, str], models: list[str] = None
+    ) -> Plan:
+        """Compile an assignment plan for the provided field names, each optionally
+        prefixed by a metadata model name, resolving each name to the metadata model
+        types, namespaces, fields and value types that values will be assigned to once,
+        so that the plan can be applied to many Models instances, for example to tag a
+        large number of images, without resolving the field names for each assignment.
+        The mapping can either be a list of field names, or a dictionary that maps keys,
+        such as the column names of a data source, to field names; the values passed to
+        the plan's apply() method must then be keyed by the same names or keys. Any names
+        that cannot be resolved are logged once, and are noted by the plan's unresolved
+        property, rather than being reported each time the plan is applied."""
+
+        if isinstance(mapping, (list, tuple, set)):
+            mapping = {name: name for name in mapping}
+        elif not isinstance(mapping, dict):
+            raise TypeError(
+                "The 'mapping' argument must have a list or dictionary value!"
+            )
+
+        plan = Plan()
+
+        for key, name in mapping.items():
+            if not isinstance(key, str):
+                raise TypeError("The 'mapping' keys must have string values!")
+
+            for modeltype, namespace, field in cls.resolve(name=name, models=models):
+                if not isinstance(klass := modeltype._types.get(field.type), type):
+                    raise ValueError(
+                        f"The field type, '{field.type}', does not map to a registered value type!"
+                    )
+
+                plan.target(
+                    key=key,
+                    model=modeltype,
+                    namespace=namespace,
+                    field=field,
+                    klass=klass,
+                )
+
+            if not key in plan:
+                logger.warning(
+                    "%s.compile() The '%s' field could not be found on any model!",
+                    cls.__name__,
+                    name,
+                )
+
+                plan.unresolvable(key=key, name=name)
+
+        return plan
+
+    def assign(self, name: str, value: object, models: list[str] = None, **kwargs):
+        """Support assigning a value to any metadata model that has a field with a matching fully-qualified name or registered fully-qualified alias name."""
+
+        logger.debug(
+            "%s.assign(name: %r, value: %r)",
+            self.__class__.__name__,
+            name,
+            value,
+        )
+
+        found: bool = False
+
+        fullname: str = name
+
+        # Model name prefixes are those of the models held, as with the models searched
+        modeltypes: list[type] = []
+
+        for model in self._models:
+            if not type(model) in modeltypes:
+                modeltypes.append(type(model))
+
+        for modeltype, namespace, field in self.resolve(
+            name=fullname, models=models, modeltypes=modeltypes
+        ):
+            for model in self._models:
+                if not isinstance(model, modeltype):
+                    continue
+
                 logger.debug(
                     "%s.assign() Found '%s.%s.%s'",
                     self.__class__.__name__,
@@ -312,7 +419,7 @@ class Models(object):
                     logger.warning(
                         "%s.assign() The '%s' field failed validation: %s",
                         self.__class__.__name__,
-                        name,
+                        fullname,
                         str(exception),
                     )
 
@@ -336,8 +443,9 @@ class Models(object):
 
         return self
 
-    def decode(self, order: ByteOrder = ByteOrder.MSB, **kwargs) -> Models:
-        """Support decoding the current metadata from the in-memory image"""
+    def decode(self, order: ByteOrder = None, **kwargs) -> Models:
+        """Support decoding the current metadata from the in-memory image; unless the
+        byte order is specified, it is determined from the image's metadata payloads."""
 
         logger.debug(
             "%s.decode(order: %s, kwargs: %s)", self.__class__.__name__, order, kwargs
@@ -347,8 +455,10 @@ class Models(object):
 
         return self
 
-    def encode(self, order: ByteOrder = ByteOrder.MSB, **kwargs) -> Models:
-        """Support encoding the current metadata and updating the in-memory image"""
+    def encode(self, order: ByteOrder = None, **kwargs) -> Models:
+        """Support encoding the current metadata and updating the in-memory image; unless
+        the byte order is specified, the native byte order of the metadata is retained.
+        """
 
         logger.debug(
             "%s.encode(order: %s, kwargs: %s)",
@@ -361,6 +471,49 @@ class Models(object):
 
         return self
 
+    def encoded_size(
+        self, order: ByteOrder = None, **options: dict[str, object]
+    ) -> dict[str, int]:
+        """Return the exact length in bytes of each model's encoded payload, keyed by the
+        model name, computed without encoding the payloads where the model supports it,
+        so that payloads that would exceed the 65,533 byte limit of a JPEG APP1 or APP13
+        segment can be trimmed, split or routed elsewhere before encoding. The options
+        for each model's encoded_size() method may be specified as dictionaries keyed by
+        the lowercased model name, such as iptc=dict(format=IPTCFormat.APP13), and take
+        precedence over the options that the adapter passes to each model when encoding,
+        including the byte order, which the adapter determines unless it is specified.
+        """
+
+        logger.debug(
+            "%s.encoded_size(order: %s, options: %s)",
+            self.__class__.__name__,
+            order,
+            options,
+        )
+
+        if order is None:
+            pass
+        elif not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument, if specified, must reference a ByteOrder enumeration option!"
+            )
+
+        sizes: dict[str, int] = {}
+
+        for model in self._models:
+            if not isinstance(arguments := options.get(model.name.lower(), {}), dict):
+                raise TypeError(
+                    "The '%s' argument, if specified, must have a dictionary value!"
+                    % (model.name.lower())
+                )
+
+            # Use the options that the adapter encodes the model with, unless overridden
+            arguments = dict(self.adapter.options(model, order=order), **arguments)
+
+            sizes[model.name] = model.encoded_size(**arguments)
+
+        return sizes
+
     def save(self, **kwargs) -> object:
         """Support saving the current metadata to the image."""
 
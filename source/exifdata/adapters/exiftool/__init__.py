@@ -12,6 +12,7 @@ from deliciousbytes import ByteOrder
 
 import subprocess
 import os
+import warnings
 
 logger = logger.getChild(__name__)
 
@@ -97,11 +98,35 @@ class EXIFTool(Adapter):
     def set(self, name: str, value: bytes) -> Adapter:
         raise NotImplementedError
 
-    def byteoder(self) -> ByteOrder:
-        # TODO: Determine the byte order from the current image if possible!
+    def byteorder(self) -> ByteOrder:
+        """Determine the byte order of the image's metadata from the EXIFTool reported
+        'ExifByteOrder' field, such as "Little-endian (Intel, II)", if present, falling
+        back to big-endian byte order otherwise."""
+
+        if isinstance(value := self.metadata.get("ExifByteOrder"), str):
+            if "II" in value or value.lower().startswith("little"):
+                return ByteOrder.LSB
+
         return ByteOrder.MSB
 
-    def decode(self, metadata: dict[str, object] = None) -> None:
+    def byteoder(self) -> ByteOrder:
+        """Deprecated: the previously misspelled name of the byteorder() method, which
+        is retained for backwards compatibility until it is removed in a later release.
+        """
+
+        warnings.warn(
+            f"The '{self.__class__.__name__}.byteoder()' method is deprecated; use the 'byteorder()' method instead!",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        return self.byteorder()
+
+    def decode(
+        self,
+        metadata: dict[str, object] = None,
+        order: ByteOrder = None,  # ignored, but here for consistency with other adapters
+    ) -> None:
         """Supports creating and populating instances of the EXIFData metadata model
         classes from a dictionary of EXIFTool command line option fields and values."""
 
@@ -130,7 +155,10 @@ class EXIFTool(Adapter):
         """Supports erasing the raw metadata payloads with the specified names."""
         pass
 
-    def encode(self) -> None:
+    def encode(
+        self,
+        order: ByteOrder = None,  # ignored, but here for consistency with other adapters
+    ) -> None:
         if self.models is None:
             raise RuntimeError(
                 "The 'models' property has not been set; it must reference a Models class instance!"
@@ -138,5 +166,4 @@ class EXIFTool(Adapter):
         pass
 
     def save(self, **kwargs) -> None:
-        # TODO: Determine the byte order from the current image if possible!
         pass
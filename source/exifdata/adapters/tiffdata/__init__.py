@@ -312,21 +312,32 @@ class TIFFData(Adapter):
                     # EXIF field that the value will be assigned to
                     self.set(field=field, value=value, ifd=ifd)
             else:
-                options: dict[str, object] = dict()
+                options: dict[str, object] = self.options(model, order=order)
 
-                if model.name == "IPTC":
-                    # IPTC written to the RichTIFFIPTC Tag (33723) does not require the
-                    # "Photoshop" preamble required for the Adobe Resources Tag (34377)
-                    # so we configure the IPTC model to generate the payload in its raw
-                    # form; that is without the "Photoshop" preamble:
-                    options = dict(format=IPTCFormat.RAW)
-
-                if isinstance(encoded := model.encode(order=order, **options), bytes):
+                if isinstance(encoded := model.encode(**options), bytes):
                     for fieldname, cläss in self.mapping.items():
                         if isinstance(model, cläss):
                             self.set(field=fieldname, value=encoded, ifd=ifd)
                             break
 
+    def options(self, model: Metadata, order: ByteOrder = None) -> dict[str, object]:
+        """Return the options passed to the encode() method of the given model; unless
+        the byte order is specified, the byte order of the image is used."""
+
+        if order is None:
+            order = self.byteorder()
+
+        options: dict[str, object] = dict(order=order)
+
+        if model.name == "IPTC":
+            # IPTC written to the RichTIFFIPTC Tag (33723) does not require the
+            # "Photoshop" preamble required for the Adobe Resources Tag (34377)
+            # so we configure the IPTC model to generate the payload in its raw
+            # form; that is without the "Photoshop" preamble:
+            options["format"] = IPTCFormat.RAW
+
+        return options
+
     def save(self, order: ByteOrder = None, **kwargs) -> None:
         """Supports saving the image to storage via the adapter."""
 
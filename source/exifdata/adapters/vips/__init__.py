@@ -136,14 +136,20 @@ class VIPS(Adapter):
         return self
 
     def byteorder(self) -> ByteOrder:
-        # TODO: Determine the byte order from the current image if possible!
+        """Determine the byte order of the image's metadata from the TIFF header of its
+        EXIF payload, if present, falling back to big-endian byte order otherwise."""
+
+        if isinstance(data := self.get("exif-data"), bytes):
+            if isinstance(order := EXIF.byteorder(data), ByteOrder):
+                return order
+
         return ByteOrder.MSB
 
     def decode(self, order: ByteOrder = None) -> None:
         logger.debug("%s.decode(order: %s)", self.__class__.__name__, order)
 
         if order is None:
-            order = self.byteorder()
+            pass
         elif not isinstance(order, ByteOrder):
             raise TypeError(
                 "The 'order' argument, if specified, must reference a ByteOrder enumeration class option!"
@@ -166,7 +172,22 @@ class VIPS(Adapter):
                     cläss,
                 )
 
-                if isinstance(model := cläss.decode(value=data, order=order), cläss):
+                options: dict[str, object] = dict(order=order)
+
+                # The EXIF model determines the byte order from its payload's TIFF header,
+                # while IPTC-IIM payloads are always big-endian
+                if order is None and not cläss is EXIF:
+                    options["order"] = ByteOrder.MSB
+
+                # IPTC payloads are written in their raw form, as noted in encode(), so
+                # these are recognised by their leading record marker, while payloads
+                # from other sources may hold the APP13 "Photoshop" preamble
+                if cläss is IPTC and data[0:1] == b"\x1c":
+                    options["format"] = IPTCFormat.RAW
+
+                model = cläss.decode(value=data, **options)
+
+                if isinstance(model, cläss):
                     self.models.update(model)
             elif isinstance(data := self.get(fieldname), object) and not data is None:
                 logger.debug(
@@ -220,7 +241,7 @@ class VIPS(Adapter):
         logger.debug("%s.encode(order: %s)", self.__class__.__name__, order)
 
         if order is None:
-            order = self.byteorder()
+            pass
         elif not isinstance(order, ByteOrder):
             raise TypeError(
                 "The 'order' argument, if specified, must reference a ByteOrder enumeration class option!"
@@ -242,21 +263,28 @@ class VIPS(Adapter):
             #     with open(filename, "wb+") as file:
             #         file.write(model.encode(pretty=True, order=order))
 
-            options: dict[str, object] = dict()
+            options: dict[str, object] = self.options(model, order=order)
 
-            if model.name == "IPTC":
-                # IPTC written to the RichTIFFIPTC Tag (33723) does not require the
-                # "Photoshop" preamble required for the Adobe Resources Tag (34377)
-                # so we configure the IPTC model to generate the payload in its raw
-                # form; that is without the "Photoshop" preamble:
-                options = dict(format=IPTCFormat.RAW)
-
-            if isinstance(encoded := model.encode(order=order, **options), bytes):
+            if isinstance(encoded := model.encode(**options), bytes):
                 for fieldname, cläss in self.mapping.items():
                     if isinstance(model, cläss):
                         self.set(name=fieldname, value=encoded)
                         break
 
+    def options(self, model: Metadata, order: ByteOrder = None) -> dict[str, object]:
+        """Return the options passed to the encode() method of the given model."""
+
+        options: dict[str, object] = super().options(model, order=order)
+
+        if model.name == "IPTC":
+            # IPTC written to the RichTIFFIPTC Tag (33723) does not require the
+            # "Photoshop" preamble required for the Adobe Resources Tag (34377)
+            # so we configure the IPTC model to generate the payload in its raw
+            # form; that is without the "Photoshop" preamble:
+            options["format"] = IPTCFormat.RAW
+
+        return options
+
     def save(self, order: ByteOrder = None, **kwargs) -> None:
         logger.debug(
             "%s.save(order: %s, kwargs: %s)", self.__class__.__name__, order, kwargs
@@ -4,4 +4,5 @@ secrets = dict(
     language=os.getenv("LANGUAGE", default="en"),
     country=os.getenv("COUNTRY", default="US"),
     exiftool=os.getenv("EXIFTOOL", default=None),
+    cache=os.getenv("EXIFDATA_CACHE", default=None),
 )
@@ -4,7 +4,11 @@ from exifdata.framework.structure import Structure
 from exifdata.framework.type import Type
 from exifdata.framework.field import Field
 from exifdata.framework.value import Value
+from exifdata.framework.values import Values
+from exifdata.framework.transliterator import Transliterator
 from exifdata.framework.metadata import Metadata
+from exifdata.framework.schema import Schema
+from exifdata.framework.plan import Plan
 
 __all__ = [
     "Namespace",
@@ -13,5 +17,9 @@ __all__ = [
     "Type",
     "Field",
     "Value",
+    "Values",
+    "Transliterator",
     "Metadata",
+    "Schema",
+    "Plan",
 ]
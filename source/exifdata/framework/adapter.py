@@ -4,6 +4,9 @@ import abc
 
 
 from exifdata.logging import logger
+from exifdata.framework import Metadata
+
+from deliciousbytes import ByteOrder
 
 
 logger = logger.getChild(__name__)
@@ -96,6 +99,18 @@ class Adapter(metaclass=abc.ABCMeta):
 
         pass
 
+    def options(self, model: Metadata, order: ByteOrder = None) -> dict[str, object]:
+        """Return the options that the adapter passes to the encode() method of the given
+        model when encoding, so that Models.encoded_size() reports the lengths of the
+        payloads that the adapter will embed. Unless the byte order is specified, the
+        EXIF model retains the byte order of its decoded payload, while the others use
+        big-endian byte order, as IPTC-IIM payloads are always big-endian."""
+
+        if order is None and not model.name == "EXIF":
+            order = ByteOrder.MSB
+
+        return dict(order=order)
+
     @abc.abstractmethod
     def save(self, **kwargs) -> None:
         """Supports saving the in-memory image."""
@@ -167,7 +167,7 @@ class Field(object):
         elif isinstance(options, list):
             self._options: list[object] = options
         elif isinstance(options, dict):
-            self._options: list[object] = options.keys()
+            self._options: list[object] = list(options.keys())
         else:
             raise TypeError(
                 "The 'options' argument, if specified, must have a list value!"
@@ -282,6 +282,26 @@ class Field(object):
                 "The 'section' argument, if specified, must have a string value!"
             )
 
+    def __getstate__(self) -> dict[str, object]:
+        """Support pickling the field, such as for the precompiled schema cache, noting
+        that the encoding is stored by name, as enumeration options cannot be pickled.
+        """
+
+        state: dict[str, object] = dict(self.__dict__)
+
+        if isinstance(encoding := state.get("_encoding"), Encoding):
+            state["_encoding"] = encoding.name
+
+        return state
+
+    def __setstate__(self, state: dict[str, object]):
+        """Support unpickling the field, restoring its encoding enumeration option."""
+
+        if isinstance(encoding := state.get("_encoding"), str):
+            state["_encoding"] = Encoding.reconcile(encoding)
+
+        self.__dict__.update(state)
+
     def __str__(self) -> str:
         return f"<Field({self.id})>"
 
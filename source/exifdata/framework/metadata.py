@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import functools
+import types
 import typing
 
 from exifdata.configuration import secrets
@@ -20,13 +22,41 @@ from deliciousbytes import (
 logger = logger.getChild(__name__)
 
 
+class hybridmethod(object):
+    """Bind the decorated method to the instance it is accessed through, or otherwise
+    to the class, so that the field lookups can be performed via the model classes, and
+    via model instances, where the namespaces held by the instance are also searched."""
+
+    def __init__(self, method: typing.Callable):
+        self.method = method
+
+        functools.update_wrapper(self, method)
+
+    def __get__(self, instance: object, owner: type = None) -> typing.Callable:
+        return types.MethodType(self.method, owner if instance is None else instance)
+
+
 class Metadata(object):
     _namespaces: caselessdict[str, framework.Namespace] = None
     _aliases: caselessdict[str, framework.Namespace | framework.Field] = None
     # _fields: caselessdict[str, framework.Field] = None
-    _values: caselessdict[str, framework.Value] = None
+    _values: framework.Values[str, framework.Value] = None
     _special: list[str] = None
     _types: dict[str, framework.Value] = None
+    _indexes: dict[str, dict[object, list[tuple[str, str]]]] = None
+    # The indexed properties whose string values are matched exactly, as field IDs and
+    # names are compared exactly; the other string keyed indexes are case-insensitive
+    _exact: frozenset[str] = frozenset(["id", "identifier", "name"])
+    _setup: bool = False
+
+    @classmethod
+    def _initialize(cls):
+        """Ensure the model's namespaces have been initialized from its schema, which is
+        performed once, when the model is first instantiated, so that fields can be
+        looked up via the class methods before any instances have been created."""
+
+        if cls._setup is False:
+            cls()
 
     @classmethod
     def register_type(cls, type: str, klass: framework.Value):
@@ -61,37 +91,191 @@ class Metadata(object):
         return cls._types[type]
 
     @classmethod
-    def field_by_id(cls, id: str) -> tuple[framework.Namespace, framework.Field] | None:
-        for name, namespace in cls._namespaces.items():
-            for field in namespace.fields.values():
-                if field.id == id:
-                    return (namespace, field)
+    def _indexed(
+        cls,
+        namespace: framework.Namespace,
+        identifier: str,
+        specification: dict[str, object],
+    ) -> dict[str, list[object]]:
+        """Return the property values that the specified field should be indexed by; the
+        values are sourced from the field's specification, so that fields can be indexed
+        before their namespace has been materialized. Subclasses may extend the indexes.
+        """
+
+        name: str = specification.get("name")
+
+        if isinstance(aliases := specification.get("alias") or [], str):
+            aliases = [aliases]
+
+        if isinstance(pseudonyms := specification.get("pseudonym") or [], str):
+            pseudonyms = [pseudonyms]
+        elif isinstance(pseudonyms, dict):
+            pseudonyms = list(pseudonyms.values())
+
+        indexed: dict[str, list[object]] = {
+            "id": [identifier],
+            "identifier": [identifier],
+            "name": [name],
+            "names": [name, identifier] + list(aliases) + list(pseudonyms),
+            "aliases": list(aliases),
+            "pseudonym": list(pseudonyms),
+        }
+
+        if isinstance(tagid := specification.get("tagid"), int):
+            indexed["tagid"] = [tagid]
+
+        return indexed
 
     @classmethod
-    def field_by_name(
-        cls, name: str
+    def _indexkey(cls, property: str, value: object) -> object:
+        """Return the index key for the provided property value; subclasses may override
+        this to map property values, such as enumeration options, to their index keys.
+        """
+
+        return value
+
+    @classmethod
+    def _index(cls, property: str) -> dict[object, list[tuple[str, str]]] | None:
+        """Return the class-level index for the named field property, which maps each of
+        the property's values to the keys of the namespaces and fields that hold it, in
+        the order the namespaces and fields are defined. The indexes are built once per
+        metadata model class, when they are first needed; field IDs and names are matched
+        exactly, while the other string keyed indexes, such as the 'names' index holding
+        the names, identifiers, aliases and pseudonyms of the fields, are matched in a
+        case-insensitive manner, as with the Field.names list."""
+
+        # Each model subclass holds its own indexes, so they are not inherited
+        if (indexes := cls.__dict__.get("_indexes")) is None:
+            indexes: dict[str, dict[object, list[tuple[str, str]]]] = {}
+
+            for key, namespace in cls._namespaces.items():
+                for identifier, specification in namespace.specifications():
+                    entry: tuple[str, str] = (key, specification.get("name"))
+
+                    for name, values in cls._indexed(
+                        namespace=namespace,
+                        identifier=identifier,
+                        specification=specification,
+                    ).items():
+                        if (index := indexes.get(name)) is None:
+                            index = indexes[name] = (
+                                caselessdict()
+                                if not name in cls._exact
+                                and all(isinstance(value, str) for value in values)
+                                else {}
+                            )
+
+                        for value in values:
+                            if value is None:
+                                continue
+                            elif not (entries := index.get(value)):
+                                index[value] = [entry]
+                            elif not entry in entries:
+                                entries.append(entry)
+
+            # Only retain the indexes once the model's namespaces have been created
+            if len(cls._namespaces) > 0:
+                cls._indexes = indexes
+
+        return indexes.get(property)
+
+    @hybridmethod
+    def _lookup(
+        this: type[Metadata] | Metadata,
+        property: str,
+        value: object,
+        namespace: framework.Namespace = None,
     ) -> tuple[framework.Namespace, framework.Field] | None:
-        for name, namespace in cls._namespaces.items():
-            for field in namespace.fields.values():
-                if field.name == name:
-                    return (namespace, field)
+        """Look up a field via the class-level index for the named property, returning
+        the namespace and field, only materializing the namespace holding the field. If
+        several fields hold the value, the first defined takes precedence, unless the
+        lookup has been restricted to the fields of the specified namespace. If called
+        on an instance, only the namespaces held by the instance are considered, and
+        any namespaces added to the instance, which are not indexed, are then searched.
+        """
+
+        klass: type[Metadata] = this if isinstance(this, type) else type(this)
+
+        if isinstance(index := klass._index(property), dict):
+            try:
+                entries: list[tuple[str, str]] = index.get(
+                    klass._indexkey(property, value)
+                )
+            except TypeError:  # unhashable values cannot be indexed
+                entries = None
+
+            for key, name in entries or []:
+                if not isinstance(
+                    _namespace := klass._namespaces.get(key), framework.Namespace
+                ):
+                    continue
+                elif not this._namespaces.get(key) is _namespace:
+                    continue
+                elif namespace is None or namespace is _namespace:
+                    if isinstance(
+                        field := _namespace.fields.get(name), framework.Field
+                    ):
+                        return (_namespace, field)
+
+        if this is klass:
+            return None
+
+        # Search any namespaces that were added to the instance, as they are not indexed
+        for key, _namespace in this._namespaces.items():
+            if klass._namespaces.get(key) is _namespace:
+                continue
+            elif namespace is None or namespace is _namespace:
+                for field in _namespace.fields.values():
+                    if klass._matches(field, property, value):
+                        return (_namespace, field)
 
     @classmethod
+    def _matches(cls, field: framework.Field, property: str, value: object) -> bool:
+        """Determine if the named property of the field holds the specified value."""
+
+        if (attr := getattr(field, property, None)) is None:
+            return False
+        elif isinstance(attr, type(value)) and attr == value:
+            return True
+        elif isinstance(attr, list) and value in attr:
+            return True
+
+        return False
+
+    @hybridmethod
+    def field_by_id(
+        this: type[Metadata] | Metadata, id: str
+    ) -> tuple[framework.Namespace, framework.Field] | None:
+        return this._lookup(property="id", value=id)
+
+    @hybridmethod
+    def field_by_name(
+        this: type[Metadata] | Metadata, name: str
+    ) -> tuple[framework.Namespace, framework.Field] | None:
+        return this._lookup(property="name", value=name)
+
+    @hybridmethod
     def field_by_property(
-        cls, property: str, value: object
+        this: type[Metadata] | Metadata, property: str, value: object
     ) -> tuple[framework.Namespace, framework.Field] | None:
         logger.debug(
             "%s.field_by_property(property: %s, value: %s, %s)"
-            % (cls.__name__, property, value, type(value))
+            % (
+                this.__name__ if isinstance(this, type) else this.__class__.__name__,
+                property,
+                value,
+                type(value),
+            )
         )
 
-        for name, namespace in cls._namespaces.items():
+        # If the property has been indexed, the field can be found via the index
+        if isinstance(this._index(property), dict):
+            return this._lookup(property=property, value=value)
+
+        for name, namespace in this._namespaces.items():
             for field in namespace.fields.values():
-                if not (attr := getattr(field, property, None)) is None:
-                    if isinstance(attr, type(value)) and attr == value:
-                        return (namespace, field)
-                    elif isinstance(attr, list) and value in attr:
-                        return (namespace, field)
+                if this._matches(field, property, value):
+                    return (namespace, field)
 
     def __init__(self, namespaces: dict[str, framework.Namespace] = None):
         logger.debug(
@@ -137,7 +321,7 @@ class Metadata(object):
                     )
 
         # self._fields: caselessdict[str, framework.Field] = caselessdict()
-        self._values: caselessdict[str, framework.Value] = caselessdict()
+        self._values: framework.Values[str, framework.Value] = framework.Values()
         self._special: list[str] = [
             prop for prop in dir(self) if not prop.startswith("_")
         ]
@@ -268,24 +452,26 @@ class Metadata(object):
                 "To set a value on the model, a field name or field class reference must be provided via the 'name' or 'field' arguments!"
             )
 
-        for _identifier, _namespace in self._namespaces.items():
-            # logger.debug(" >>>>>>> checking namespace: %s, %s" % (_identifier, _namespace))
-
-            if (
-                isinstance(namespace, framework.Namespace)
-                and not namespace is _namespace
+        if not isinstance(namespace, framework.Namespace):
+            namespace = None
+
+        # Resolve the field via the class-level field indexes, or for namespaces added to
+        # this instance, by searching their fields, honouring any namespace restriction;
+        # a field reference must be one of the model's own field instances
+        if isinstance(field, framework.Field):
+            if result := self._lookup(
+                property="id", value=field.id, namespace=namespace
             ):
-                continue
+                if result[1] is field:
+                    return result[0].set(metadata=self, field=field, value=value)
 
-            for _identifier, _field in _namespace._fields.items():
-                # logger.debug(" >>>>>>> checking field: %s" % (_field.id))
+        if isinstance(name, str):
+            if result := self._lookup(
+                property="names", value=name, namespace=namespace
+            ):
+                (_namespace, _field) = result
 
-                if isinstance(field, framework.Field) and field is _field:
-                    # logger.debug(" >>>>>>>> found field: %s to set with %s" % (_field.id, value))
-                    return _namespace.set(metadata=self, field=_field, value=value)
-                elif isinstance(name, str) and name in _field.names:
-                    # logger.debug(" >>>>>>>> found field: %s to set with %s" % (_field.id, value))
-                    return _namespace.set(metadata=self, field=_field, value=value)
+                return _namespace.set(metadata=self, field=_field, value=value)
 
         raise AttributeError(f"Setting the '{name or field.name}' attribute failed!")
 
@@ -345,7 +531,7 @@ class Metadata(object):
         for identifier, namespace in self._namespaces.items():
             # logger.debug(" - %s" % (identifier))
 
-            for identifier, field in namespace._fields.items():
+            for identifier, field in namespace.fields.items():
                 # logger.debug("  - %s (%s)" % (identifier, field.name))
 
                 if field.identifier in fields:
@@ -367,7 +553,11 @@ class Metadata(object):
             raise TypeError("The 'all' argument must have a boolean value!")
 
         for namespace in self._namespaces.values():
-            for field in namespace._fields.values():
+            # Values can only be held for fields in namespaces that have been created
+            if namespace.materialized is False and all is False:
+                continue
+
+            for field in namespace.fields.values():
                 if isinstance(value := self._values.get(field.id), framework.Value):
                     yield (field, value)
                 elif all is True:
@@ -378,7 +568,7 @@ class Metadata(object):
         keys: list[str] = []
 
         for namespace in self._namespaces.values():
-            for key in namespace._fields.keys():
+            for key in namespace.fields.keys():
                 keys.append(key)
 
         return keys
@@ -388,7 +578,7 @@ class Metadata(object):
         values: list[framework.Value] = []
 
         for namespace in self._namespaces.values():
-            for field in namespace._fields.values():
+            for field in namespace.fields.values():
                 if not (value := self._values.get(field.id)) is None:
                     values.append(value)
                 else:
@@ -405,6 +595,18 @@ class Metadata(object):
     ) -> bytes:
         raise NotImplementedError
 
+    def encoded_size(self, order: ByteOrder = None, **kwargs) -> int:
+        """Return the exact length in bytes of the payload that encode() would produce
+        for the same arguments, or 0 if there is nothing to encode, so that payloads that
+        would exceed the size limits of their image file segments can be identified and
+        handled early. Models whose payload layout can be computed from their values
+        override this to do so without encoding; otherwise the payload is encoded."""
+
+        if isinstance(encoded := self.encode(order=order, **kwargs), bytes):
+            return len(encoded)
+
+        return 0
+
     @abc.abstractmethod
     def decode(self, value: bytes) -> Metadata:
         raise NotImplementedError
@@ -420,7 +622,7 @@ class Metadata(object):
             if namespace.utilized is False and all is False:
                 continue
 
-            for field in namespace._fields.values():
+            for field in namespace.fields.values():
                 if not namespace.name in values:
                     values[namespace.name] = caselessdict()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+import threading
 
 from exifdata.logging import logger
 from exifdata import framework
@@ -27,6 +28,8 @@ class Namespace(object):
     _special: list[str] = None
     _utilized: bool = False
     _unwrap: bool = False
+    _deferred: tuple[type, dict[str, dict]] = None
+    _lock: threading.Lock = threading.Lock()
 
     def __init__(
         self,
@@ -136,11 +139,36 @@ class Namespace(object):
         self._fieldmap: caselessdict[str, framework.Field] = caselessdict()
         self._special = [prop for prop in dir(self) if not prop.startswith("_")]
 
+    def __getstate__(self) -> dict[str, object]:
+        """Support pickling the namespace, such as for the precompiled schema cache, by
+        converting its caseless dictionaries to standard dictionaries, as the caseless
+        dictionaries cannot be restored by pickle before their key maps are created."""
+
+        state: dict[str, object] = dict(self.__dict__)
+
+        for name in ["_structures", "_fields", "_fieldmap"]:
+            if isinstance(state.get(name), caselessdict):
+                state[name] = dict(state[name])
+
+        # The namespace is only associated with a metadata model instance at runtime
+        state.pop("_metadata", None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, object]):
+        """Support unpickling the namespace, restoring its caseless dictionaries."""
+
+        for name in ["_structures", "_fields", "_fieldmap"]:
+            if isinstance(state.get(name), dict):
+                state[name] = caselessdict(state[name])
+
+        self.__dict__.update(state)
+
     def __str__(self) -> str:
         return f"<Namespace({self.id})>"
 
     def __contains__(self, name: str) -> bool:
-        return name in self._fieldmap
+        return name in self.materialize()._fieldmap
 
     def __getattr__(self, name: str) -> object | None:
         logger.debug("%s.__getattr__(name: %s)" % (self.__class__.__name__, name))
@@ -150,9 +178,12 @@ class Namespace(object):
         if name.startswith("_") or name in self._special:
             value = super().__getattr__(name)
 
-        elif field := self._fieldmap.get(name):
+        elif field := self.materialize()._fieldmap.get(name):
             if self._metadata and field.id in self._metadata._values:
-                value = self._metadata._values[field.id].value
+                if isinstance(value := self._metadata._values[field.id], list):
+                    value = [value.value for value in value]
+                else:
+                    value = value.value
         else:
             raise AttributeError(
                 "The '%s' namespace does not have a '%s' attribute!"
@@ -186,7 +217,7 @@ class Namespace(object):
             return super().__setattr__(name, value)
 
         # TODO: Convert field.name to field.identifier
-        elif field := self._fieldmap.get(name):
+        elif field := self.materialize()._fieldmap.get(name):
             if field.readonly is True:
                 raise NotImplementedError(f"The '{field.name}' field is readonly!")
 
@@ -283,7 +314,7 @@ class Namespace(object):
 
     @property
     def fields(self) -> dict[str, framework.Field]:
-        return self._fields
+        return self.materialize()._fields
 
     @fields.setter
     def fields(self, fields: dict[str, framework.Field]):
@@ -317,6 +348,81 @@ class Namespace(object):
 
         # logger.debug("%s.field[%s] = %s" % (self.__class__.__name__, field.name, field))
 
+    @property
+    def materialized(self) -> bool:
+        """Determine if the namespace's fields have been created, or are still deferred."""
+
+        return self._deferred is None
+
+    def defer(self, klass: type, fields: dict[str, dict]) -> Namespace:
+        """Defer the creation of the namespace's fields until the namespace is first used
+        so that models only pay the cost of creating the fields of the namespaces that
+        are actually used; the fields are created from the provided specifications using
+        the specified Field subclass type when the namespace is materialized."""
+
+        if not (isinstance(klass, type) and issubclass(klass, framework.Field)):
+            raise TypeError("The 'klass' argument must reference a Field subclass!")
+
+        if not isinstance(fields, dict):
+            raise TypeError("The 'fields' argument must have a dictionary value!")
+
+        self._deferred = (klass, fields)
+
+        return self
+
+    def materialize(self) -> Namespace:
+        """Create the namespace's fields from their deferred specifications, if needed."""
+
+        if self._deferred is None:
+            return self
+
+        with self.__class__._lock:
+            # Another thread may have materialized the namespace while we were waiting
+            if self._deferred is None:
+                return self
+
+            (klass, fields) = self._deferred
+
+            for identifier, specification in fields.items():
+                self.field = klass(
+                    namespace=self,
+                    identifier=identifier,
+                    **specification,  # pass the properties via dictionary expansion
+                )
+
+            self._deferred = None
+
+        logger.debug(
+            "%s.materialize() Created %d fields for the '%s' namespace"
+            % (self.__class__.__name__, len(self._fields), self.id)
+        )
+
+        return self
+
+    def specifications(
+        self,
+    ) -> typing.Generator[tuple[str, dict[str, object]], None, None]:
+        """Yield the identifier and specification of each of the namespace's fields, so
+        that the fields can be indexed without the namespace needing to be materialized.
+        """
+
+        if self._deferred is None:
+            for field in self._fields.values():
+                yield (
+                    field.id,
+                    dict(
+                        name=field.name,
+                        alias=field.aliases,
+                        pseudonym=field.pseudonym,
+                        tagid=getattr(field, "tagid", None),
+                    ),
+                )
+        else:
+            (klass, fields) = self._deferred
+
+            for identifier, specification in fields.items():
+                yield (identifier, specification)
+
     @property
     def value(self):
         raise NotImplementedError
@@ -400,13 +506,13 @@ class Namespace(object):
         self._utilized = True
 
     def items(self) -> typing.Generator[tuple[str, framework.Field], None, None]:
-        for name, field in self._fields.items():
+        for name, field in self.fields.items():
             yield (name, field)
 
     def keys(self) -> typing.Generator[str, None, None]:
-        for name in self._fields.keys():
+        for name in self.fields.keys():
             yield name
 
     def values(self) -> typing.Generator[framework.Field, None, None]:
-        for field in self._fields.values():
+        for field in self.fields.values():
             yield field
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import typing
+
+from exifdata.logging import logger
+from exifdata import framework
+
+
+logger = logger.getChild(__name__)
+
+
+class Plan(object):
+    """The Plan class holds a compiled set of metadata model field assignments, where
+    each of the field names has been resolved in advance to the metadata model types,
+    namespaces, fields and value types that values assigned to the name will be set on,
+    so that the same field names can be assigned repeatedly, such as when tagging many
+    images, without needing to resolve the field names for every assignment. Plans are
+    created via the Models.compile() method and can be shared between Models instances.
+    """
+
+    _targets: dict[
+        str,
+        list[tuple[type, framework.Namespace, framework.Field, framework.Value]],
+    ] = None
+    _unresolved: dict[str, str] = None
+
+    def __init__(self):
+        self._targets = {}
+        self._unresolved = {}
+
+    def __len__(self) -> int:
+        """Return the count of resolved keys held by the plan."""
+
+        return len(self._targets)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._targets
+
+    @property
+    def keys(self) -> list[str]:
+        """Return the keys of the resolved assignments held by the plan."""
+
+        return list(self._targets.keys())
+
+    @property
+    def unresolved(self) -> list[str]:
+        """Return the names that could not be resolved to a metadata model field."""
+
+        return list(self._unresolved.values())
+
+    def target(
+        self,
+        key: str,
+        model: type,
+        namespace: framework.Namespace,
+        field: framework.Field,
+        klass: framework.Value,
+    ):
+        """Add a resolved assignment target for the specified key to the plan."""
+
+        if not isinstance(key, str):
+            raise TypeError("The 'key' argument must have a string value!")
+
+        if not (isinstance(model, type) and issubclass(model, framework.Metadata)):
+            raise TypeError("The 'model' argument must reference a Metadata subclass!")
+
+        if not isinstance(namespace, framework.Namespace):
+            raise TypeError(
+                "The 'namespace' argument must reference a Namespace class instance!"
+            )
+
+        if not isinstance(field, framework.Field):
+            raise TypeError(
+                "The 'field' argument must reference a Field class instance!"
+            )
+
+        if not (isinstance(klass, type) and issubclass(klass, framework.Value)):
+            raise TypeError("The 'klass' argument must reference a Value subclass!")
+
+        self._targets.setdefault(key, []).append((model, namespace, field, klass))
+
+    def unresolvable(self, key: str, name: str):
+        """Note that the specified name could not be resolved to a metadata model field;
+        values assigned to the name's key are subsequently ignored when applying the plan.
+        """
+
+        if not isinstance(key, str):
+            raise TypeError("The 'key' argument must have a string value!")
+
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        self._unresolved[key] = name
+
+    def apply(
+        self,
+        models: typing.Iterable[framework.Metadata],
+        values: dict[str, object],
+    ):
+        """Assign the provided values, keyed by the names or keys the plan was compiled
+        with, to the matching fields of the provided metadata models, which may be held
+        by a Models class instance or any other iterable of Metadata model instances."""
+
+        if not isinstance(values, dict):
+            raise TypeError("The 'values' argument must have a dictionary value!")
+
+        instances: dict[type, framework.Metadata] = {}
+
+        for model in models:
+            if not isinstance(model, framework.Metadata):
+                raise TypeError(
+                    "The 'models' argument must reference an iterable of Metadata class instances!"
+                )
+
+            instances[model.__class__] = model
+
+        for key, value in values.items():
+            if (targets := self._targets.get(key)) is None:
+                if key in self._unresolved:
+                    continue
+
+                raise KeyError(f"The '{key}' key was not compiled into the plan!")
+
+            for modeltype, namespace, field, klass in targets:
+                if (model := instances.get(modeltype)) is None:
+                    continue
+
+                try:
+                    if value is None or isinstance(value, framework.Value):
+                        namespace.set(metadata=model, field=field, value=value)
+                    else:
+                        namespace.set(
+                            metadata=model,
+                            field=field,
+                            value=klass(field=field, metadata=model, value=value),
+                        )
+                except ValueError as exception:
+                    logger.warning(
+                        "%s.apply() The '%s' field failed validation: %s",
+                        self.__class__.__name__,
+                        key,
+                        str(exception),
+                    )
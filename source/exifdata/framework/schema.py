@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import os
+import sys
+import json
+import pickle
+import hashlib
+import tempfile
+
+from exifdata.logging import logger
+from exifdata.configuration import secrets
+from exifdata import framework
+
+
+logger = logger.getChild(__name__)
+
+
+class Schema(object):
+    """The Schema class provides access to a metadata model's schema configuration file
+    and supports caching the namespaces, structures and aliases that the model builds
+    from the schema in a precompiled form. Cached schemas are keyed by a hash of the
+    schema file, the cache format version, the library version and the Python
+    implementation, so that any change to the schema, the library or the runtime
+    results in the cache being rebuilt on demand, after which any of the schema's cache
+    files that are out of date are removed, so that the cache does not grow over time.
+
+    By default the precompiled schemas are stored in a '__pycache__' folder alongside the
+    schema file, much like Python's own bytecode cache, but an alternative location can
+    be configured via the 'EXIFDATA_CACHE' environment variable. If the cache cannot be
+    read or written, the model simply falls back to building itself from the schema."""
+
+    # The cache format version, which must be incremented whenever the framework classes
+    # held in the cache change shape, so that any previously cached files are ignored:
+    _format: int = 3
+
+    # The library version, read from the package's version file when first needed; as
+    # the framework classes held in the cache may change between releases, caches are
+    # only used by the version of the library that created them
+    _version: str = None
+
+    # The root folder of the package, within which the model schema files are held
+    _root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    _filepath: str = None
+    _name: str = None
+    _directory: str = None
+    _contents: bytes = None
+    _digest: str = None
+
+    def __init__(self, filepath: str, directory: str = None):
+        if not isinstance(filepath, str):
+            raise TypeError("The 'filepath' argument must have a string value!")
+        elif not os.path.exists(filepath):
+            raise ValueError(
+                f"The 'filepath' argument, '{filepath}', references a file that does not exist!"
+            )
+
+        self._filepath: str = filepath
+
+        if directory is None:
+            directory = secrets.get("cache") or os.path.join(
+                os.path.dirname(filepath), "__pycache__"
+            )
+        elif not isinstance(directory, str):
+            raise TypeError(
+                "The 'directory' argument, if specified, must have a string value!"
+            )
+
+        self._directory: str = directory
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def contents(self) -> bytes:
+        """Return the raw contents of the schema file, reading the file only once."""
+
+        if self._contents is None:
+            with open(self._filepath, "rb") as handle:
+                self._contents = handle.read()
+
+        return self._contents
+
+    @property
+    def version(self) -> str:
+        """Return the version of the library, which forms part of the cache key."""
+
+        if (version := Schema._version) is None:
+            filepath: str = os.path.join(Schema._root, "version.txt")
+
+            try:
+                with open(filepath, "r") as handle:
+                    version = handle.read().strip()
+            except OSError:
+                version = "unknown"
+
+            Schema._version = version
+
+        return version
+
+    @property
+    def name(self) -> str:
+        """Return the name of the schema, which prefixes the names of its cache files; the
+        name is derived from the path of the schema file within the package, such as
+        'models.exif.data.schema', so that the cache files of each model can be told
+        apart when the models share a cache directory. For schema files held outside of
+        the package, the name includes a hash of the folder holding the schema file."""
+
+        if self._name is None:
+            filepath: str = os.path.abspath(self._filepath)
+
+            try:
+                relative: str = os.path.relpath(filepath, self.__class__._root)
+            except ValueError:  # the schema file is held on another drive
+                relative: str = os.pardir
+
+            if relative.startswith(os.pardir):
+                relative = "%s.%s" % (
+                    hashlib.sha256(os.path.dirname(filepath).encode()).hexdigest()[
+                        0:16
+                    ],
+                    os.path.basename(filepath),
+                )
+
+            self._name = os.path.splitext(relative)[0].replace(os.sep, ".")
+
+        return self._name
+
+    @property
+    def digest(self) -> str:
+        """Return the SHA-256 hash of the schema file which is used as the cache key."""
+
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.contents).hexdigest()
+
+        return self._digest
+
+    @property
+    def cachepath(self) -> str:
+        """Return the file path of the precompiled schema for the current schema file."""
+
+        return os.path.join(
+            self._directory,
+            "%s.%s.v%d.%s.%s.pickle"
+            % (
+                self.name,
+                sys.implementation.cache_tag,
+                self.__class__._format,
+                self.version,
+                self.digest,
+            ),
+        )
+
+    def parse(self) -> object:
+        """Parse the schema file, returning the decoded JSON configuration data."""
+
+        return json.loads(self.contents)
+
+    def load(self) -> dict[str, object] | None:
+        """Load the precompiled schema from the cache if it is available and valid, or
+        return None so that the model can build itself from the schema file instead."""
+
+        if not os.path.exists(cachepath := self.cachepath):
+            return None
+
+        try:
+            with open(cachepath, "rb") as handle:
+                cached = pickle.load(handle)
+        except Exception as exception:
+            logger.debug(
+                "%s.load() Unable to load the cached schema from '%s': %s",
+                self.__class__.__name__,
+                cachepath,
+                exception,
+            )
+            return None
+
+        if not isinstance(cached, dict):
+            return None
+
+        if not cached.get("digest") == self.digest:
+            return None
+
+        if not cached.get("version") == self.version:
+            return None
+
+        return cached
+
+    def save(
+        self,
+        namespaces: dict[str, framework.Namespace],
+        structures: dict[str, framework.Structure],
+        aliases: dict[str, str],
+    ) -> bool:
+        """Save the namespaces, structures and aliases built from the schema file to the
+        cache, returning True if the cache was written, or False if it was not possible.
+        The cache file is written atomically so concurrent processes can safely share
+        the same cache directory, and will never observe a partially written file."""
+
+        cached: dict[str, object] = dict(
+            digest=self.digest,
+            version=self.version,
+            namespaces=namespaces,
+            structures=structures,
+            aliases=aliases,
+        )
+
+        temporary: str = None
+
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory, suffix=".tmp", delete=False
+            ) as handle:
+                temporary = handle.name
+
+                pickle.dump(cached, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary, self.cachepath)
+        except Exception as exception:
+            logger.debug(
+                "%s.save() Unable to save the cached schema to '%s': %s",
+                self.__class__.__name__,
+                self._directory,
+                exception,
+            )
+
+            if temporary and os.path.exists(temporary):
+                os.remove(temporary)
+
+            return False
+
+        self.prune()
+
+        return True
+
+    def prune(self) -> int:
+        """Remove the schema's cache files that are out of date, having been written for
+        another version of the schema file, cache format or library by the same Python
+        implementation, returning the number of files removed. The cache files of other
+        schemas and of other Python implementations are left in place."""
+
+        prefixes: list[str] = ["%s.%s." % (self.name, sys.implementation.cache_tag)]
+
+        # Cache files named after the schema file alone, as written by earlier versions
+        # of the library, can only be attributed to the schema within its own folder
+        if os.path.abspath(self._directory) == os.path.abspath(
+            os.path.join(os.path.dirname(self._filepath), "__pycache__")
+        ):
+            prefixes.append(
+                "%s.%s."
+                % (
+                    os.path.splitext(os.path.basename(self._filepath))[0],
+                    sys.implementation.cache_tag,
+                )
+            )
+
+        current: str = os.path.basename(self.cachepath)
+
+        try:
+            filenames: list[str] = os.listdir(self._directory)
+        except OSError:
+            return 0
+
+        removed: int = 0
+
+        for filename in filenames:
+            if filename == current:
+                continue
+            elif not filename.endswith(".pickle"):
+                continue
+            elif not any(filename.startswith(prefix) for prefix in prefixes):
+                continue
+
+            try:
+                os.remove(os.path.join(self._directory, filename))
+            except OSError as exception:
+                logger.debug(
+                    "%s.prune() Unable to remove the cached schema '%s': %s",
+                    self.__class__.__name__,
+                    filename,
+                    exception,
+                )
+            else:
+                removed += 1
+
+        return removed
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import unicodedata
+
+from exifdata.logging import logger
+
+
+logger = logger.getChild(__name__)
+
+
+class Table(dict):
+    """The Table class holds the str.translate() table used by the Transliterator; the
+    table maps the ordinals of the characters that have replacements to the replacement
+    strings, and is filled lazily with the remaining characters as they are encountered,
+    mapping combining characters, such as diacritics, to None so they are removed, and
+    all other characters to themselves, so each character is only classified once."""
+
+    def __missing__(self, ordinal: int) -> int | None:
+        if unicodedata.combining(chr(ordinal)):
+            self[ordinal] = None
+        else:
+            self[ordinal] = ordinal
+
+        return self[ordinal]
+
+
+class Transliterator(object):
+    """The Transliterator class provides support for transliterating strings holding
+    characters outside of the 7-bit ASCII range to their closest ASCII equivalents, by
+    normalising the strings, removing any combining characters, and applying the given
+    replacements in the order they were added, as each replacement may match the text
+    produced by those before it. Runs of single character replacements are compiled into
+    str.translate() tables, so that they are applied in a single pass. Strings that only
+    hold ASCII characters are not normalised, and where none of the replacements produce
+    non-ASCII text, only the replacements of ASCII search strings are applied to them.
+
+    The replacements dictionary is held by reference, so after modifying it compile()
+    must be called, or the replacement added via add(), which does this automatically.
+    """
+
+    _replacements: dict[str, str] = None
+    _steps: list[dict[int, str | None] | tuple[str, str]] = None
+    _ascii: list[tuple[str, str]] = None
+    _generation: int = 0
+
+    def __init__(self, replacements: dict[str, str]):
+        if not isinstance(replacements, dict):
+            raise TypeError("The 'replacements' argument must have a dictionary value!")
+
+        self._replacements: dict[str, str] = replacements
+
+        self.compile()
+
+    @property
+    def replacements(self) -> dict[str, str]:
+        return self._replacements
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the compiled replacements, which is incremented each
+        time the replacements are compiled, so that cached transliterations of strings
+        can be identified as being stale if the replacements have since changed."""
+
+        return self._generation
+
+    def add(self, search: str, replacement: str):
+        """Add the specified replacement, recompiling the transliteration table."""
+
+        if not isinstance(search, str):
+            raise TypeError("The 'search' argument must have a string value!")
+
+        if not isinstance(replacement, str):
+            raise TypeError("The 'replacement' argument must have a string value!")
+
+        self._replacements[search] = replacement
+
+        self.compile()
+
+    def compile(self):
+        """Compile the replacements into the steps that apply them, which produce the same
+        result as applying each of the replacements in turn in the order they were added.
+        Successive single character replacements share a str.translate() table, unless an
+        earlier replacement in the table produces a character that a later one replaces,
+        while longer search strings are applied in turn via str.replace(). The first run
+        of single character replacements shares the table that removes the combining
+        characters, unless the search character is itself a combining character, which
+        can only match the text produced by an earlier replacement."""
+
+        steps: list[dict[int, str | None] | tuple[str, str]] = [Table()]
+
+        # The characters produced by the replacements held in the current table
+        produced: set[str] = set()
+
+        for search, replacement in self._replacements.items():
+            if not len(search) == 1:
+                steps.append((search, replacement))
+            elif (
+                not isinstance(table := steps[-1], dict)
+                or search in produced
+                or (table is steps[0] and unicodedata.combining(search))
+            ):
+                steps.append({ord(search): replacement})
+
+                produced = set(replacement)
+            else:
+                table[ord(search)] = replacement
+
+                produced.update(replacement)
+
+        self._steps = steps
+
+        # Only ASCII search strings can match ASCII strings, unless a replacement produces
+        # non-ASCII text, in which case each of the replacements must be applied in turn
+        if all(replacement.isascii() for replacement in self._replacements.values()):
+            self._ascii = [
+                (search, replacement)
+                for search, replacement in self._replacements.items()
+                if search.isascii()
+            ]
+        else:
+            self._ascii = list(self._replacements.items())
+
+        self._generation += 1
+
+    def transliterate(self, value: str) -> str:
+        """Transliterate the provided string, returning its ASCII equivalent where the
+        string's characters can be normalised or replaced, and otherwise retaining the
+        characters, so that they can be handled as needed when the string is encoded."""
+
+        if not isinstance(value, str):
+            raise TypeError("The 'value' argument must have a string value!")
+
+        if value.isascii():
+            for search, replacement in self._ascii:
+                value = value.replace(search, replacement)
+
+            return value
+
+        # Normalise non-ASCII characters where possible to their closest ASCII equivalents
+        # and remove the combining characters from the expanded form, such as diacritics,
+        # while applying the first run of single character replacements via the table
+        value = unicodedata.normalize("NFKD", value)
+
+        for step in self._steps:
+            if isinstance(step, dict):
+                value = value.translate(step)
+            else:
+                value = value.replace(*step)
+
+        return value
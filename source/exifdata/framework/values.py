@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import typing
+
+from exifdata.logging import logger
+
+from caselessly import (
+    caselessdict,
+)
+
+
+logger = logger.getChild(__name__)
+
+
+class Values(caselessdict):
+    """The Values class holds the values assigned to a metadata model's fields, keyed by
+    the field identifiers, and supports values whose decoding has been deferred, so that
+    a decoded payload's values are only decoded when they are first accessed. Deferred
+    values hold their place in the insertion order, so iteration order is unaffected."""
+
+    _deferred: dict[str, typing.Callable[[], object]] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._deferred: dict[str, typing.Callable[[], object]] = {}
+        self._clean: set[str] = set()
+
+    def __getitem__(self, key: object) -> object:
+        if self._deferred and (
+            loader := self._deferred.pop(
+                key.casefold() if isinstance(key, str) else key, None
+            )
+        ):
+            value: object = loader()
+
+            super().__setitem__(key, value)
+
+            return value
+
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: object, value: object):
+        if self._deferred:
+            self._deferred.pop(key.casefold() if isinstance(key, str) else key, None)
+
+        if self._clean:
+            self._clean.discard(key.casefold() if isinstance(key, str) else key)
+
+        if key in self:
+            # Ensure that the key is stored using its original case
+            key = self._keymap[key.casefold() if isinstance(key, str) else key]
+
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: object):
+        if self._deferred:
+            self._deferred.pop(key.casefold() if isinstance(key, str) else key, None)
+
+        if self._clean:
+            self._clean.discard(key.casefold() if isinstance(key, str) else key)
+
+        super().__delitem__(key)
+
+    def defer(self, key: str, loader: typing.Callable[[], object]):
+        """Defer the decoding of the value for the specified key until it is accessed,
+        at which point the loader will be called to obtain the decoded value."""
+
+        if not isinstance(key, str):
+            raise TypeError("The 'key' argument must have a string value!")
+
+        if not callable(loader):
+            raise TypeError("The 'loader' argument must reference a callable!")
+
+        # Reserve the key so it is counted and holds its place in the insertion order
+        self.__setitem__(key, None)
+
+        self._deferred[key.casefold()] = loader
+
+    def deferred(self, key: str) -> bool:
+        """Determine if the value for the specified key has been deferred."""
+
+        return (key.casefold() if isinstance(key, str) else key) in self._deferred
+
+    def clean(self, key: str):
+        """Mark the value for the specified key as clean, until it is next assigned."""
+
+        if not isinstance(key, str):
+            raise TypeError("The 'key' argument must have a string value!")
+
+        if not key in self:
+            raise KeyError(f"The '{key}' key does not have an assigned value!")
+
+        self._clean.add(key.casefold())
+
+    def dirty(self, key: str) -> bool:
+        """Determine if the value for the specified key has been assigned or deleted
+        since it was last marked as clean, or has never been marked as clean."""
+
+        return not (key.casefold() if isinstance(key, str) else key) in self._clean
+
+    def resolve(self) -> Values:
+        """Resolve any deferred values, so that every value has been decoded."""
+
+        for key in list(dict.keys(self)):
+            if self.deferred(key):
+                self.__getitem__(key)
+
+        return self
+
+    def items(self) -> typing.ItemsView:
+        return super(Values, self.resolve()).items()
+
+    def values(self) -> typing.ValuesView:
+        return super(Values, self.resolve()).values()
@@ -6,6 +6,7 @@ from exifdata.framework import (
     Field,
     Value,
     Metadata,
+    Schema,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "Field",
     "Value",
     "Metadata",
+    "Schema",
 ]
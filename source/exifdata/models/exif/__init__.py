@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import os
-import json
 import io
+import struct
+import mmap
+import functools
 
 from exifdata.logging import logger
 
 from exifdata.framework import (
     Metadata,
     Namespace,
+    Schema,
     Structure,
     Value,
     Type,
@@ -33,13 +36,16 @@ from exifdata.models.exif.types import (
     RationalSigned,
     Float,
     Double,
+    Long8,
+    LongSigned8,
     UTF8,
     String,
 )
 
 from exifdata.models.exif.structures import (
     IFD,
-    IFDTag,
+    Directory,
+    MakerNote,
 )
 
 from deliciousbytes import (
@@ -58,6 +64,21 @@ class EXIF(Metadata):
     _encodings: list[str] = ["UTF-8", "Unicode", "ASCII"]
     _types: dict[str, type] = {}
     _setup: bool = False
+    _app1prefix: bytes = b"Exif\x00\x00"
+    _pointers: frozenset[int] = frozenset(
+        directory.pointer for directory in Directory.tree().values() if directory.parent
+    )
+    # The tag types that pointer tags may use to hold the offsets of their IFDs
+    _pointertypes: frozenset[int] = frozenset(
+        tagtype.value
+        for tagtype in (TagType.Long, TagType.IFD, TagType.Long8, TagType.IFD8)
+    )
+    _resolutions: dict[tuple[str, int], tuple[Namespace, Field] | None] = {}
+    _payload: memoryview = None
+    _order: ByteOrder = None
+    _big: bool = False
+    _makernote: MakerNote = None
+    _ifds: dict[str, Directory] = None
 
     def __new__(cls):
         """Initialize the model's namespaces from the schema configuration file once."""
@@ -66,11 +87,19 @@ class EXIF(Metadata):
         if cls._setup is True:
             return super().__new__(cls)
 
-        with open(
-            os.path.join(os.path.dirname(__file__), "data", "schema.json"), "r"
-        ) as handle:
+        schema = Schema(
+            filepath=os.path.join(os.path.dirname(__file__), "data", "schema.json")
+        )
+
+        # If a precompiled copy of the schema is available, restore the namespaces,
+        # structures and aliases from it rather than rebuilding them from the schema:
+        if isinstance(cached := schema.load(), dict):
+            cls._namespaces = cached["namespaces"]
+            cls._structures = cached["structures"]
+            cls._aliases = cached["aliases"]
+        else:
             # Ensure the model configuration file is valid
-            if not isinstance(namespacesdata := json.load(handle), dict):
+            if not isinstance(namespacesdata := schema.parse(), dict):
                 raise TypeError("The EXIF schema.json dictionary isn't valid!")
 
             # Dynamically create the model namespaces based on the provided configuration
@@ -104,46 +133,84 @@ class EXIF(Metadata):
                         **namespacedata,
                     )
 
-                    # Now iterate over the fields and add them to the relevant namespace
-                    for fieldid, fielddata in fieldsdata.items():
-                        namespace.field = field = Field(
-                            namespace=namespace,
-                            identifier=fieldid,
-                            **fielddata,
-                        )
+                    # Defer the creation of the fields until the namespace is first used
+                    namespace.defer(Field, fieldsdata)
 
-                        # If the namespace has been marked for unwrapping, make its fields
-                        # available on the top-level metadata object as well as through the
-                        # namespace object itself, via its field name and any aliases:
-                        if namespace.unwrap is True:
-                            if field.name in cls._aliases:
+                    # If the namespace has been marked for unwrapping, make its fields
+                    # available on the top-level metadata object as well as through the
+                    # namespace object itself, via its field name and any aliases:
+                    if namespace.unwrap is True:
+                        for fieldid, fielddata in fieldsdata.items():
+                            if (name := fielddata.get("name")) in cls._aliases:
                                 raise KeyError(
-                                    f"The field alias, '{field.name}', has already been used!"
+                                    f"The field alias, '{name}', has already been used!"
                                 )
 
-                            cls._aliases[field.name] = f"{namespace.id}:{field.name}"
+                            cls._aliases[name] = f"{namespace.id}:{name}"
+
+                            if isinstance(aliases := fielddata.get("alias"), str):
+                                aliases = [aliases]
 
-                            for alias in field.aliases:
+                            for alias in aliases or []:
                                 if alias in cls._aliases:
                                     raise KeyError(
                                         f"The field alias, '{alias}', has already been used!"
                                     )
 
-                                cls._aliases[alias] = f"{namespace.id}:{field.name}"
+                                cls._aliases[alias] = f"{namespace.id}:{name}"
+
+            schema.save(
+                namespaces=cls._namespaces,
+                structures=cls._structures,
+                aliases=cls._aliases,
+            )
 
         cls._setup = True
 
         return super().__new__(cls)
 
-    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes | None:
+    def encode(self, order: ByteOrder = None, big: bool = None) -> bytes | None:
         """Provides support for encoding the assigned EXIF metadata field values into
-        the binary representation needed for embedding into an image file."""
-
-        encoded: bytearray = bytearray()
+        the binary representation needed for embedding into an image file. The values
+        are routed to IFD0, the EXIF IFD or the GPS IFD by their tag IDs, and the IFDs
+        are laid out in a single pass: the size of each IFD and of its out-of-line data
+        area is computed up front, so the offsets of the IFDs, which are recorded by the
+        pointer tags in IFD0, and of each value are known before any bytes are written,
+        and the TIFF structure is then written into a single preallocated buffer, with
+        each IFD and out-of-line value beginning on a word boundary. The encoded value
+        is an APP1 payload, beginning with the "Exif" prefix, followed by the TIFF header
+        which records the specified byte order, followed by IFD0 and the other IFDs.
+
+        If 'order' is not specified, the byte order of the decoded payload is retained,
+        so that the values and MakerNote can be copied without being byte-swapped, or
+        big-endian byte order is used for new models.
+
+        If 'big' is True, the BigTIFF structure is used, with 64-bit counts and offsets,
+        as needed for TIFF files larger than 4GB; by default the structure of the decoded
+        payload is retained, or the classic TIFF structure is used for new models.
+
+        The IFD1 of a decoded payload, which describes its JPEG thumbnail, is passed
+        through, linked via the next offset of IFD0, with the thumbnail written after the
+        IFDs, and the JPEGInterchangeFormat tag patched to record its new offset.
+
+        The MakerNote of a decoded payload is passed through as an opaque slice of the
+        payload, unless it has been reassigned; it is pinned at its original offset if
+        the byte order and structure are unchanged, so that the absolute offsets held by
+        some vendors' MakerNotes remain valid, and otherwise it is placed after the IFDs
+        and the offsets of the known absolute-offset MakerNote layouts are patched."""
+
+        if order is None:
+            order = self._order or ByteOrder.MSB
+        elif not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument, if specified, must reference a ByteOrder enumeration option!"
+            )
 
-        if not isinstance(order, ByteOrder):
+        if big is None:
+            big = self._big
+        elif not isinstance(big, bool):
             raise TypeError(
-                "The 'order' argument must reference a ByteOrder enumeration option!"
+                "The 'big' argument, if specified, must have a boolean value!"
             )
 
         if len(self._values) == 0:
@@ -152,69 +219,731 @@ class EXIF(Metadata):
             )
             return None
 
-        ifd = IFD()
-
-        for namespace in self._namespaces.values():
-            for identifier, field in namespace._fields.items():
-                if isinstance(value := self._values.get(field.identifier), Value):
-                    count: int = len(value) if isinstance(value, list) else 1
-
-                    if field.multiple is True and not count in field.count:
-                        raise ValueError(
-                            "The value count (%d) does not match one of the field counts (%s) for %s!"
-                            % (
-                                count,
-                                field.count,
-                                field.identifier,
-                            )
-                        )
+        if (layout := self._layout(order=order, big=big)) is None:
+            return None
 
-                    data: bytearray = bytearray()
+        (directories, offsets, length, makernote, thumbnail) = layout
 
-                    if isinstance(value, list):
-                        for value in value:
-                            data += value.encode(order=order)
-                    else:
-                        data += value.encode(order=order)
+        # The pointer tags hold Long offsets, or IFD8 offsets for BigTIFF
+        (pointer, packing) = (
+            (TagType.IFD8.value, "Q") if big else (TagType.Long.value, "I")
+        )
 
-                    ifd.tag = IFDTag(
-                        id=field.tagid,
-                        type=TagType.reconcile(value.type).value,
-                        count=count,
-                        data=bytes(data),
+        if "MakerNote" in offsets:
+            directories["EXIF"].tags[0x927C] = (
+                0x927C,
+                TagType.Undefined.value,
+                len(makernote),
+                struct.pack(IFD._orders[order] + packing, offsets["MakerNote"]),
+            )
+
+        if "Thumbnail" in offsets:
+            directories["IFD1"].tags[0x0201] = (
+                0x0201,
+                TagType.Long8.value if big else TagType.Long.value,
+                1,
+                struct.pack(IFD._orders[order] + packing, offsets["Thumbnail"]),
+            )
+
+        for name in offsets:
+            if name in directories and (parent := directories[name].parent):
+                parent.tags[directories[name].pointer] = (
+                    directories[name].pointer,
+                    pointer,
+                    1,
+                    struct.pack(IFD._orders[order] + packing, offsets[name]),
+                )
+
+        prefix: int = len(self._app1prefix)
+
+        encoded: bytearray = bytearray(prefix + length)
+
+        encoded[0:prefix] = self._app1prefix
+
+        # The offsets recorded within the TIFF structure are relative to its header
+        buffer: memoryview = memoryview(encoded)[prefix:]
+
+        IFD.pack_header_into(buffer, order, offsets["IFD0"], big=big)
+
+        if "MakerNote" in offsets:
+            offset = offsets.pop("MakerNote")
+
+            buffer[offset : offset + len(makernote)] = makernote.relocate(offset)
+
+        if "Thumbnail" in offsets:
+            offset = offsets.pop("Thumbnail")
+
+            buffer[offset : offset + len(thumbnail)] = thumbnail
+
+        for name, offset in offsets.items():
+            # The TIFF specification requires the tags to be sorted by tag ID
+            tags: list[tuple[int, int, int, bytes]] = [
+                directories[name].tags[tagid]
+                for tagid in sorted(directories[name].tags)
+            ]
+
+            # IFD1 is linked from IFD0 via its next offset, rather than by a pointer tag
+            following: int = offsets.get("IFD1", 0) if name == "IFD0" else 0
+
+            IFD.pack_into(buffer, offset, tags, order=order, next=following, big=big)
+
+        buffer.release()
+
+        return bytes(encoded)
+
+    def encoded_size(self, order: ByteOrder = None, big: bool = None) -> int:
+        """Compute the exact length in bytes of the APP1 payload that encode() would
+        produce for the same arguments, including the "Exif" prefix, by laying out the
+        IFDs without packing the numeric values or assembling the payload, so that EXIF
+        metadata that would exceed the 65,533 byte limit of a JPEG APP1 segment can be
+        identified before encoding; if there is nothing to encode, 0 is returned."""
+
+        if order is None:
+            order = self._order or ByteOrder.MSB
+        elif not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument, if specified, must reference a ByteOrder enumeration option!"
+            )
+
+        if big is None:
+            big = self._big
+        elif not isinstance(big, bool):
+            raise TypeError(
+                "The 'big' argument, if specified, must have a boolean value!"
+            )
+
+        if len(self._values) == 0:
+            return 0
+
+        if (layout := self._layout(order=order, big=big, measure=True)) is None:
+            return 0
+
+        return len(self._app1prefix) + layout[2]
+
+    def _layout(self, order: ByteOrder, big: bool, measure: bool = False) -> (
+        tuple[
+            dict[str, Directory],
+            dict[str, int],
+            int,
+            MakerNote | None,
+            memoryview | None,
+        ]
+        | None
+    ):
+        """Route the assigned values to their IFDs and lay out the IFDs, returning the
+        directories holding the tags of each IFD, the offset of each IFD and of any
+        passed through MakerNote and thumbnail, the length of the TIFF structure, the
+        MakerNote and the thumbnail, or None if no IFDs hold any tags. The pointer tags,
+        the MakerNote tag and the JPEGInterchangeFormat tag hold placeholder values,
+        which are patched once the offsets are known. Only the fields that have been
+        assigned values are visited, so the other namespaces are not materialized. If
+        'measure' is True, the tags of numeric values hold the length of their data
+        rather than the packed data, as only the layout of the IFDs is needed."""
+
+        directories: dict[str, Directory] = Directory.tree()
+
+        # The pointer tags hold Long offsets, or IFD8 offsets for BigTIFF
+        (pointer, packing) = (
+            (TagType.IFD8.value, "Q") if big else (TagType.Long.value, "I")
+        )
+
+        # A decoded MakerNote that has not been reassigned is passed through as is, and
+        # is written outside of the IFDs' data areas, so that it can be pinned at its
+        # original offset, or placed after the IFDs and have its offsets patched
+        makernote: MakerNote = None
+
+        for identifier in list(self._values.keys()):
+            if not (result := self._lookup(property="id", value=identifier)):
+                continue
+
+            (namespace, field) = result
+
+            # The pointer tags are recomputed below from the layout of the IFDs
+            if field.tagid in self._pointers:
+                continue
+
+            if (directory := directories.get(field.ifd)) is None:
+                raise ValueError(
+                    "The IFD (%s) of the %s field is not supported!"
+                    % (field.ifd, field.identifier)
+                )
+
+            if (
+                field.tagid == 0x927C
+                and self._makernote
+                and len(self._makernote) > struct.calcsize(packing)
+                and not self._values.dirty(field.identifier)
+            ):
+                makernote = self._makernote
+
+                # The MakerNote's offset is patched once the layout is known
+                directory.tags[field.tagid] = (
+                    field.tagid,
+                    TagType.Undefined.value,
+                    len(makernote),
+                    bytes(struct.calcsize(packing)),
+                )
+
+                continue
+
+            if isinstance(value := self._values.get(field.identifier), list):
+                values: list[Value] = value
+            elif isinstance(value, Value):
+                values: list[Value] = [value]
+            else:
+                continue
+
+            count: int = len(values)
+
+            if field.multiple is True and not count in field.count:
+                raise ValueError(
+                    "The value count (%d) does not match one of the field counts (%s) for %s!"
+                    % (
+                        count,
+                        field.count,
+                        field.identifier,
                     )
+                )
+
+            tagtype: TagType = TagType.reconcile(values[0].type)
+
+            if (format := IFD._formats[tagtype.value][0]) == "s":
+                data: bytes = b"".join(value.encode(order=order) for value in values)
+
+                # The count of byte-string values is their length, including any NUL
+                count = len(data)
+
+                if measure is True:
+                    data: int = count
+            elif measure is True:
+                # Numeric values are measured from their count, rather than packed
+                data: int = count * IFD._formats[tagtype.value][1]
+            elif len(format) == 2:
+                data: bytes = IFD.pack(
+                    tagtype,
+                    [
+                        (int(value.numerator), int(value.denominator))
+                        for value in values
+                    ],
+                    order=order,
+                )
+            elif format in ("f", "d"):
+                data: bytes = IFD.pack(tagtype, values, order=order)
+            else:
+                data: bytes = IFD.pack(
+                    tagtype, [int(value) for value in values], order=order
+                )
+
+            directory.tags[field.tagid] = (field.tagid, tagtype.value, count, data)
+
+        # The IFD1 of a decoded payload is passed through, along with its thumbnail
+        thumbnail: memoryview = self._passthrough(
+            directories["IFD1"], order=order, big=big
+        )
 
-        encoded += ifd.encode()
+        # Add the pointer tags for the child IFDs that hold any tags to their parents,
+        # working from the leaves of the tree so that a parent IFD holding no tags of
+        # its own is still emitted if it is needed to link to its child; the pointer
+        # values fit inline, and are patched once the offsets of the IFDs are known,
+        # which does not affect the sizes of the parent IFDs
+        for directory in reversed(list(directories["IFD0"].walk())):
+            if directory.tags and directory.parent:
+                directory.parent.tags[directory.pointer] = (
+                    directory.pointer,
+                    pointer,
+                    1,
+                    bytes(struct.calcsize(packing)),
+                )
+
+        offsets: dict[str, int] = {}
+
+        # The first IFD follows the TIFF header, of eight bytes, or sixteen for BigTIFF
+        header: int = 16 if big else 8
+
+        offset: int = header
+
+        # The MakerNote is pinned at its original offset, if the TIFF structure matches
+        # that of the payload it was decoded from, so that any absolute offsets it holds
+        # remain valid, in which case the IFDs are laid out around it
+        pinned: bool = (
+            makernote is not None
+            and makernote.order is order
+            and big is self._big
+            and makernote.offset >= header
+        )
+
+        for name, directory in directories.items():
+            if len(directory.tags) == 0:
+                continue
+
+            size: int = IFD.size(directory.tags.values(), big=big)
+
+            if pinned and offset < makernote.offset + len(makernote):
+                if offset + size > makernote.offset:
+                    offset = makernote.offset + len(makernote)
+                    offset += offset % 2
+
+            offsets[name] = offset
+
+            offset += size
+
+        if len(offsets) == 0:
+            return None
+
+        if makernote is None:
+            pass
+        elif pinned:
+            offsets["MakerNote"] = makernote.offset
+
+            offset = max(offset, makernote.offset + len(makernote))
+        else:
+            if not makernote.order is order:
+                logger.warning(
+                    "%s.encode() The MakerNote was decoded from a payload of a different byte order, so its values may not be decoded correctly!",
+                    self.__class__.__name__,
+                )
+
+            offsets["MakerNote"] = offset
+
+            offset += len(makernote) + len(makernote) % 2
+
+        # The thumbnail is placed after the IFDs, and its offset patched into IFD1
+        if thumbnail is not None and "IFD1" in offsets:
+            offsets["Thumbnail"] = offset
+
+            offset += len(thumbnail) + len(thumbnail) % 2
+
+        return (directories, offsets, offset, makernote, thumbnail)
 
-        return bytes(encoded) if len(encoded) > 0 else None
+    def _passthrough(
+        self, directory: Directory, order: ByteOrder, big: bool
+    ) -> memoryview | None:
+        """Copy the tags of the decoded payload's IFD1 into the provided directory, so
+        that IFD1 and the JPEG thumbnail it describes are retained when the model is
+        encoded, returning the thumbnail; the values are repacked in the specified byte
+        order, while the JPEGInterchangeFormat tag holds a placeholder until the offset
+        of the thumbnail is known. Thumbnails held in strips or tiles are not retained,
+        as the offsets of their strips or tiles would need to be patched."""
+
+        if self._payload is None or not (decoded := (self._ifds or {}).get("IFD1")):
+            return None
+
+        if 0x0111 in decoded.tags or 0x0144 in decoded.tags:
+            logger.warning(
+                "%s.encode() The IFD1 thumbnail is held in strips or tiles, so it cannot be retained!",
+                self.__class__.__name__,
+            )
+            return None
+
+        if (thumbnail := self.thumbnail) is None:
+            logger.warning(
+                "%s.encode() The IFD1 thumbnail could not be located, so it cannot be retained!",
+                self.__class__.__name__,
+            )
+            return None
+
+        for tagid, type, count, offset in decoded.tags.values():
+            if tagid == 0x0201:
+                data: bytes = bytes(8 if big else 4)
+                type: int = TagType.Long8.value if big else TagType.Long.value
+                count: int = 1
+            elif not type in IFD._formats:
+                logger.debug(
+                    "%s.encode() Skipping IFD1 tag 0x%04x of unknown type %d",
+                    self.__class__.__name__,
+                    tagid,
+                    type,
+                )
+                continue
+            elif isinstance(
+                value := IFD.unpack(self._payload, type, count, offset, self._order),
+                bytes,
+            ):
+                data: bytes = value
+            else:
+                data: bytes = IFD.pack(TagType.reconcile(type), value, order=order)
+
+            directory.tags[tagid] = (tagid, type, count, data)
+
+        return thumbnail
 
     @classmethod
     def decode(
         cls,
-        value: bytes | io.BytesIO,
-        order: ByteOrder = ByteOrder.MSB,
-    ) -> EXIF:
+        value: bytes | bytearray | memoryview | io.BytesIO | mmap.mmap,
+        order: ByteOrder = None,
+        ifds: list[str] = None,
+    ) -> EXIF | None:
         """Provides support for decoding the provided EXIF metadata payload into its
-        corresponding EXIF metadata fields which can then be accessed for use."""
+        corresponding EXIF metadata fields which can then be accessed for use. The
+        payload may be an APP1 payload, beginning with the "Exif" prefix, or the TIFF
+        structure itself. The payload is accessed through a memoryview, and only the
+        IFDs are scanned, recording the type, count and offset of each tag's value, so
+        that each value is only decoded from the payload when it is first accessed;
+        until then, the model holds a reference to the payload.
+
+        The IFDs are walked from IFD0 to the EXIF, GPS and Interoperability IFDs via
+        their pointer tags, and on to IFD1, forming a tree of directories whose tags
+        are keyed by tag ID. The byte order is determined from the TIFF header, so the
+        'order' argument, if specified, is only used as a hint. The tags of each IFD
+        are mapped to the fields whose schema definitions place them in that IFD, as
+        the tag IDs of some IFDs, such as the GPS and Interoperability IFDs, overlap.
+
+        If a list of IFD names is specified via the 'ifds' argument, only IFD0 and the
+        named IFDs, along with any IFDs needed to reach them, are scanned, so decoders
+        that do not need the GPS IFD, for example, can skip it entirely."""
+
+        value = cls._buffer(value)
 
         logger.debug(
-            "%s.decode(value: %d, format: %s, order: %s)",
+            "%s.decode(value: %d, order: %s, ifds: %s)",
             cls.__name__,
             len(value),
-            format,
             order,
+            ifds,
         )
 
-        if not isinstance(value, bytes):
-            value = io.BytesIO(value)
-        elif isinstance(value, io.BytesIO):
+        if order is None:
+            pass
+        elif not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument, if specified, must reference a ByteOrder enumeration option!"
+            )
+
+        directories: dict[str, Directory] = Directory.tree()
+
+        if ifds is None:
+            requested: set[str] = set(directories)
+        elif not isinstance(ifds, (list, tuple, set)):
+            raise TypeError(
+                "The 'ifds' argument, if specified, must have a list value!"
+            )
+        else:
+            requested: set[str] = set(["IFD0"])
+
+            for name in ifds:
+                if not (directory := directories.get(name)):
+                    raise ValueError(
+                        "The 'ifds' argument contains an unsupported IFD name: %s!"
+                        % (name)
+                    )
+
+                requested.add(name)
+
+                requested.update(ancestor.name for ancestor in directory.ancestors)
+
+        (order, offset, big) = IFD.header(value)
+
+        scanned: dict[str, Directory] = {}
+
+        visited: set[int] = set()
+
+        def walk(directory: Directory, offset: int) -> int:
+            """Scan the IFD if it has not already been visited, so that malformed payloads
+            holding circular IFD pointers cannot cause an endless loop."""
+
+            if offset in visited:
+                logger.warning(
+                    "%s.decode() The %s IFD offset (%d) has already been visited!",
+                    cls.__name__,
+                    directory.name,
+                    offset,
+                )
+                return 0
+
+            visited.add(offset)
+
+            (tags, next) = IFD.scan(value, offset=offset, order=order, big=big)
+
+            for tag in tags:
+                directory.tags[tag[0]] = tag
+
+            scanned[directory.name] = directory
+
+            return next
+
+        following: int = walk(directories["IFD0"], offset)
+
+        for directory in directories["IFD0"].walk():
+            if directory.parent is None or not directory.name in requested:
+                continue
+
+            # The pointer tag is held by the parent IFD, which has already been scanned
+            if not (tag := directory.parent.tags.get(directory.pointer)):
+                continue
+
+            (tagid, type, count, offset) = tag
+
+            if not (type in cls._pointertypes and count == 1):
+                continue
+
+            try:
+                walk(directory, IFD.unpack(value, type, 1, offset, order)[0])
+            except ValueError as exception:
+                logger.warning(
+                    "%s.decode() Unable to decode the %s IFD: %s",
+                    cls.__name__,
+                    directory.name,
+                    str(exception),
+                )
+
+        if following > 0 and "IFD1" in requested:
+            try:
+                walk(directories["IFD1"], following)
+            except ValueError as exception:
+                logger.warning(
+                    "%s.decode() Unable to decode the IFD1 IFD: %s",
+                    cls.__name__,
+                    str(exception),
+                )
+
+        exif: EXIF = None
+
+        for name, directory in scanned.items():
+            for tagid, type, count, offset in directory.tags.values():
+                if not (result := cls._resolve(name, tagid)):
+                    continue
+
+                (namespace, field) = result
+
+                if exif is None:
+                    exif = EXIF()
+
+                exif._values.defer(
+                    field.id,
+                    functools.partial(
+                        exif._load,
+                        field=field,
+                        tagtype=type,
+                        count=count,
+                        offset=offset,
+                    ),
+                )
+
+                namespace._utilized = True
+
+                # The MakerNote's value is held as a zero-copy slice of the payload, so
+                # that it can be passed through intact when the model is encoded
+                if name == "EXIF" and tagid == 0x927C and type == 7:
+                    exif._makernote = MakerNote(
+                        value=value[offset : offset + count],
+                        offset=offset,
+                        order=order,
+                    )
+
+                    exif._values.clean(field.id)
+
+        if not exif is None:
+            exif._payload = value
+            exif._order = order
+            exif._big = big
+            exif._ifds = scanned
+
+        return exif
+
+    @classmethod
+    def _resolve(cls, ifd: str, tagid: int) -> tuple[Namespace, Field] | None:
+        """Resolve the namespace and field for the tag ID held in the named IFD, where
+        the field's schema definition places it in that IFD; the pointer tags are not
+        resolved, as they are recomputed when encoding. Resolutions are memoized, as
+        the same tags are found in the IFDs of most payloads."""
+
+        if (key := (ifd, tagid)) in cls._resolutions:
+            return cls._resolutions[key]
+
+        # Ensure the model's namespaces have been initialized from the schema
+        cls._initialize()
+
+        resolution: tuple[Namespace, Field] = None
+
+        if result := cls.field_by_property(property="tagid", value=tagid):
+            (namespace, field) = result
+
+            if field.ifd == ifd and not tagid in cls._pointers:
+                resolution = (namespace, field)
+
+        if resolution is None:
+            logger.debug(
+                "%s._resolve() Skipping unknown tag 0x%04x in the %s IFD",
+                cls.__name__,
+                tagid,
+                ifd,
+            )
+
+        cls._resolutions[key] = resolution
+
+        return resolution
+
+    @property
+    def thumbnail(self) -> memoryview | None:
+        """Return the thumbnail image described by IFD1, typically a JPEG preview, as a
+        memoryview slice of the decoded payload, so that the thumbnail can be accessed
+        without copying it or decoding any of the model's values. If the model was not
+        decoded from a payload, or the payload does not hold a thumbnail, None is returned.
+        """
+
+        if self._payload is None or not (directory := (self._ifds or {}).get("IFD1")):
+            return None
+
+        return self._thumbnail(self._payload, directory.tags, self._order)
+
+    @property
+    def makernote(self) -> memoryview | None:
+        """Return the vendor MakerNote of the decoded payload as a memoryview slice of the
+        payload, so that it can be accessed without copying or decoding it, or None if
+        the payload did not hold a MakerNote."""
+
+        if self._makernote is None:
+            return None
+
+        return self._makernote.value
+
+    @property
+    def order(self) -> ByteOrder | None:
+        """Return the byte order of the decoded payload, as recorded by the "II" or "MM"
+        marker of its TIFF header, or None if the model was not decoded from a payload.
+        """
+
+        return self._order
+
+    @classmethod
+    def byteorder(
+        cls, value: bytes | bytearray | memoryview | io.BytesIO | mmap.mmap
+    ) -> ByteOrder | None:
+        """Determine the byte order of the provided payload from the "II" or "MM" marker
+        of its TIFF header, without scanning any of its IFDs, so that adapters can find
+        the native byte order of an image's EXIF metadata; if the payload does not hold
+        a valid TIFF header, None is returned."""
+
+        try:
+            (order, offset, big) = IFD.header(cls._buffer(value))
+        except ValueError:
+            return None
+
+        return order
+
+    @classmethod
+    def extract_thumbnail(
+        cls, value: bytes | bytearray | memoryview | io.BytesIO | mmap.mmap
+    ) -> memoryview | None:
+        """Extract the thumbnail image described by IFD1 from the provided payload as a
+        memoryview slice of the payload, without creating a model; only IFD0 is scanned,
+        to find the offset of IFD1, and IFD1 itself, so no other IFDs or tag values need
+        to be decoded. If the payload does not hold a thumbnail, None is returned."""
+
+        value = cls._buffer(value)
+
+        (order, offset, big) = IFD.header(value)
+
+        (tags, following) = IFD.scan(value, offset=offset, order=order, big=big)
+
+        if following == 0 or following == offset:
+            return None
+
+        (tags, following) = IFD.scan(value, offset=following, order=order, big=big)
+
+        return cls._thumbnail(value, {tag[0]: tag for tag in tags}, order)
+
+    @classmethod
+    def _buffer(
+        cls, value: bytes | bytearray | memoryview | io.BytesIO | mmap.mmap
+    ) -> memoryview:
+        """Return a memoryview of the provided payload's TIFF structure, skipping the
+        "Exif" prefix of APP1 payloads, without copying the payload."""
+
+        if isinstance(value, memoryview):
             pass
+        elif isinstance(value, (bytes, bytearray, mmap.mmap)):
+            value = memoryview(value)
+        elif isinstance(value, io.BytesIO):
+            value = value.getbuffer()[value.tell() :]
         else:
-            raise TypeError("The 'value' argument must have a bytes or BytesIO value!")
+            raise TypeError(
+                "The 'value' argument must have a bytes, bytearray, memoryview, io.BytesIO or mmap value!"
+            )
+
+        if not value.format == "B":
+            value = value.cast("B")
+
+        # Skip the "Exif" prefix of APP1 payloads, to reach the TIFF structure itself
+        if value[0 : len(cls._app1prefix)] == cls._app1prefix:
+            value = value[len(cls._app1prefix) :]
 
-        # TODO: Complete implementation of EXIF metadata parsing
+        return value
+
+    @classmethod
+    def _thumbnail(
+        cls,
+        value: memoryview,
+        tags: dict[int, tuple[int, int, int, int]],
+        order: ByteOrder,
+    ) -> memoryview | None:
+        """Locate the thumbnail within the payload via the JPEGInterchangeFormat and
+        JPEGInterchangeFormatLength tags of the provided scanned IFD1 tags."""
+
+        offset: int = None
+        length: int = None
+
+        if (tag := tags.get(0x0201)) and tag[1] in (3, 4, 16) and tag[2] == 1:
+            offset = IFD.unpack(value, tag[1], 1, tag[3], order)[0]
+
+        if (tag := tags.get(0x0202)) and tag[1] in (3, 4, 16) and tag[2] == 1:
+            length = IFD.unpack(value, tag[1], 1, tag[3], order)[0]
+
+        if offset is None or not length:
+            return None
+
+        if offset + length > len(value):
+            logger.warning(
+                "%s._thumbnail() The thumbnail (offset: %d, length: %d) lies outside the payload!",
+                cls.__name__,
+                offset,
+                length,
+            )
+            return None
+
+        return value[offset : offset + length]
+
+    def _load(self, field: Field, tagtype: int, count: int, offset: int) -> Value:
+        """Decode the value of a tag whose decoding was deferred, returning the value as
+        an instance of the registered EXIF value type corresponding to the tag's type,
+        or a list of instances for tags holding multiple numeric values."""
+
+        if not isinstance(
+            klass := self._types.get(TagType.reconcile(tagtype).name), type
+        ):
+            raise ValueError(
+                f"The tag type, '{tagtype}', does not map to a registered value type!"
+            )
+
+        decoded = IFD.unpack(self._payload, tagtype, count, offset, self._order)
+
+        if isinstance(decoded, bytes):
+            if issubclass(klass, (ASCII, UTF8)):
+                # The NUL terminator is included in the count of ASCII and UTF-8 values
+                decoded = decoded.rstrip(b"\x00").decode(
+                    "ASCII" if issubclass(klass, ASCII) else "UTF-8",
+                    errors="replace",
+                )
+
+            return klass(field=field, metadata=self, value=decoded)
+
+        values: list[Value] = []
+
+        for item in decoded:
+            if issubclass(klass, Rational):
+                values.append(
+                    klass(
+                        field=field,
+                        metadata=self,
+                        numerator=item[0],
+                        denominator=item[1],
+                    )
+                )
+            else:
+                values.append(klass(field=field, metadata=self, value=item))
 
-        return None
+        return values[0] if len(values) == 1 else values
 
 
 EXIF.register_types(
@@ -230,6 +959,8 @@ EXIF.register_types(
     RationalSigned,
     Float,
     Double,
+    Long8,
+    LongSigned8,
     UTF8,
     String,
 )
@@ -23,6 +23,10 @@ class TagType(enumerific.Enumeration):
     RationalSigned = 10
     Float = 11
     Double = 12
+    IFD = 13
+    Long8 = 16  # BigTIFF
+    LongSigned8 = 17  # BigTIFF
+    IFD8 = 18  # BigTIFF
     UTF8 = 129
     String = -129  # a polymorphic pseudo-type to ease working with ASCII/UTF-8 strings
 
@@ -225,6 +229,8 @@ class TagID(enumerific.Enumeration, aliased=True):
 
 
 class Tags(object):
+    _tagids: dict[int, TagID] = None
+
     tags = {
         # 4.6.3 EXIF Specific IFDs
         TagID.EXIFIFDPointer: {
@@ -1001,9 +1007,15 @@ class Tags(object):
                 "The 'tag_id' argument must have a TagID enumeration or integer value!"
             )
 
-        for tagid, info in cls.tags.items():
-            if tagid.value == tag_id:
-                return dict(info, name=tagid.name)
+        # Index the tags by their integer tag IDs once, when the index is first needed
+        if cls._tagids is None:
+            cls._tagids = {}
+
+            for tagid in cls.tags.keys():
+                cls._tagids.setdefault(tagid.value, tagid)
+
+        if not (tagid := cls._tagids.get(tag_id)) is None:
+            return dict(cls.tags[tagid], name=tagid.name)
 
 
 class ColorSpace(enumerific.Enumeration):
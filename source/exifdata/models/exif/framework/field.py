@@ -9,9 +9,17 @@ logger = logger.getChild(__name__)
 
 class Field(Field):
     _tagid: int = None
+    _ifd: str = None
     _default: object = None
 
-    def __init__(self, *args, tagid: int, default: object = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        tagid: int,
+        ifd: str = "IFD0",
+        default: object = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         if not isinstance(tagid, int):
@@ -19,12 +27,22 @@ class Field(Field):
 
         self._tagid: int = tagid
 
+        if not isinstance(ifd, str):
+            raise TypeError("The 'ifd' argument must have a string value!")
+
+        self._ifd: str = ifd
+
         self._default: object = default
 
     @property
     def tagid(self) -> int:
         return self._tagid
 
+    @property
+    def ifd(self) -> str:
+        """The name of the IFD that holds the field's tag, such as IFD0, EXIF or GPS."""
+        return self._ifd
+
     @property
     def default(self) -> object | None:
         return self._default
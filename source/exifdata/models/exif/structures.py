@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import builtins
+import struct
+import typing
+
+from exifdata.logging import logger
+
+from exifdata.models.exif.enumerations import TagType
 
 from deliciousbytes import (
     ByteOrder,
@@ -13,6 +19,9 @@ from deliciousbytes import (
 )
 
 
+logger = logger.getChild(__name__)
+
+
 class IFD(object):
     """This class represents an Image File Directory or IFD used within EXIF compatible
     image file formats such as TIFF and JPEG to hold image and metadata information.
@@ -41,24 +50,79 @@ class IFD(object):
     The tag count is stored as a short integer (UInt16) comprised of 2 bytes or 16 bits
     The tags are encoded according to the format specified for IFDTag below
     The next offset is stored as a long integer (UInt32) comprised of 4 bytes or 32 bits
+
+    BigTIFF files, which support files larger than 4GB, use the same structure, except
+    that the tag count and the next offset are stored as UInt64 values of 8 bytes each,
+    and the tags are encoded into 20 bytes each, as described for IFDTag below.
     """
 
-    _count: UInt16 = None
+    _count: UInt16 | UInt64 = None
     _tags: list[IFDTag] = None
     _next: UInt32 | UInt64 = None
+    _big: bool = False
+
+    # The struct format characters and sizes in bytes of the values of each tag type
+    _formats: dict[int, tuple[str, int]] = {
+        1: ("B", 1),  # Byte
+        2: ("s", 1),  # ASCII
+        3: ("H", 2),  # Short
+        4: ("I", 4),  # Long
+        5: ("II", 8),  # Rational
+        6: ("b", 1),  # ByteSigned
+        7: ("s", 1),  # Undefined
+        8: ("h", 2),  # ShortSigned
+        9: ("i", 4),  # LongSigned
+        10: ("ii", 8),  # RationalSigned
+        11: ("f", 4),  # Float
+        12: ("d", 8),  # Double
+        13: ("I", 4),  # IFD
+        16: ("Q", 8),  # Long8 (BigTIFF)
+        17: ("q", 8),  # LongSigned8 (BigTIFF)
+        18: ("Q", 8),  # IFD8 (BigTIFF)
+        129: ("s", 1),  # UTF8
+    }
+
+    # The struct format characters of the tag count, each tag entry's value count, and
+    # each tag entry's value or offset field, alongside the size in bytes of each tag
+    # entry, for classic TIFF IFDs and for BigTIFF IFDs, keyed by the 'big' flag
+    _layouts: dict[bool, tuple[str, str, str, int]] = {
+        False: ("H", "I", "I", 12),
+        True: ("Q", "Q", "Q", 20),
+    }
+
+    # The struct format prefixes for each of the TIFF byte orders
+    _orders: dict[ByteOrder, str] = {
+        ByteOrder.MSB: ">",
+        ByteOrder.LSB: "<",
+    }
+
+    # The precompiled struct codecs for single values of each numeric tag type in each
+    # byte order, populated once the class has been defined; the codecs for multiple
+    # values are compiled on first use and held in _multiples, keyed by count as well
+    _codecs: dict[tuple[TagType, ByteOrder], struct.Struct] = {}
+    _multiples: dict[tuple[TagType, ByteOrder, int], struct.Struct] = {}
 
     def __init__(
-        self, count: UInt16 = 0, tags: list[IFDTag] = None, next: UInt32 | UInt64 = 0
+        self,
+        count: UInt16 | UInt64 = 0,
+        tags: list[IFDTag] = None,
+        next: UInt32 | UInt64 = 0,
+        big: bool = False,
     ):
+        if not isinstance(big, bool):
+            raise TypeError("The 'big' argument must have a boolean value!")
+
+        self._big: bool = big
+
         if not isinstance(count, int):
             raise TypeError("The 'count' argument must have an integer value!")
-        elif not (0 <= count <= UInt16.MAX):
+        elif not (0 <= count <= (UInt64.MAX if big else UInt16.MAX)):
             raise TypeError(
                 "The 'count' argument must have an integer value between 1 - %d!"
-                % (UInt16.MAX)
+                % (UInt64.MAX if big else UInt16.MAX)
             )
 
-        self._count: UInt16 = UInt16(count)
+        self._count: UInt16 | UInt64 = UInt64(count) if big else UInt16(count)
 
         if tags is None:
             self._tags: list[IFDTag] = []
@@ -75,7 +139,7 @@ class IFD(object):
 
         if not isinstance(next, int):
             raise TypeError("The 'next' argument must have an integer value!")
-        elif 0 <= next <= UInt32.MAX:
+        elif 0 <= next <= UInt32.MAX and big is False:
             self._next: UInt32 = UInt32(next)
         elif 0 <= next <= UInt64.MAX:
             self._next: UInt64 = UInt64(next)
@@ -86,8 +150,13 @@ class IFD(object):
             )
 
     @property
-    def count(self) -> UInt32:
-        """Two bytes representing the number of tags that follow the IFD"""
+    def big(self) -> bool:
+        """Whether the IFD uses the BigTIFF structure, with 64-bit counts and offsets."""
+        return self._big
+
+    @property
+    def count(self) -> UInt16 | UInt64:
+        """Two bytes, or eight for BigTIFF, holding the number of tags in the IFD."""
         return self._count
 
     @property
@@ -110,6 +179,11 @@ class IFD(object):
                 "The 'tag' argument must reference an IFDTag class instance!"
             )
 
+        if not tag.big == self.big:
+            raise ValueError(
+                "The 'tag' argument must use the same TIFF structure as the IFD!"
+            )
+
         self._tags.append(tag)
         self._count += 1
 
@@ -120,24 +194,349 @@ class IFD(object):
         """Four bytes holding a possible offset to the next IFD, if an IFD follows."""
         return self._next
 
-    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
-        encoded: list[bytes] = []
+    @classmethod
+    def codec(
+        cls, type: TagType | int, order: ByteOrder, count: int = 1
+    ) -> struct.Struct:
+        """Return the precompiled struct codec for packing or unpacking the specified
+        count of values of the numeric tag type in the specified byte order, so that
+        the values of multi-count tags can be packed or unpacked in a single call; the
+        values of Rational tags comprise a numerator and denominator pair each."""
+
+        if count == 1:
+            if codec := cls._codecs.get((type, order)):
+                return codec
+        elif codec := cls._multiples.get((type, order, count)):
+            return codec
+
+        if (format := cls._formats.get(type)) is None or format[0] == "s":
+            raise ValueError(
+                "The 'type' argument must reference a numeric tag type, not %s!"
+                % (type)
+            )
+
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("The 'count' argument must have a positive integer value!")
+
+        codec = struct.Struct(
+            "%s%d%s" % (cls._orders[order], count * len(format[0]), format[0][0])
+        )
+
+        # Only hold the codecs for modest counts, as the counts of values such as the
+        # strip offsets of large images vary widely and are rarely repeated
+        if count <= 64:
+            cls._multiples[(type, order, count)] = codec
+
+        return codec
+
+    @classmethod
+    def pack(
+        cls,
+        type: TagType | int,
+        values: list[int | float | tuple[int, int]],
+        order: ByteOrder,
+    ) -> bytes:
+        """Pack the provided values of the numeric tag type in the specified byte order
+        in a single call, where the values of Rational tags are specified as tuples of
+        numerator and denominator pairs, returning the encoded bytes."""
+
+        if len(cls._formats[type][0]) == 2:
+            values = [item for pair in values for item in pair]
+
+            return cls.codec(type, order, len(values) // 2).pack(*values)
+
+        return cls.codec(type, order, len(values)).pack(*values)
+
+    @classmethod
+    def header(cls, value: memoryview) -> tuple[ByteOrder, int, bool]:
+        """Parse the TIFF header at the start of the provided buffer, which comprises
+        of the byte order marker, "II" for little-endian or "MM" for big-endian, the
+        magic number, 42 for classic TIFF or 43 for BigTIFF, and the offset of IFD0,
+        returning the byte order, the offset, and whether the structure is BigTIFF.
+        BigTIFF headers also hold the size of offsets, which must be 8, followed by a
+        reserved value of 0, before the 64-bit offset of IFD0."""
+
+        if len(value) < 8:
+            raise ValueError("The 'value' is too short to hold a TIFF header!")
+
+        if (marker := value[0:2].tobytes()) == b"MM":
+            order: ByteOrder = ByteOrder.MSB
+        elif marker == b"II":
+            order: ByteOrder = ByteOrder.LSB
+        else:
+            raise ValueError(
+                "The 'value' does not begin with a valid TIFF byte order marker!"
+            )
+
+        prefix: str = cls._orders[order]
+
+        (magic,) = struct.unpack_from(prefix + "H", value, 2)
+
+        if magic == 42:
+            (offset,) = struct.unpack_from(prefix + "I", value, 4)
+
+            return (order, offset, False)
+        elif not magic == 43:
+            raise ValueError(
+                "The 'value' does not hold the expected TIFF magic number, 42 or 43, but rather: %d!"
+                % (magic)
+            )
+
+        if len(value) < 16:
+            raise ValueError("The 'value' is too short to hold a BigTIFF header!")
+
+        (size, reserved, offset) = struct.unpack_from(prefix + "HHQ", value, 4)
+
+        if not (size == 8 and reserved == 0):
+            raise ValueError(
+                "The 'value' does not hold a valid BigTIFF header; the offset size must be 8, not %d!"
+                % (size)
+            )
+
+        return (order, offset, True)
+
+    @classmethod
+    def pack_header_into(
+        cls,
+        buffer: bytearray | memoryview,
+        order: ByteOrder,
+        offset: int,
+        big: bool = False,
+    ) -> int:
+        """Write the TIFF header, or the BigTIFF header, into the start of the buffer for
+        the specified byte order and offset of IFD0, returning the size of the header.
+        """
+
+        buffer[0:2] = b"MM" if order is ByteOrder.MSB else b"II"
+
+        if big is True:
+            struct.pack_into(cls._orders[order] + "HHHQ", buffer, 2, 43, 8, 0, offset)
+
+            return 16
+
+        struct.pack_into(cls._orders[order] + "HI", buffer, 2, 42, offset)
+
+        return 8
+
+    @classmethod
+    def scan(
+        cls, value: memoryview, offset: int, order: ByteOrder, big: bool = False
+    ) -> tuple[list[tuple[int, int, int, int]], int]:
+        """Scan the IFD held at the specified offset within the provided TIFF buffer,
+        without decoding its tag values, returning a list holding the tag ID, tag type,
+        value count, and the offset of the value within the buffer, for each of the
+        IFD's tags, alongside the offset of the next IFD, or 0 if no IFD follows. Values
+        of four bytes or fewer, or eight for BigTIFF, are held inline within the tag, so
+        their offset is that of the tag's value field; tags of unknown types or whose
+        values lie outside the buffer are skipped."""
+
+        prefix: str = cls._orders[order]
+
+        (counter, quantity, field, size) = cls._layouts[big]
+
+        inline: int = struct.calcsize(field)
+
+        end: int = len(value)
+
+        if offset + struct.calcsize(counter) > end:
+            raise ValueError(
+                "The IFD offset (%d) lies outside of the TIFF data!" % (offset)
+            )
+
+        (count,) = struct.unpack_from(prefix + counter, value, offset)
+
+        start: int = offset
+
+        offset += struct.calcsize(counter)
+
+        if offset + count * size + inline > end:
+            raise ValueError(
+                "The IFD at offset %d holds more tags (%d) than the TIFF data allows!"
+                % (start, count)
+            )
+
+        entry: struct.Struct = struct.Struct("%sHH%s%ds" % (prefix, quantity, inline))
+
+        pointer: struct.Struct = struct.Struct(prefix + field)
+
+        tags: list[tuple[int, int, int, int]] = []
+
+        for index in range(count):
+            (tagid, type, number, data) = entry.unpack_from(value, offset)
+
+            if (format := cls._formats.get(type)) is None:
+                logger.debug(
+                    "%s.scan() Skipping tag 0x%04x with unknown type %d",
+                    cls.__name__,
+                    tagid,
+                    type,
+                )
+            elif (length := number * format[1]) <= inline:
+                tags.append((tagid, type, number, offset + size - inline))
+            elif (location := pointer.unpack(data)[0]) + length > end:
+                logger.debug(
+                    "%s.scan() Skipping tag 0x%04x as its value lies outside the data",
+                    cls.__name__,
+                    tagid,
+                )
+            else:
+                tags.append((tagid, type, number, location))
+
+            offset += size
+
+        (next,) = pointer.unpack_from(value, offset)
+
+        return (tags, next)
+
+    @classmethod
+    def unpack(
+        cls,
+        value: memoryview,
+        type: int,
+        count: int,
+        offset: int,
+        order: ByteOrder,
+    ) -> bytes | tuple[int | float | tuple[int, int]]:
+        """Unpack the value of a tag of the specified type and count held at the offset
+        within the provided TIFF buffer, as located by the scan() method. The values of
+        ASCII, UTF-8 and Undefined tags are returned as bytes, the values of Rational
+        tags as tuples of numerator and denominator pairs, and all other values as tuples
+        of integers or floats, holding the specified count of values."""
+
+        (format, size) = cls._formats[type]
+
+        if format == "s":
+            return value[offset : offset + count].tobytes()
+
+        values: tuple = cls.codec(type, order, count).unpack_from(value, offset)
+
+        if len(format) == 2:
+            return tuple(zip(values[0::2], values[1::2]))
+
+        return values
+
+    @classmethod
+    def size(
+        cls, tags: list[tuple[int, int, int, bytes | int]], big: bool = False
+    ) -> int:
+        """Calculate the number of bytes needed to hold an IFD holding the provided tags,
+        each specified as a tuple of the tag ID, tag type, value count and the encoded
+        value, or its length in bytes, including the out-of-line data area following the
+        IFD, which holds each of the values longer than four bytes, or eight for BigTIFF,
+        each padded to begin on a word boundary."""
+
+        (counter, quantity, field, entry) = cls._layouts[big]
+
+        inline: int = struct.calcsize(field)
+
+        size: int = struct.calcsize(counter) + len(tags) * entry + inline
+
+        for tagid, type, count, data in tags:
+            if (length := data if isinstance(data, int) else len(data)) > inline:
+                size += length + (length % 2)
 
-        # Assemble the bytes that represent the IFD metadata and data
-        encoded.append(self.count.encode(order=order))
+        return size
+
+    @classmethod
+    def pack_into(
+        cls,
+        buffer: bytearray | memoryview,
+        offset: int,
+        tags: list[tuple[int, int, int, bytes]],
+        order: ByteOrder,
+        next: int = 0,
+        big: bool = False,
+    ) -> int:
+        """Write an IFD holding the provided tags into the buffer at the specified offset,
+        followed by its out-of-line data area, returning the offset following the IFD
+        and its data. The tags are written in the order provided, so they should already
+        be sorted by tag ID, as the TIFF specification requires. Values of four bytes or
+        fewer, or eight for BigTIFF, are held inline, left-justified within the tag's
+        value field, while longer values are written to the data area and the tag records
+        their offset; offsets are relative to the start of the buffer, which must begin
+        with the TIFF header. The buffer must be zero-filled, as padding is not written.
+        """
+
+        prefix: str = cls._orders[order]
+
+        (counter, quantity, field, entry) = cls._layouts[big]
+
+        inline: int = struct.calcsize(field)
+
+        struct.pack_into(prefix + counter, buffer, offset, len(tags))
+
+        offset += struct.calcsize(counter)
+
+        following: int = offset + len(tags) * entry + inline
+
+        header: struct.Struct = struct.Struct(prefix + "HH" + quantity)
+
+        pointer: struct.Struct = struct.Struct(prefix + field)
+
+        for tagid, type, count, data in tags:
+            header.pack_into(buffer, offset, tagid, type, count)
+
+            start: int = offset + entry - inline
+
+            if (length := data if isinstance(data, int) else len(data)) > inline:
+                pointer.pack_into(buffer, start, following)
+
+                buffer[following : following + length] = data
+
+                following += length + (length % 2)
+            else:
+                buffer[start : start + length] = data
+
+            offset += entry
+
+        pointer.pack_into(buffer, offset, next)
+
+        return following
+
+    def encode(self, order: ByteOrder = ByteOrder.MSB, offset: int = 0) -> bytes:
+        """Encode the IFD, followed by its out-of-line data area, via size() and
+        pack_into(), for the IFD being held at the specified offset within the TIFF
+        structure, so that the offsets recorded by tags whose values are longer than
+        four bytes, or eight for BigTIFF, point to where their values are written."""
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+        elif offset < 0:
+            raise ValueError("The 'offset' argument must have a positive value!")
+
+        tags: list[tuple[int, int, int, bytes]] = []
 
         for tag in self._tags:
-            encoded.append(tag.encode(order=order))
+            if not tag.big == self.big:
+                raise ValueError(
+                    "The tags must use the same TIFF structure as the IFD!"
+                )
+
+            tags.append((int(tag.id), int(tag.type), int(tag.count), bytes(tag.data)))
+
+        encoded: bytearray = bytearray(offset + self.size(tags, big=self.big))
 
-        encoded.append(self.next.encode(order=order))
+        self.pack_into(
+            encoded, offset, tags, order=order, next=int(self.next), big=self.big
+        )
 
-        return b"".join(encoded)
+        return bytes(encoded[offset:])
+
+
+# Precompile the codecs for single values of each numeric tag type in each byte order
+IFD._codecs = {
+    (tagtype, order): struct.Struct(prefix + IFD._formats[tagtype.value][0])
+    for tagtype in TagType
+    if not IFD._formats.get(tagtype.value, ("s",))[0] == "s"
+    for order, prefix in IFD._orders.items()
+}
 
 
 class IFDTag(object):
     """IFD Tag
 
-    An IFD Tag comprises of the following components, consisting of 12 bytes:
+    An IFD Tag comprises of the following components, consisting of 12 bytes, or of 20
+    bytes for BigTIFF, where the data count and data or offset fields are eight bytes:
     +---------------+-----------------------------------------------------------------+
     | Tag ID        | Two bytes holding the tag ID                                    |
     +---------------+-----------------------------------------------------------------+
@@ -151,6 +550,9 @@ class IFDTag(object):
     |               | * 7 = Undefined - 8-bit byte holding any value per field specs  |
     |               | * 9 = SLong (Signed) - 32-bit signed integer (2's compliment)   |
     |               | * 10 = SRational (Signed) - signed rational of two signed-longs |
+    |               | * 16 = Long8 - 64-bit unsigned integer (BigTIFF)                |
+    |               | * 17 = SLong8 (Signed) - 64-bit signed integer (BigTIFF)        |
+    |               | * 18 = IFD8 - 64-bit unsigned offset to an IFD (BigTIFF)        |
     |               | * 129 = UTF-8 - 8-bit byte UTF-8 string, null-terminated        |
     +---------------+-----------------------------------------------------------------+
     | Data Count    | Four or eight bytes hold the count of data values that follow   |
@@ -163,10 +565,21 @@ class IFDTag(object):
     _type: UInt16 = None
     _count: UInt32 | UInt64 = None
     _data: Bytes32 | Bytes64 = None
+    _big: bool = False
 
     def __init__(
-        self, id: UInt16, type: UInt16, count: UInt32 | UInt64, data: Bytes32 | Bytes64
+        self,
+        id: UInt16,
+        type: UInt16,
+        count: UInt32 | UInt64,
+        data: Bytes32 | Bytes64,
+        big: bool = False,
     ):
+        if not isinstance(big, bool):
+            raise TypeError("The 'big' argument must have a boolean value!")
+
+        self._big: bool = big
+
         if not isinstance(id, int):
             raise TypeError("The 'id' argument must have an integer value!")
         elif not 1 <= id <= UInt16.MAX:
@@ -195,20 +608,25 @@ class IFDTag(object):
                 "The 'count' argument must have an integer value, not %s!"
                 % (builtins.type(count))
             )
-        elif not 1 <= count <= UInt32.MAX:
+        elif not 1 <= count <= (UInt64.MAX if big else UInt32.MAX):
             raise TypeError(
                 "The 'count' argument must have an integer value between 1 - %d!"
-                % (UInt32.MAX)
+                % (UInt64.MAX if big else UInt32.MAX)
             )
 
-        self._count: UInt32 = UInt32(count)
+        self._count: UInt32 | UInt64 = UInt64(count) if big else UInt32(count)
 
         if isinstance(data, Int):
             data = data.encode(order=ByteOrder.MSB)
         elif not isinstance(data, bytes):
             raise TypeError("The 'data' argument must have a bytes value!")
 
-        self._data: bytes = Bytes32(data)
+        self._data: bytes = Bytes64(data) if big else Bytes32(data)
+
+    @property
+    def big(self) -> bool:
+        """Whether the tag uses the BigTIFF structure, with 64-bit counts and offsets."""
+        return self._big
 
     @property
     def id(self) -> UInt16:
@@ -221,33 +639,327 @@ class IFDTag(object):
         return self._type
 
     @property
-    def count(self) -> UInt32:
+    def count(self) -> UInt32 | UInt64:
         """The number of data values of the specified type that follow in the data."""
         return self._count
 
     @property
-    def data(self) -> Bytes32:
+    def data(self) -> Bytes32 | Bytes64:
         """The data value itself, if it fits in the four bytes available, or a pointer
         to the data if it won't fit, which could be to the beginning of another IFD."""
         return self._data
 
-    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
-        encoded: list[bytes] = []
+    def encode(self, order: ByteOrder = ByteOrder.MSB, offset: int = None) -> bytes:
+        """Encode the tag's entry, using the same layout as IFD.pack_into(), holding the
+        tag's data inline if it is four bytes or fewer, or eight for BigTIFF, or else the
+        specified offset of its data, which the caller must then write at that offset;
+        IFD.encode() lays out the data area for each of the IFD's tags."""
+
+        (counter, quantity, field, entry) = IFD._layouts[self.big]
+
+        prefix: str = IFD._orders[order]
+
+        data: bytes = bytes(self.data)
+
+        encoded: bytes = struct.pack(
+            prefix + "HH" + quantity, self.id, self.type, self.count
+        )
+
+        # If the data requires more than four bytes, or eight for BigTIFF, the offset to
+        # the data is recorded rather than the data; the data is stored following the IFD
+        if len(data) > (inline := struct.calcsize(field)):
+            if not isinstance(offset, int):
+                raise ValueError(
+                    "The 'offset' argument must be specified for tag 0x%04x, as its data is longer than %d bytes!"
+                    % (self.id, inline)
+                )
+
+            return encoded + struct.pack(prefix + field, offset)
+
+        # Values that fit are held left-justified within the data field
+        return encoded + data + bytes(inline - len(data))
+
+
+class Directory(object):
+    """This class represents a node in the tree of IFDs held within an EXIF payload,
+    along with the tags held by the IFD, keyed by tag ID. IFD0 is the root of the tree
+    and links to its child IFDs, the EXIF and GPS IFDs, via pointer tags whose values
+    are the offsets of the child IFDs, while the EXIF IFD in turn links to the child
+    Interoperability IFD. IFD1, which describes the thumbnail image, is not a child of
+    IFD0, but rather follows it, being linked via IFD0's next offset, so it stands as
+    the root of its own tree:
+
+    IFD0
+    ├── EXIF (via the EXIFIFDPointer tag, 0x8769)
+    │   └── Interop (via the InteroperabilityIFDPointer tag, 0xA005)
+    └── GPS (via the GPSInfoIFDPointer tag, 0x8825)
+    IFD1 (via the next offset of IFD0)
+
+    When decoding, the tags map the tag IDs to the tuples recorded by IFD.scan(), while
+    when encoding, the tags map the tag IDs to tuples of the tag ID, tag type, count and
+    encoded value, as accepted by IFD.size() and IFD.pack_into()."""
+
+    _name: str = None
+    _parent: Directory = None
+    _pointer: int = None
+    _children: dict[str, Directory] = None
+    _tags: dict[int, tuple[int, int, int, int | bytes]] = None
+
+    def __init__(self, name: str, parent: Directory = None, pointer: int = None):
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        self._name: str = name
+
+        if parent is None:
+            if not pointer is None:
+                raise ValueError(
+                    "The 'pointer' argument must not be specified for a root directory!"
+                )
+        elif not isinstance(parent, Directory):
+            raise TypeError(
+                "The 'parent' argument, if specified, must reference a Directory class instance!"
+            )
+        elif not isinstance(pointer, int):
+            raise TypeError(
+                "The 'pointer' argument must have an integer value for a child directory!"
+            )
+        else:
+            parent._children[name] = self
+
+        self._parent: Directory = parent
+        self._pointer: int = pointer
+        self._children: dict[str, Directory] = {}
+        self._tags: dict[int, tuple[int, int, int, int | bytes]] = {}
 
-        # Assemble the bytes that represent the IFDTag metadata and data
-        encoded.append(self.id.encode(order=order))  # Tag ID; Two bytes
-        encoded.append(self.type.encode(order=order))  # Data Type; Two bytes
-        encoded.append(self.count.encode(order=order))  # Data Count; Four bytes
+    def __repr__(self) -> str:
+        return "<%s(name: %s, tags: %d)>" % (
+            self.__class__.__name__,
+            self.name,
+            len(self._tags),
+        )
 
-        # Data; Four bytes, or Pointer to the data if longer than four bytes
-        encoded_data = self.data.encode(order=order, raises=False)
+    @property
+    def name(self) -> str:
+        """The name of the IFD, such as IFD0, EXIF, GPS, Interop or IFD1."""
+        return self._name
 
-        # If encoded data requires more than 4 bytes, the offset to the data is recorded
-        # rather than the data; the data is stored following the IFD
-        if len(encoded_data) > 4:
-            # TODO: Patch the location of the data later when we know the offset
-            encoded.append(UInt32(0xFFFFFFFF).encode(order=order))
-        else:
-            encoded.append(encoded_data)
+    @property
+    def parent(self) -> Directory | None:
+        """The parent directory that holds the pointer tag to this IFD, if any."""
+        return self._parent
+
+    @property
+    def pointer(self) -> int | None:
+        """The ID of the tag in the parent directory holding the offset of this IFD."""
+        return self._pointer
+
+    @property
+    def children(self) -> dict[str, Directory]:
+        """The child directories linked from this IFD via pointer tags, keyed by name."""
+        return self._children
+
+    @property
+    def tags(self) -> dict[int, tuple[int, int, int, int | bytes]]:
+        """The tags held by the IFD, keyed by tag ID."""
+        return self._tags
+
+    @property
+    def ancestors(self) -> list[Directory]:
+        """The directories between this IFD and the root of the tree, nearest first."""
+
+        ancestors: list[Directory] = []
+
+        directory: Directory = self
+
+        while directory := directory.parent:
+            ancestors.append(directory)
+
+        return ancestors
+
+    def walk(self) -> typing.Generator[Directory, None, None]:
+        """Walk the tree breadth-first from this directory, yielding each directory."""
+
+        queue: list[Directory] = [self]
+
+        for directory in queue:
+            yield directory
+
+            queue.extend(directory.children.values())
+
+    @classmethod
+    def tree(cls) -> dict[str, Directory]:
+        """Create the tree of directories, returning each of the directories by name in
+        the order they are laid out when encoding: IFD0, EXIF, GPS, Interop and IFD1."""
+
+        ifd0 = Directory("IFD0")
+        exif = Directory("EXIF", parent=ifd0, pointer=0x8769)
+
+        # The child directories are attached to their parents as they are created
+        Directory("GPS", parent=ifd0, pointer=0x8825)
+        Directory("Interop", parent=exif, pointer=0xA005)
+
+        directories: dict[str, Directory] = {
+            directory.name: directory for directory in ifd0.walk()
+        }
+
+        directories["IFD1"] = Directory("IFD1")
+
+        return directories
+
+
+class MakerNote(object):
+    """This class represents a vendor MakerNote, the value of the MakerNote tag, 0x927C,
+    held as an opaque zero-copy slice of the decoded payload, alongside the offset of the
+    value within the payload's TIFF structure, so that it can be passed through intact.
+
+    Many MakerNote layouts are themselves structured as IFDs, and while some hold their
+    offsets relative to the start of the MakerNote, or to a TIFF header embedded within
+    it, and so may be moved freely, others hold offsets relative to the start of the
+    enclosing TIFF structure, which are broken if the MakerNote is moved. When encoding,
+    the MakerNote is therefore pinned at its original offset where possible, and when it
+    must be moved, the offsets of the known absolute-offset layouts are patched; these
+    are the header-less IFD layout used by Canon, and the Sony and Panasonic layouts."""
+
+    # The signatures of the MakerNote layouts whose offsets are relative to the MakerNote
+    # itself or to an embedded TIFF header, and are thus unaffected by moving them
+    _relative: tuple[bytes] = (
+        b"Nikon\x00\x02",
+        b"OLYMPUS\x00",
+        b"OM SYSTEM\x00",
+        b"FUJIFILM",
+        b"Apple iOS\x00",
+    )
+
+    # The signatures of the MakerNote layouts whose offsets are relative to the start of
+    # the enclosing TIFF structure, and the offsets of the IFDs within the MakerNotes;
+    # MakerNotes without a signature are checked for a header-less IFD at offset zero
+    _absolute: dict[bytes, int] = {
+        b"SONY DSC \x00\x00\x00": 12,
+        b"SONY CAM \x00\x00\x00": 12,
+        b"Panasonic\x00\x00\x00": 12,
+    }
+
+    _value: memoryview = None
+    _offset: int = None
+    _order: ByteOrder = None
+
+    def __init__(self, value: memoryview, offset: int, order: ByteOrder):
+        if not isinstance(value, memoryview):
+            raise TypeError("The 'value' argument must have a memoryview value!")
+
+        self._value: memoryview = value
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        self._offset: int = offset
+
+        if not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument must reference a ByteOrder enumeration option!"
+            )
+
+        self._order: ByteOrder = order
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    @property
+    def value(self) -> memoryview:
+        """The MakerNote's value, as a slice of the payload it was decoded from."""
+        return self._value
+
+    @property
+    def offset(self) -> int:
+        """The offset of the MakerNote's value within the original TIFF structure."""
+        return self._offset
+
+    @property
+    def order(self) -> ByteOrder:
+        """The byte order of the TIFF structure the MakerNote was decoded from."""
+        return self._order
+
+    @property
+    def relative(self) -> bool:
+        """Whether the MakerNote's offsets are unaffected by moving the MakerNote."""
+
+        return self._value[0:16].tobytes().startswith(self._relative)
+
+    def patches(self) -> list[int] | None:
+        """Find the offset fields within the MakerNote that must be patched when it is
+        moved, returning the positions of the fields within the MakerNote, or None if
+        the MakerNote's layout is not recognised. The MakerNote's IFD is only accepted
+        if each of the offsets held by its tags lies within the MakerNote's value, as
+        is always the case for the absolute-offset layouts, so that other layouts are
+        never mistakenly patched."""
+
+        prefix: str = IFD._orders[self._order]
+
+        length: int = len(self._value)
+
+        start: int = 0
+
+        for signature, position in self._absolute.items():
+            if self._value[0 : len(signature)] == signature:
+                start = position
+                break
+
+        if start + 2 > length:
+            return None
+
+        (count,) = struct.unpack_from(prefix + "H", self._value, start)
+
+        if count == 0 or start + 2 + count * 12 > length:
+            return None
+
+        entry: struct.Struct = struct.Struct(prefix + "HHII")
+
+        patches: list[int] = []
+
+        for index in range(count):
+            position: int = start + 2 + index * 12
+
+            (tagid, type, number, location) = entry.unpack_from(self._value, position)
+
+            if (format := IFD._formats.get(type)) is None:
+                return None
+
+            if number * format[1] <= 4:
+                continue
+
+            location -= self._offset
+
+            if location < 0 or location + number * format[1] > length:
+                return None
+
+            patches.append(position + 8)
+
+        return patches
+
+    def relocate(self, offset: int) -> bytes | memoryview:
+        """Return the MakerNote's value for placing it at the specified offset within
+        the encoded TIFF structure; if the MakerNote is not moving, or its offsets are
+        relative, its value is returned as is, otherwise a copy of its value is made
+        with the offsets of any known absolute-offset layout patched to suit."""
+
+        if offset == self._offset or self.relative:
+            return self._value
+
+        if (patches := self.patches()) is None:
+            logger.warning(
+                "%s.relocate() The MakerNote layout is not recognised, so any offsets it holds cannot be patched!",
+                self.__class__.__name__,
+            )
+            return self._value
+
+        patched: bytearray = bytearray(self._value)
+
+        pointer: struct.Struct = struct.Struct(IFD._orders[self._order] + "I")
+
+        for position in patches:
+            (location,) = pointer.unpack_from(patched, position)
+
+            pointer.pack_into(patched, position, location - self._offset + offset)
 
-        return b"".join(encoded) if encoded else None
+        return patched
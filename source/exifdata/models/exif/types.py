@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import datetime
 import fractions
-import unicodedata
 
 from exifdata.logging import logger
 
 from exifdata.framework import (
     Value,
+    Transliterator,
 )
 
+from exifdata.models.exif.structures import IFD
+
 from deliciousbytes import (
     ByteOrder,
     Encoding,
@@ -18,6 +20,8 @@ from deliciousbytes import (
     SignedShort,
     UnsignedLong,
     SignedLong,
+    UnsignedLongLong,
+    SignedLongLong,
     Float,
     Double,
 )
@@ -43,6 +47,8 @@ logger = logger.getChild(__name__)
 # |  10 | Signed Rational        | two longs  | 8 bytes, 64-bits |
 # |  11 | Single-Precision Float | float      | 4-bytes, 32-bits |
 # |  12 | Double-Precision Float | double     | 8-bytes, 64-bits |
+# |  16 | Unsigned Long8         | long long  | 8-bytes, 64-bits |
+# |  17 | Signed Long8           | long long  | 8-bytes, 64-bits |
 # | 129 | UTF-8 String           | utf-8      | 1-byte, 8-bits   |
 
 
@@ -100,6 +106,8 @@ class ASCII(String, Value):
         # the traditionally used ASCII-compatible "(c)" replacement:
         "©": "(c)",
     }
+    _transliterator: Transliterator = Transliterator(_replacements)
+    _encoded: tuple[int, bytes] = None
 
     @classmethod
     def add_replacement(cls, search: str, replacement: str):
@@ -128,7 +136,7 @@ class ASCII(String, Value):
                     "The 'replacement' argument must contain an ASCII-compatible string value!"
                 )
 
-        cls._replacements[search] = replacement
+        cls._transliterator.add(search=search, replacement=replacement)
 
     def __len__(self) -> int:
         return len(self.encode())
@@ -139,22 +147,22 @@ class ASCII(String, Value):
                 "The %s class does not have a string value!" % (self.__class__.__name__)
             )
 
-        # Normalise non-ASCII characters where possible to their closest ASCII equivalents
-        value = unicodedata.normalize("NFKD", value)
-
-        # Filter out the combining characters from the expanded form, such as diacritics
-        value = "".join([char for char in value if not unicodedata.combining(char)])
+        # Reuse the encoded value if the string has already been encoded, such as when
+        # the length of the value was determined, unless the replacements have changed
+        if not (encoded := self._encoded) is None:
+            if encoded[0] == self._transliterator.generation:
+                return encoded[1]
 
-        # Check the string value for the presence of any of the search strings; if
-        # one or more are found, replace them with their replacements before encoding;
+        # Normalise non-ASCII characters where possible to their closest ASCII equivalents
+        # removing any combining characters, such as diacritics, and replace any of the
+        # search strings with their replacements, via the compiled transliteration table;
         # to avoid replacements reformatted strings can be provided that are ASCII-only:
-        for search, replacement in self.__class__._replacements.items():
-            value = value.replace(search, replacement)
+        value = self._transliterator.transliterate(value)
 
         # Encode the source string, replacing any other characters outside of the ASCII
         # range with a "?" placeholder to indicate the presence of a character that was
         # supplied to the method but should not have been present in an ASCII string:
-        encoded: bytes = value.encode("ASCII", errors="replace")
+        encoded: bytes = str.encode(value, "ASCII", errors="replace")
 
         # Ensure that the string ends with a NUL byte
         if not encoded.endswith(b"\x00"):
@@ -166,6 +174,8 @@ class ASCII(String, Value):
             # encoded = bytes(reversed(bytearray(encoded)))
             pass
 
+        self._encoded = (self._transliterator.generation, encoded)
+
         return encoded
 
     @classmethod
@@ -283,13 +293,9 @@ class Rational(Value):
             self._denominator = UnsignedLong(denominator)
 
     def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
-        encoded: list[bytes] = []
-
-        encoded.append(self.numerator.encode(order=order))
-
-        encoded.append(self.denominator.encode(order=order))
-
-        return b"".join(encoded)
+        return IFD.codec(self._tagid, order).pack(
+            int(self.numerator), int(self.denominator)
+        )
 
     @classmethod
     def decode(cls, value: bytes, order: ByteOrder = ByteOrder.MSB) -> Rational:
@@ -303,14 +309,9 @@ class Rational(Value):
                 % (length)
             )
 
-        if cls._signed is True:
-            numerator: SignedLong = SignedLong.decode(value[0:4], order=order)
-            denominator: SignedLong = SignedLong.decode(value[4:8], order=order)
-        elif cls._signed is False:
-            numerator: UnsignedLong = UnsignedLong.decode(value[0:4], order=order)
-            denominator: UnsignedLong = UnsignedLong.decode(value[4:8], order=order)
+        (numerator, denominator) = IFD.codec(cls._tagid, order).unpack(value)
 
-        return Rational(numerator=numerator, denominator=denominator)
+        return cls(numerator=numerator, denominator=denominator)
 
 
 class ByteSigned(Byte, Value):
@@ -327,6 +328,17 @@ class Undefined(Value):
     _tagid: int = 7
     _length: int = 1
 
+    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
+        if isinstance(value := self.value, (bytes, bytearray)):
+            return bytes(value)
+        elif isinstance(value, str):
+            return value.encode("UTF-8")
+        else:
+            raise ValueError(
+                "The %s class does not have a bytes or string value!"
+                % (self.__class__.__name__)
+            )
+
 
 class ShortSigned(SignedShort, Value):
     """A 16-bit (2-byte) signed integer."""
@@ -360,6 +372,9 @@ class Float(Float, Value):
     _length: int = 4
     _signed: bool = True
 
+    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
+        return IFD.codec(self._tagid, order).pack(self)
+
 
 class Double(Double, Value):
     """A double-precision 64-bit floating-point number."""
@@ -368,6 +383,25 @@ class Double(Double, Value):
     _length: int = 8
     _signed: bool = True
 
+    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
+        return IFD.codec(self._tagid, order).pack(self)
+
+
+class Long8(UnsignedLongLong, Value):
+    """A 64-bit (8-byte) unsigned integer, as used by BigTIFF for offsets and counts."""
+
+    _tagid: int = 16
+    _length: int = 8
+    _signed: bool = False
+
+
+class LongSigned8(SignedLongLong, Value):
+    """A 64-bit (8-byte) signed integer (2's complement notation), used by BigTIFF."""
+
+    _tagid: int = 17
+    _length: int = 8
+    _signed: bool = True
+
 
 class UTF8(String, Value):
     """An 8-bit byte representing a string according to UTF-8[22]. The final byte is
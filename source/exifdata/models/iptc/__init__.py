@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import os
-import json
 import io
+import mmap
+import functools
+import typing
 
 from exifdata.logging import logger
 
 from exifdata.framework import (
     Metadata,
+    Schema,
     Structure,
     Value,
     Type,
@@ -25,6 +28,8 @@ from exifdata.models.iptc.enumerations import (
 from exifdata.models.iptc.structures import (
     Records,
     Record,
+    Resource,
+    Resources,
 )
 
 from exifdata.models.iptc.types import (
@@ -41,10 +46,7 @@ from exifdata.models.iptc.types import (
 from deliciousbytes import (
     ByteOrder,
     Encoding,
-    UInt8,
-    UInt16,
     UInt32,
-    Int32,
 )
 
 
@@ -57,22 +59,12 @@ class IPTC(Metadata):
     _aliases: dict[str, str] = {}
     _encodings: list[str] = ["UTF-8", "Unicode", "ASCII"]
     _types: dict[str, type] = {}
-    _app13prefix: bytearray = [
-        b"P",
-        b"h",
-        b"o",
-        b"t",
-        b"o",
-        b"s",
-        b"h",
-        b"o",
-        b"p",
-        b" ",
-        b"3",
-        b".",
-        b"0",
-        b"\x00",
-    ]
+    _records: dict[str, RecordID] = None
+    _app13prefix: bytes = b"Photoshop 3.0\x00"
+    _resources: Resources = None
+    _payload: memoryview = None
+    _segments: list[tuple[str | None, int, int]] = None
+    _resolutions: dict[tuple[int, int], tuple[Namespace, Field, type] | None] = {}
     _setup: bool = False
 
     def __new__(cls):
@@ -82,11 +74,19 @@ class IPTC(Metadata):
         if cls._setup is True:
             return super().__new__(cls)
 
-        with open(
-            os.path.join(os.path.dirname(__file__), "data", "schema.json"), "r"
-        ) as handle:
+        schema = Schema(
+            filepath=os.path.join(os.path.dirname(__file__), "data", "schema.json")
+        )
+
+        # If a precompiled copy of the schema is available, restore the namespaces,
+        # structures and aliases from it rather than rebuilding them from the schema:
+        if isinstance(cached := schema.load(), dict):
+            cls._namespaces = cached["namespaces"]
+            cls._structures = cached["structures"]
+            cls._aliases = cached["aliases"]
+        else:
             # Ensure the model configuration file is valid
-            if not isinstance(namespacesdata := json.load(handle), dict):
+            if not isinstance(namespacesdata := schema.parse(), dict):
                 raise TypeError("The 'namespaces' dictionary isn't valid!")
 
             # Dynamically create the model namespaces based on the provided configuration
@@ -124,29 +124,83 @@ class IPTC(Metadata):
                         **namespacedata,  # pass the properties via dictionary expansion
                     )
 
-                    # Now iterate over the fields and add them to the relevant namespace
-                    for fieldid, fielddata in fieldsdata.items():
-                        # logger.debug("  - Field: %s (%s)" % (fieldid, fielddata.get("name")))
-
-                        namespace.field = field = Field(
-                            namespace=namespace,
-                            identifier=fieldid,
-                            **fielddata,  # pass the properties via dictionary expansion
-                        )
+                    # Defer the creation of the fields until the namespace is first used
+                    namespace.defer(Field, fieldsdata)
 
-                        field.record_id = RecordID.register(
-                            name=field.name,
-                            value=RecordInfo(
-                                record_id=namespace.tagid,
-                                dataset_id=field.tagid,
-                                type=field.type,
-                            ),
-                        )
+            schema.save(
+                namespaces=cls._namespaces,
+                structures=cls._structures,
+                aliases=cls._aliases,
+            )
 
         cls._setup = True
 
         return super().__new__(cls)
 
+    @classmethod
+    def _indexed(
+        cls, namespace: Namespace, identifier: str, specification: dict[str, object]
+    ) -> dict[str, list[object]]:
+        """Extend the field indexes to include the IPTC record and dataset identifiers."""
+
+        indexed: dict[str, list[object]] = super()._indexed(
+            namespace=namespace,
+            identifier=identifier,
+            specification=specification,
+        )
+
+        indexed["record_id"] = [(namespace.record_id, specification.get("tagid"))]
+
+        return indexed
+
+    @classmethod
+    def _indexkey(cls, property: str, value: object) -> object:
+        """Map RecordID enumeration options to their record and dataset identifiers."""
+
+        if property == "record_id" and isinstance(value, (RecordID, RecordInfo)):
+            return (int(value.record_id), int(value.dataset_id))
+
+        return super()._indexkey(property=property, value=value)
+
+    @classmethod
+    def record_id_by_field_id(cls, field_id: str) -> RecordID | None:
+        """Return the RecordID enumeration option for the field with the specified field
+        identifier, via the class-level table of record IDs, which is filled as fields
+        are first encoded, so that encoding does not need to look up each field again.
+        """
+
+        # Each model subclass holds its own table, so it is not inherited
+        if (records := cls.__dict__.get("_records")) is None:
+            records = cls._records = {}
+
+        if (record_id := records.get(field_id)) is None:
+            if result := cls.field_by_id(field_id):
+                (namespace, field) = result
+
+                record_id = records[field_id] = field.record_id
+
+        return record_id
+
+    @classmethod
+    def namespace_by_record_id(cls, record_id: int) -> Namespace | None:
+        """Find the namespace corresponding to the provided IPTC record number, ensuring
+        that its fields, and thus their RecordID enumeration options, have been created
+        so that records within the namespace can be reconciled by their identifiers."""
+
+        if not isinstance(record_id, int):
+            raise TypeError("The 'record_id' argument must have an integer value!")
+
+        for namespace in cls._namespaces.values():
+            if namespace.record_id == record_id:
+                return namespace.materialize()
+
+    @property
+    def resources(self) -> Resources | None:
+        """Return the index of the APP13 image resources decoded with the model, if any,
+        which are passed through unmodified when the model is re-encoded for APP13."""
+
+        return self._resources
+
     @property
     def record(self):
         raise NotImplementedError
@@ -195,9 +249,9 @@ class IPTC(Metadata):
         format: IPTCFormat = IPTCFormat.APP13,
     ) -> bytes:
         """Provides support for encoding the assigned IPTC metadata field values into
-        the binary representation needed for embedding into an image file."""
-
-        encoded: list[bytes] = []
+        the binary representation needed for embedding into an image file. The exact
+        size of the payload is computed from the record lengths before the payload is
+        written, so it is assembled within a single preallocated buffer."""
 
         if not isinstance(order, ByteOrder):
             raise TypeError(
@@ -215,29 +269,6 @@ class IPTC(Metadata):
             )
             return None
 
-        if format is IPTCFormat.APP13:
-            # Include the standard APP13 "Photoshop 3.0" prefix
-            encoded.extend(self.__class__._app13prefix)
-
-            # Include the 8BIM marker, noting a binary structure within the APP13 block
-            encoded.append(b"8")
-            encoded.append(b"B")
-            encoded.append(b"I")
-            encoded.append(b"M")
-
-            # Include the 0x04 0x04 Photoshop APP13 resource ID for IPTC-IIM
-            encoded.append(UInt8(0x04).encode(order=order))
-            encoded.append(UInt8(0x04).encode(order=order))
-
-            # Include required empty string/data
-            encoded.append(UInt16(0x00).encode(order=order))
-            encoded.append(UInt16(0x00).encode(order=order))
-            encoded.append(UInt8(0x00).encode(order=order))
-            encoded.append(b":")
-
-        elif format is IPTCFormat.RAW:
-            pass
-
         # # Iterate through the namespaces and fields to emit the metadata in a fixed
         # # order based on when the field name is encountered during iteration:
         # for namespace in self._namespaces.values():
@@ -252,59 +283,262 @@ class IPTC(Metadata):
         #             logger.debug("0x%02x, 0x%02x, %s, %s" % (field.record_id.record_id, field.record_id.dataset_id, field.identifier, field.record_id.type))
         #             encoded.append(record.encode(order=order))
 
-        # Determine if the Record Version has been set
-        found_record_version: bool = False
-        for field_id in self._values.keys():
-            if result := self.field_by_id(field_id):
-                (namespace, field) = result
+        records: list[tuple[RecordID | None, bytes | memoryview]] = self._assemble(
+            order=order
+        )
+
+        (length, size, resources) = self._measure(records, format=format)
+
+        # Allocate the payload, padded so that its length is evenly divisible by four
+        encoded: bytearray = bytearray(size + (-size % 4))
+
+        offset: int = 0
+
+        if format is IPTCFormat.APP13:
+            # Include the standard APP13 "Photoshop 3.0" prefix
+            encoded[0 : len(self._app13prefix)] = self._app13prefix
+
+            offset = len(self._app13prefix)
+
+            for resource in resources:
+                if resource.id == 0x0404:
+                    offset = resource.pack_header_into(encoded, offset, length)
+                    offset = self._pack_into(encoded, offset, records)
+                    offset += length % 2
+                else:
+                    offset = resource.pack_into(encoded, offset)
+        else:
+            offset = self._pack_into(encoded, offset, records)
+
+        return bytes(encoded)
+
+    def encoded_size(
+        self,
+        order: ByteOrder = None,
+        format: IPTCFormat = IPTCFormat.APP13,
+    ) -> int:
+        """Compute the exact length in bytes of the payload that encode() would produce
+        for the same arguments, including the APP13 prefix and image resource headers
+        and the padding, from the lengths of the records, without assembling the payload,
+        so that payloads that would exceed the limits of JPEG APP13 segments can be
+        identified before encoding; if there is nothing to encode, 0 is returned."""
+
+        if not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument must have a ByteOrder enumeration value!"
+            )
+
+        if not isinstance(format, IPTCFormat):
+            raise TypeError(
+                "The 'format' argument must have an IPTCFormat enumeration value!"
+            )
+
+        if len(self._values) == 0:
+            return 0
+
+        (length, size, resources) = self._measure(self._assemble(order), format=format)
+
+        return size + (-size % 4)
+
+    def _assemble(
+        self, order: ByteOrder
+    ) -> list[tuple[RecordID | None, bytes | memoryview]]:
+        """Assemble the records to encode, held as tuples of the record ID and encoded
+        value, or of None and a slice of the original payload for passed through runs.
+        """
+
+        records: list[tuple[RecordID | None, bytes | memoryview]] = []
+
+        # If the Record Version has not been set, add the Record Version field for IPTC
+        # [> 1C 02 00 00 02 00 04 00 00 <], noting that it must be the first record:
+        if not "application:RecordVersion" in self._values:
+            records.append(
+                (
+                    self.record_id_by_field_id("application:RecordVersion"),
+                    Short(0x04).encode(order=order),
+                )
+            )
+
+        emitted: set[str] = set()
+
+        # If the model was decoded, splice the new records for the fields that have been
+        # assigned since the model was decoded into the original payload, copying each
+        # run of untouched records, including those for unknown datasets, verbatim, so
+        # that only the assigned fields are re-encoded, in their original positions:
+        run: int = None
+
+        for field_id, start, end in self._segments or []:
+            if field_id is None or not self._values.dirty(field_id):
+                if not field_id is None:
+                    emitted.add(field_id)
+
+                if run is None:
+                    run = start
 
-                if field.record_id == RecordID.RecordVersion:
-                    found_record_version = True
+                finish: int = end
 
-        # If not, add the Record Version field for IPTC [> 1C 02 00 00 02 00 04 00 00 <]
-        if found_record_version is False:
-            record = Record(id=RecordID.RecordVersion, value=Short(0x04))
-            encoded.append(record.encode(order=order))
+                continue
+
+            if not run is None:
+                records.append((None, self._payload[run:finish]))
+                run = None
+
+            if not field_id in emitted and field_id in self._values:
+                if record_id := self.record_id_by_field_id(field_id):
+                    records.append(
+                        (record_id, self._values[field_id].encode(order=order))
+                    )
+
+            emitted.add(field_id)
+
+        if not run is None:
+            records.append((None, self._payload[run:finish]))
 
         # Iterate over the values, encoding them as we go so that the encoded version of
         # the IPTC tags matches the order that they were decoded or added:
-        for field_id, value in self._values.items():
-            if result := self.field_by_id(field_id):
-                (namespace, field) = result
+        for field_id in self._values.keys():
+            if field_id in emitted:
+                continue
 
-                if record := Record(
-                    id=field.record_id,
-                    value=value,
-                ):
-                    logger.debug(
-                        "0x%02x, 0x%02x, %s, %s, %r"
-                        % (
-                            record.id.record_id,
-                            record.id.dataset_id,
-                            field.identifier,
-                            record.id.type,
-                            value,
-                        )
+            if record_id := self.record_id_by_field_id(field_id):
+                value = self._values[field_id]
+
+                logger.debug(
+                    "0x%02x, 0x%02x, %s, %s, %r"
+                    % (
+                        record_id.record_id,
+                        record_id.dataset_id,
+                        field_id,
+                        record_id.type,
+                        value,
                     )
+                )
+
+                records.append((record_id, value.encode(order=order)))
+
+        return records
+
+    def _measure(
+        self,
+        records: list[tuple[RecordID | None, bytes | memoryview]],
+        format: IPTCFormat,
+    ) -> tuple[int, int, list[Resource] | None]:
+        """Compute the exact length of the encoded records, and the size of the payload
+        holding them in the specified format, before it is padded, along with the image
+        resources of the APP13 payload, if needed."""
+
+        # Compute the exact length of the encoded records
+        length: int = sum(
+            len(data) if record_id is None else Record.size(len(data))
+            for (record_id, data) in records
+        )
+
+        if format is IPTCFormat.APP13:
+            resources: list[Resource] = self._resourcify()
+
+            size: int = len(self._app13prefix) + sum(
+                resource.size(length if resource.id == 0x0404 else None)
+                for resource in resources
+            )
+        else:
+            resources: list[Resource] = None
+
+            size: int = length
+
+        return (length, size, resources)
 
-                    encoded.append(record.encode(order=order))
+    def _pack_into(
+        self,
+        buffer: bytearray,
+        offset: int,
+        records: list[tuple[RecordID | None, bytes | memoryview]],
+    ) -> int:
+        """Write the records into the buffer at the specified offset, returning the
+        offset at which the records end; passed through records are copied verbatim."""
+
+        for record_id, data in records:
+            if record_id is None:
+                buffer[offset : offset + len(data)] = data
+                offset += len(data)
+            else:
+                offset = Record.pack_into(buffer, offset, id=record_id, data=data)
+
+        return offset
+
+    def _resourcify(self) -> list[Resource]:
+        """Assemble the list of image resources for the APP13 payload, comprising of the
+        IPTC-IIM image resource, alongside any other image resources that were decoded
+        with the model, which are passed through unmodified in their original order, so
+        that resources such as clipping paths are retained."""
 
-        if len(encoded) > 0:
-            # Pad the IPTC payload so that its length is evenly divisible by four bytes
-            while not sum(map(len, encoded)) % 4 == 0:
-                encoded.append(UInt8(0x00).encode(order=order))
+        resources: list[Resource] = []
 
-        return b"".join(encoded)
+        # Include the IPTC-IIM resource, with resource ID 0x0404, in its original place
+        included: bool = False
+
+        for resource in self._resources or []:
+            if not resource.id == 0x0404:
+                resources.append(resource)
+            elif included is False:
+                resources.append(resource)
+                included = True
+
+        if included is False:
+            resources.insert(0, Resource(id=0x0404, data=b""))
+
+        return resources
+
+    @classmethod
+    def locate(cls, value: memoryview) -> Resources:
+        """Locate the image resource blocks within the provided APP13 payload, including
+        the IPTC-IIM resource, returning an index of the resources. The APP13 payload
+        comprises the "Photoshop 3.0" prefix followed by a sequence of image resource
+        blocks, which are indexed without their data being copied or decoded."""
+
+        if not isinstance(value, memoryview):
+            raise TypeError("The 'value' argument must reference a memoryview!")
+
+        prefix: bytes = cls._app13prefix
+
+        # The prefix is followed by a NUL byte which some encoders omit
+        if not value[: len(prefix) - 1] == prefix[:-1]:
+            raise ValueError(
+                "The 'value' does not begin with the expected %r prefix!" % (prefix)
+            )
+
+        return Resources.decode(value, offset=len(prefix))
 
     @classmethod
     def decode(
         cls,
-        value: bytes | bytearray | io.BytesIO,
+        value: bytes | bytearray | memoryview | io.BytesIO | mmap.mmap,
         order: ByteOrder = None,
         format: IPTCFormat = IPTCFormat.APP13,
+        lazy: bool = False,
     ) -> IPTC:
         """Provides support for decoding the provided IPTC metadata payload into its
-        corresponding IPTC metadata fields which can then be accessed for use."""
+        corresponding IPTC metadata fields which can then be accessed for use. The value
+        is accessed through a memoryview, so payloads held in bytes, bytearrays, BytesIO
+        buffers or memory mapped files are decoded without their data being copied.
+
+        If the 'lazy' argument is set to True, only the record headers are scanned, and
+        the decoding of each record's value is deferred until the value is first read,
+        via a namespace attribute, items(), values() or dump(). Until then, the model
+        holds a reference to the payload, so the payload must remain available."""
+
+        if isinstance(value, memoryview):
+            pass
+        elif isinstance(value, (bytes, bytearray, mmap.mmap)):
+            value = memoryview(value)
+        elif isinstance(value, io.BytesIO):
+            value = value.getbuffer()[value.tell() :]
+        else:
+            raise TypeError(
+                "The 'value' argument must have a bytes, bytearray, memoryview, io.BytesIO or mmap value!"
+            )
+
+        if not value.format == "B":
+            value = value.cast("B")
 
         logger.debug(
             "%s.decode(value: %d, format: %s, order: %s)",
@@ -314,13 +548,193 @@ class IPTC(Metadata):
             order,
         )
 
-        if isinstance(value, (bytes, bytearray)):
-            value = io.BytesIO(value)
-        elif isinstance(value, io.BytesIO):
+        if not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument must reference a ByteOrder enumeration option!"
+            )
+
+        if not isinstance(format, IPTCFormat):
+            raise TypeError(
+                "The 'format' argument must reference an IPTCFormat enumeration option!"
+            )
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if format is IPTCFormat.APP13:
+            resources: Resources = cls.locate(value)
+
+            # Find the IPTC-IIM resource amongst the APP13 image resource blocks
+            if (resource := resources.resource(0x0404)) is None:
+                return None
+
+            value = resource.data
+
+        elif format is IPTCFormat.RAW:
+            if len(value) > 0 and not value[0] == 0x1C:
+                raise ValueError(
+                    "The 'value' does not begin with the expected '0x1C' IPTC record marker!"
+                )
+
+        if lazy is False and not isinstance(value.obj, bytes):
+            # Detach the records from payloads that may be mapped, resized or modified by
+            # the caller, such as mmaps, bytearrays and BytesIO buffers, so the original
+            # encoded records can be retained for passthrough when encoding; immutable
+            # bytes payloads are held through the memoryview, without being copied
+            value = memoryview(bytes(value))
+
+        iptc: IPTC = None
+
+        for namespace, field, klass, start, end in cls._segment(value):
+            if iptc is None:
+                iptc = IPTC()
+                iptc._payload = value
+                iptc._segments = []
+
+            if field is None:
+                iptc._segments.append((None, start, end))
+                continue
+
+            raw: memoryview = value[start:end]
+
+            if lazy is True:
+                iptc._values.defer(
+                    field.id,
+                    functools.partial(
+                        iptc._load, field=field, klass=klass, value=raw, order=order
+                    ),
+                )
+            else:
+                iptc._values[field.id] = iptc._load(
+                    field=field, klass=klass, value=raw, order=order
+                )
+
+            namespace._utilized = True
+
+            iptc._segments.append((field.id, start, end))
+
+        if not iptc is None:
+            # Mark the decoded fields as clean, so that unless they are later assigned,
+            # their original encoded records are copied verbatim when encoding
+            for field_id, start, end in iptc._segments:
+                if not field_id is None:
+                    iptc._values.clean(field_id)
+
+            if format is IPTCFormat.APP13:
+                # Retain the other image resources so they can be passed through when the
+                # model is re-encoded, detaching them from the payload, which may be mapped
+                iptc._resources = resources.detach()
+
+        return iptc
+
+    @classmethod
+    def _segment(
+        cls, value: memoryview
+    ) -> typing.Generator[
+        tuple[Namespace | None, Field | None, type | None, int, int], None, None
+    ]:
+        """Scan the record headers of the provided IPTC payload, yielding the namespace,
+        field and value type for each record, alongside the offsets of the start and end
+        of the record's original encoded bytes within the payload; records for datasets
+        unknown to the schema are yielded without a namespace, field or value type, so
+        that they can be passed through."""
+
+        for record_id, dataset_id, start, offset, length in Records.scan(value):
+            if (result := cls._resolve(record_id, dataset_id)) is None:
+                logger.debug(
+                    "%s.decode() Passing through unknown record %d:%d",
+                    cls.__name__,
+                    record_id,
+                    dataset_id,
+                )
+
+                yield (None, None, None, start, offset + length)
+                continue
+
+            yield (*result, start, offset + length)
+
+    @classmethod
+    def _resolve(
+        cls, record_id: int, dataset_id: int
+    ) -> tuple[Namespace, Field, type] | None:
+        """Resolve the namespace, field and value type for the specified record number
+        and dataset number, returning None if the dataset is unknown to the schema. The
+        resolutions are held in a class-level table, so that each dataset is resolved
+        just once, however many records and payloads it is encountered in."""
+
+        try:
+            return cls._resolutions[(record_id, dataset_id)]
+        except KeyError:
             pass
+
+        # Ensure the model's namespaces have been initialized from the schema
+        cls._initialize()
+
+        cls.namespace_by_record_id(record_id)
+
+        if (
+            rid := RecordID.reconcile(record_id=record_id, dataset_id=dataset_id)
+        ) is None or not (
+            result := cls.field_by_property(property="record_id", value=rid)
+        ):
+            cls._resolutions[(record_id, dataset_id)] = None
+
+            return None
+
+        (namespace, field) = result
+
+        if not isinstance(klass := cls._types.get(field.type), type):
+            raise ValueError(
+                f"The field type, '{field.type}', does not map to a registered value type!"
+            )
+
+        cls._resolutions[(record_id, dataset_id)] = (namespace, field, klass)
+
+        return (namespace, field, klass)
+
+    @classmethod
+    def stream(
+        cls,
+        handle: typing.BinaryIO | mmap.mmap,
+        offset: int = 0,
+        length: int = None,
+        order: ByteOrder = None,
+        format: IPTCFormat = IPTCFormat.APP13,
+        fields: list[str] = None,
+    ) -> IPTC | None:
+        """Provides support for decoding an IPTC metadata payload held within a file,
+        via an open binary file handle or memory mapped file, starting at the specified
+        offset and spanning the specified length, or extending to the end of the file,
+        such as an APP13 segment located by a JPEG or TIFF scanner. The record headers
+        are read incrementally, and only the data of the records being decoded is read,
+        so that other image resources held in the payload, such as thumbnails, are not
+        read into memory.
+
+        If the 'fields' argument is specified, only the records for the listed fields,
+        referenced by their identifiers or names, are decoded, and reading stops as soon
+        as each of the requested fields has been found; where a dataset occurs more than
+        once, the first occurrence is then used. As the returned model holds a subset of
+        the payload, it does not retain the payload's records or resources for passing
+        through when encoding."""
+
+        if not (hasattr(handle, "read") and hasattr(handle, "seek")):
+            raise TypeError(
+                "The 'handle' argument must reference a binary file handle or mmap!"
+            )
+
+        if not (isinstance(offset, int) and offset >= 0):
+            raise TypeError(
+                "The 'offset' argument must have a non-negative integer value!"
+            )
+
+        if length is None:
+            handle.seek(0, os.SEEK_END)
+            end: int = handle.tell()
+        elif isinstance(length, int) and length >= 0:
+            end: int = offset + length
         else:
             raise TypeError(
-                "The 'value' argument must have a bytes, bytearray or io.BytesIO value!"
+                "The 'length' argument, if specified, must have a non-negative integer value!"
             )
 
         if not isinstance(order, ByteOrder):
@@ -333,155 +747,249 @@ class IPTC(Metadata):
                 "The 'format' argument must reference an IPTCFormat enumeration option!"
             )
 
-        position: int = value.tell()
+        wanted: set[tuple[int, int]] = None
 
-        if format is IPTCFormat.APP13:
-            iptc_found: bool = False
+        if fields is None:
+            pass
+        elif isinstance(fields, (list, tuple, set)):
+            wanted = set()
 
-            # Ensure the "Photoshop 3.0" prefix is present to mark the APP13 EXIF tag
-            while byte := value.read(1):
-                index = value.tell()
+            # Ensure the model's namespaces have been initialized from the schema
+            cls._initialize()
 
-                logger.debug(
-                    "%02d => 0x%02x, %r, %r",
-                    index,
-                    int(byte.hex(), 16),
-                    byte,
-                    cls._app13prefix[index - 1],
-                )
+            for name in fields:
+                if not isinstance(name, str):
+                    raise TypeError(
+                        "The 'fields' argument must reference a list of string values!"
+                    )
 
-                if index == len(cls._app13prefix):
-                    break
-                elif not cls._app13prefix[index - 1] == byte:
+                if not (result := cls.field_by_id(name) or cls.field_by_name(name)):
                     raise ValueError(
-                        "The 'value' prefix does not contain the expected %r value at offset %d, but %r!"
-                        % (
-                            cls._app13prefix[index - 1],
-                            index,
-                            byte,
-                        )
+                        f"The '{name}' field does not exist on the IPTC metadata model!"
                     )
 
-            # There could be other metadata in APP13 before and after the IPTC tags
-            while byte := value.read(1):
-                index = value.tell()
+                wanted.add(cls._indexkey("record_id", result[1].record_id))
+        else:
+            raise TypeError(
+                "The 'fields' argument, if specified, must reference a list of strings!"
+            )
 
-                logger.debug("%02d => 0x%02x, %r", index, int(byte.hex(), 16), byte)
+        logger.debug(
+            "%s.stream(offset: %d, end: %d, format: %s, order: %s)",
+            cls.__name__,
+            offset,
+            end,
+            format,
+            order,
+        )
 
-                # If an 8 is encountered, it could be the start of the 8BIM marker that
-                # denotes that a binary data structure is nested within the APP13 block
-                if byte == b"8":
-                    if next := value.read(3):
-                        if next == b"BIM":
-                            for i, b in enumerate(next, start=index + 1):
-                                b = bytes([b])
+        if format is IPTCFormat.APP13:
+            prefix: bytes = cls._app13prefix
 
-                                logger.debug(
-                                    "%02d => 0x%02x, %r", i, int(b.hex(), 16), b
-                                )
+            handle.seek(offset)
 
-                                index += 1
+            # The prefix is followed by a NUL byte which some encoders omit
+            if not handle.read(len(prefix) - 1) == prefix[:-1]:
+                raise ValueError(
+                    "The 'handle' data does not begin with the expected %r prefix!"
+                    % (prefix)
+                )
 
-                            break
+            # Find the IPTC-IIM resource amongst the APP13 image resource blocks
+            if not (
+                located := Resources.seek(
+                    handle, id=0x0404, offset=offset + len(prefix), end=end
+                )
+            ):
+                return None
 
-            # There could be other metadata in APP13 before and after the IPTC tags
-            while byte := value.read(1):
-                index = value.tell()
+            (offset, length) = located
 
-                logger.debug("%02d +> 0x%02x, %r", index, int(byte.hex(), 16), byte)
+            end = offset + length
 
-                # Now look for the 0x04 0x04 Photoshop APP13 resource ID for IPTC-IIM
-                if int(byte.hex(), 16) == 0x04:
-                    if next := value.read(1):
-                        if int(next.hex(), 16) == 0x04:
-                            for i, b in enumerate(next, start=index + 1):
-                                b = bytes([b])
+        elif format is IPTCFormat.RAW:
+            handle.seek(offset)
 
-                                logger.debug(
-                                    "%02d +> 0x%02x, %r", i, int(b.hex(), 16), b
-                                )
+            if offset < end and not handle.read(1) == b"\x1c":
+                raise ValueError(
+                    "The 'handle' data does not begin with the expected '0x1C' IPTC record marker!"
+                )
 
-                                index += 1
+        iptc: IPTC = None
 
-                            logger.debug(">>> Found IPTC")
+        for record_id, dataset_id, start, offset, length in Records.read(
+            handle, offset=offset, end=end
+        ):
+            if not (wanted is None or (record_id, dataset_id) in wanted):
+                continue
 
-                            iptc_found = True
+            if (result := cls._resolve(record_id, dataset_id)) is None:
+                continue
 
-                            break
+            (namespace, field, klass) = result
 
-            if iptc_found is False:
-                return None
+            handle.seek(start)
 
-        elif format is IPTCFormat.RAW:
-            value.seek(0)
+            raw: memoryview = memoryview(handle.read(offset + length - start))
 
-            while isinstance(byte := value.read(1), bytes) and byte:
-                index = value.tell()
+            if iptc is None:
+                iptc = IPTC()
 
-                logger.debug(
-                    "%02d ~> 0x%02x, %r",
-                    index,
-                    (int(byte.hex(), 16) if byte else 0),
-                    byte,
-                )
+            iptc._values[field.id] = iptc._load(
+                field=field, klass=klass, value=raw, order=order
+            )
 
-                if index == 0 and not byte == 0x1C:
-                    raise ValueError(
-                        "The 'value' does not begin with the expected '0x1C' IPTC record marker!"
+            namespace._utilized = True
+
+            if not wanted is None:
+                wanted.discard((record_id, dataset_id))
+
+                if len(wanted) == 0:
+                    break
+
+        return iptc
+
+    @classmethod
+    def decode_many(
+        cls,
+        payloads: typing.Iterable[bytes | bytearray | memoryview],
+        order: ByteOrder = None,
+        format: IPTCFormat = IPTCFormat.APP13,
+        fields: list[str] = None,
+        lazy: bool = False,
+    ) -> list[IPTC | None] | dict[str, list[object]]:
+        """Provides support for decoding many IPTC metadata payloads in bulk, such as
+        when indexing a large number of images. If the 'fields' argument is specified,
+        a columnar result is returned, holding a list of values for each of the listed
+        fields, referenced by their identifiers or names, with one value per payload, or
+        None where the payload does not hold the field; the values of repeatable datasets,
+        such as Keywords, are held as a list of each of their occurrences in the payload.
+        Only the records of the listed fields are decoded and no models are created. Otherwise a list holding an IPTC
+        model, or None, for each payload is returned, decoded as per the decode() method.
+
+        The record and dataset numbers encountered are resolved to their fields once for
+        all of the payloads, and payloads that fail to decode are logged and skipped,
+        so that a single malformed payload does not abort the decoding of the batch."""
+
+        if not isinstance(order, ByteOrder):
+            raise TypeError(
+                "The 'order' argument must reference a ByteOrder enumeration option!"
+            )
+
+        if not isinstance(format, IPTCFormat):
+            raise TypeError(
+                "The 'format' argument must reference an IPTCFormat enumeration option!"
+            )
+
+        if fields is None:
+            models: list[IPTC | None] = []
+
+            for index, payload in enumerate(payloads):
+                try:
+                    models.append(
+                        cls.decode(payload, order=order, format=format, lazy=lazy)
+                    )
+                except ValueError as exception:
+                    logger.warning(
+                        "%s.decode_many() Payload %d failed to decode: %s",
+                        cls.__name__,
+                        index,
+                        str(exception),
                     )
 
-        records: list[Record] = []
+                    models.append(None)
 
-        value.seek(position)
+            return models
 
-        while isinstance(byte := value.read(1), bytes) and byte:
-            index = value.tell()
+        if not isinstance(fields, (list, tuple)):
+            raise TypeError(
+                "The 'fields' argument, if specified, must reference a list of strings!"
+            )
 
-            logger.debug("%02d ~> 0x%02x, %r", index, int(byte.hex(), 16), byte)
+        # Ensure the model's namespaces have been initialized from the schema
+        cls._initialize()
 
-            if int(byte.hex(), 16) == 0x1C:
-                record_id = value.read(1)
+        # Map the record and dataset numbers of the listed fields to the listed names
+        wanted: dict[tuple[int, int], list[str]] = {}
 
-                dataset_id = value.read(1)
+        # Note the listed names of the repeatable fields, whose values are collected
+        repeatable: set[str] = set()
+
+        for name in fields:
+            if not isinstance(name, str):
+                raise TypeError(
+                    "The 'fields' argument must reference a list of string values!"
+                )
 
-                # logger.debug(">>> Found IPTC Record(id: %s, dataset: %s)", record_id, dataset_id)
+            if not (result := cls.field_by_id(name) or cls.field_by_name(name)):
+                raise ValueError(
+                    f"The '{name}' field does not exist on the IPTC metadata model!"
+                )
 
-                length = value.read(2)
+            wanted.setdefault(
+                cls._indexkey("record_id", result[1].record_id), []
+            ).append(name)
 
-                # If the length value is the special 0x8004 marker, it denotes that the
-                # data length is encoded in the following four bytes as a 32-bit integer
-                if length[0] == 0x80 and length[1] == 0x04:
-                    length = value.read(4)
+            if result[1].repeatable is True:
+                repeatable.add(name)
 
-                # We then decode the length value from its encoded form
-                datalength: Int32 = Int32.decode(value=length, order=order)
+        columns: dict[str, list[object]] = {name: [] for name in fields}
 
-                # We can then read the correct amount of data from the buffer
-                data = value.read(datalength)
+        for index, payload in enumerate(payloads):
+            row: dict[str, object] = {}
 
-                # Next we assemble the raw data extracted from the buffer for decoding
-                # by the Record class:
-                if record := Record.decode(
-                    value=b"".join(
-                        [
-                            bytes([0x1C]),
-                            record_id,
-                            dataset_id,
-                            length,
-                            data,
-                        ]
+            try:
+                if isinstance(payload, (bytes, bytearray)):
+                    view: memoryview = memoryview(payload)
+                elif isinstance(payload, memoryview):
+                    view: memoryview = payload.cast("B")
+                else:
+                    raise TypeError(
+                        "The 'payloads' argument must reference an iterable of bytes values!"
                     )
-                ):
-                    records.append(record)
 
-        if len(records) > 0:
-            iptc = IPTC()
+                if format is IPTCFormat.APP13:
+                    if resource := cls.locate(view).resource(0x0404):
+                        view = resource.data
+                    else:
+                        view = view[0:0]
+
+                for record_id, dataset_id, start, offset, length in Records.scan(view):
+                    if names := wanted.get((record_id, dataset_id)):
+                        record: Record = Record.decode(
+                            view[start : offset + length], order=order
+                        )
+
+                        for name in names:
+                            if name in repeatable:
+                                row.setdefault(name, []).append(record.value)
+                            else:
+                                row[name] = record.value
+            except ValueError as exception:
+                logger.warning(
+                    "%s.decode_many() Payload %d failed to decode: %s",
+                    cls.__name__,
+                    index,
+                    str(exception),
+                )
+
+            for name in fields:
+                columns[name].append(row.get(name))
+
+        return columns
+
+    def _load(
+        self,
+        field: Field,
+        klass: type,
+        value: memoryview,
+        order: ByteOrder,
+    ) -> Value:
+        """Decode the provided encoded record, returning the value for its field."""
 
-            for record in records:
-                logger.debug(" >>> Record ID => %s", record.id)
-                iptc.record = record
+        record: Record = Record.decode(value, order=order)
 
-            return iptc
+        return klass(field=field, metadata=self, value=record.value)
 
 
 IPTC.register_types(
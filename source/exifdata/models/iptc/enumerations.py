@@ -67,6 +67,9 @@ class RecordID(enumerific.extensible.Enumeration):
     # Caption = "2#120"
     # Copyright = "2#116"
 
+    # The registered options indexed by their (record_id, dataset_id) identifiers
+    _records: dict[tuple[int, int], RecordID] = {}
+
     @property
     def record_id(self) -> UInt8:
         return self.value.record_id
@@ -98,6 +101,21 @@ class RecordID(enumerific.extensible.Enumeration):
                 "The 'other' argument must reference a RecordID or RecordInfo class instance!"
             )
 
+    @classmethod
+    def register(cls, name: str, value: RecordInfo) -> RecordID:
+        """Register a new RecordID option, indexing it by its record and dataset IDs so
+        that it can be reconciled in constant time when decoding IPTC records."""
+
+        # The register method is provided by the enumeration's metaclass
+        option: RecordID = type(cls).register(cls, name=name, value=value)
+
+        if isinstance(value, RecordInfo):
+            cls._records.setdefault(
+                (int(value.record_id), int(value.dataset_id)), option
+            )
+
+        return option
+
     @classmethod
     def reconcile(
         self,
@@ -108,12 +126,10 @@ class RecordID(enumerific.extensible.Enumeration):
         **kwargs,
     ):
         if isinstance(info, RecordInfo):
-            for option in self.__members__.values():
-                if info == option:
+            if option := self._records.get((int(info.record_id), int(info.dataset_id))):
+                if option == info:
                     return option
         elif isinstance(record_id, int) and isinstance(dataset_id, int):
-            for option in self.__members__.values():
-                if option.record_id == record_id and option.dataset_id == dataset_id:
-                    return option
+            return self._records.get((int(record_id), int(dataset_id)))
         else:
             return super().reconcile(*args, **kwargs)
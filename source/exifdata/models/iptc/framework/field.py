@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from exifdata.logging import logger
-from exifdata.models.iptc.enumerations import RecordID
+from exifdata.models.iptc.enumerations import RecordID, RecordInfo
 from exifdata.framework.field import Field
 
 logger = logger.getChild(__name__)
@@ -29,6 +29,20 @@ class Field(Field):
         self._bytes_min: int = bytes_min
         self._bytes_max: int = bytes_max
         self._repeatable: bool = repeatable
+
+        # Register the IPTC record ID for the field, which is used to encode and decode
+        # the field's IPTC records, unless one has been provided; as fields are created
+        # when their namespace is first used, registration happens on demand too:
+        if record_id is None:
+            record_id = RecordID.register(
+                name=self.name,
+                value=RecordInfo(
+                    record_id=self.namespace.tagid,
+                    dataset_id=tagid,
+                    type=self.type,
+                ),
+            )
+
         self._record_id: RecordID = record_id
 
     @property
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import struct
+import typing
+
 from exifdata.logging import logger
 
 from exifdata.framework import (
@@ -8,12 +11,7 @@ from exifdata.framework import (
 
 from deliciousbytes import (
     ByteOrder,
-    Int16,
-    Int32,
     UInt,
-    UInt8,
-    UInt16,
-    UInt32,
 )
 
 from exifdata.models.iptc.enumerations import (
@@ -24,6 +22,389 @@ from exifdata.models.iptc.enumerations import (
 logger = logger.getChild(__name__)
 
 
+class Resource(object):
+    """The Resource class represents a Photoshop image resource block held within an
+    APP13 payload, such as the IPTC-IIM resource, which has the resource ID 0x0404.
+
+    All image resource blocks comprise of the following components:
+    +---------------+-----------------------------------------------------------------+
+    | Signature     | Four byte signature value, typically: "8BIM"                    |
+    +---------------+-----------------------------------------------------------------+
+    | Resource ID   | Two byte resource identifier value: 0xXXXX                      |
+    +---------------+-----------------------------------------------------------------+
+    | Name          | Pascal string name, comprising a length byte and the characters |
+    |               | of the name, padded with a NUL byte to an even length if needed |
+    +---------------+-----------------------------------------------------------------+
+    | Data Length   | Four bytes denoting the length of the data that follows         |
+    +---------------+-----------------------------------------------------------------+
+    | Data          | Variable number of bytes of data, padded to an even length      |
+    +---------------+-----------------------------------------------------------------+
+    """
+
+    _signature: bytes = None
+    _id: int = None
+    _name: bytes = None
+    _data: bytes | memoryview = None
+    _offset: int = None
+    _raw: bytes | memoryview = None
+    _header: struct.Struct = struct.Struct(">4sH")
+    _length: struct.Struct = struct.Struct(">I")
+
+    def __init__(
+        self,
+        id: int,
+        data: bytes | memoryview,
+        name: bytes = b"",
+        signature: bytes = b"8BIM",
+        offset: int = None,
+        raw: bytes | memoryview = None,
+    ):
+        if not isinstance(id, int):
+            raise TypeError("The 'id' argument must have an integer value!")
+
+        self._id: int = id
+
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("The 'data' argument must have a bytes value!")
+
+        self._data: bytes | memoryview = data
+
+        if not isinstance(name, bytes):
+            raise TypeError("The 'name' argument must have a bytes value!")
+        elif len(name) > 255:
+            raise ValueError("The 'name' argument must not exceed 255 bytes!")
+
+        self._name: bytes = name
+
+        if not (isinstance(signature, bytes) and len(signature) == 4):
+            raise TypeError("The 'signature' argument must have a four byte value!")
+
+        self._signature: bytes = signature
+
+        if offset is None:
+            pass
+        elif not isinstance(offset, int):
+            raise TypeError(
+                "The 'offset' argument, if specified, must have an integer value!"
+            )
+
+        self._offset: int = offset
+
+        if raw is None:
+            pass
+        elif not isinstance(raw, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                "The 'raw' argument, if specified, must have a bytes value!"
+            )
+
+        self._raw: bytes | memoryview = raw
+
+    def __str__(self) -> str:
+        return f"<Resource(0x{self._id:04x}, {self.name!r}, {self.length})>"
+
+    @property
+    def signature(self) -> bytes:
+        return self._signature
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name.decode("latin-1")
+
+    @property
+    def offset(self) -> int | None:
+        """Return the offset of the resource's data within the payload it was decoded
+        from, if the resource was decoded from a payload."""
+
+        return self._offset
+
+    @property
+    def length(self) -> int:
+        return len(self._data)
+
+    @property
+    def data(self) -> bytes | memoryview:
+        """Return the resource's data, which for decoded resources is a zero-copy slice
+        of the payload the resource was decoded from, until the resource is detached."""
+
+        return self._data
+
+    def detach(self) -> Resource:
+        """Copy the resource's data from the payload that it was decoded from, so that
+        the resource no longer references the payload, which may be memory mapped."""
+
+        if isinstance(self._data, memoryview):
+            self._data = self._data.tobytes()
+
+        if isinstance(self._raw, memoryview):
+            self._raw = self._raw.tobytes()
+
+        return self
+
+    def size(self, length: int = None) -> int:
+        """Return the encoded size of the resource in bytes, including its padding, for
+        data of the specified length, or if no length is specified, for the resource's
+        original encoded bytes, if available, or otherwise for the resource's data."""
+
+        if length is None:
+            if not self._raw is None:
+                return len(self._raw)
+
+            length = len(self._data)
+
+        return (
+            self._header.size
+            + 1
+            + len(self._name)
+            + ((len(self._name) + 1) % 2)
+            + self._length.size
+            + length
+            + (length % 2)
+        )
+
+    def pack_header_into(self, buffer: bytearray, offset: int, length: int) -> int:
+        """Write the resource's header for data of the specified length into the buffer
+        at the specified offset, returning the offset at which the data should follow.
+        The buffer is expected to be zero-filled, so the padding is not written."""
+
+        self._header.pack_into(buffer, offset, self._signature, self._id)
+
+        offset += self._header.size
+
+        # The name is encoded as a Pascal string, padded to an even length
+        buffer[offset] = len(self._name)
+        buffer[offset + 1 : offset + 1 + len(self._name)] = self._name
+
+        offset += 1 + len(self._name) + ((len(self._name) + 1) % 2)
+
+        self._length.pack_into(buffer, offset, length)
+
+        return offset + self._length.size
+
+    def pack_into(self, buffer: bytearray, offset: int) -> int:
+        """Write the resource into the buffer at the specified offset, copying the
+        resource's original encoded bytes if available, returning the offset at which
+        the resource ends, including its padding."""
+
+        if not self._raw is None:
+            buffer[offset : offset + len(self._raw)] = self._raw
+
+            return offset + len(self._raw)
+
+        length: int = len(self._data)
+
+        offset = self.pack_header_into(buffer, offset, length)
+
+        buffer[offset : offset + length] = self._data
+
+        return offset + length + (length % 2)
+
+    def encode(self, data: bytes | bytearray | memoryview = None) -> bytes:
+        """Encode the resource, reusing the resource's original encoded bytes unless
+        replacement data has been provided, in which case the resource is re-encoded."""
+
+        if data is None:
+            encoded: bytearray = bytearray(self.size())
+
+            self.pack_into(encoded, 0)
+        else:
+            encoded: bytearray = bytearray(self.size(len(data)))
+
+            offset: int = self.pack_header_into(encoded, 0, len(data))
+
+            encoded[offset : offset + len(data)] = data
+
+        return bytes(encoded)
+
+
+class Resources(object):
+    """The Resources class holds an index of the image resource blocks held within an
+    APP13 payload, in the order that they were encoded, so that individual resources can
+    be accessed without decoding the other resources, and so that the resources which
+    the library does not decode can be passed through unmodified when re-encoding."""
+
+    # The signatures that image resource blocks have been known to use
+    signatures: tuple[bytes] = (b"8BIM", b"PHUT", b"AgHg", b"DCSR", b"MeSa")
+
+    _resources: list[Resource] = None
+
+    def __init__(self):
+        self._resources: list[Resource] = []
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __iter__(self) -> typing.Generator[Resource, None, None]:
+        for resource in self._resources:
+            yield resource
+
+    def __contains__(self, id: int) -> bool:
+        return not self.resource(id) is None
+
+    @property
+    def resources(self) -> list[Resource]:
+        return self._resources
+
+    def resource(self, id: int) -> Resource | None:
+        """Return the first resource with the specified resource ID, if present."""
+
+        for resource in self._resources:
+            if resource.id == id:
+                return resource
+
+    def detach(self) -> Resources:
+        """Detach each of the resources from the payload they were decoded from."""
+
+        for resource in self._resources:
+            resource.detach()
+
+        return self
+
+    @classmethod
+    def seek(
+        cls, handle: typing.BinaryIO, id: int, offset: int, end: int
+    ) -> tuple[int, int] | None:
+        """Find the image resource with the specified resource ID within the resource
+        blocks held by the file handle between the specified offsets, such as following
+        the APP13 "Photoshop 3.0" prefix, returning the offset and length of its data.
+        Only the resource headers are read; the data of other resources is skipped."""
+
+        while offset + 12 <= end:
+            handle.seek(offset)
+
+            header: bytes = handle.read(7)
+
+            if len(header) < 7:
+                break
+
+            (signature, identifier) = Resource._header.unpack_from(header, 0)
+
+            if not signature in cls.signatures:
+                logger.debug(
+                    "%s.seek() Unknown resource signature %r at offset %d",
+                    cls.__name__,
+                    signature,
+                    offset,
+                )
+                break
+
+            count: int = header[6]
+
+            # The name length byte and the name characters are padded to an even length
+            offset += 6 + count + 1 + ((count + 1) % 2)
+
+            if offset + 4 > end:
+                break
+
+            handle.seek(offset)
+
+            (length,) = Resource._length.unpack(handle.read(4))
+
+            offset += 4
+
+            following: int = offset + length + (length % 2)
+
+            if identifier == id:
+                # Some encoders, including earlier versions of this library, recorded an
+                # incorrect length for the IPTC resource; if the length does not lead to
+                # another resource, the resource is taken to extend to the end of the data:
+                if following < end:
+                    handle.seek(following)
+
+                    if not handle.read(4) in cls.signatures:
+                        length = end - offset
+
+                return (offset, min(length, end - offset))
+
+            offset = following
+
+        return None
+
+    @classmethod
+    def decode(cls, value: bytes | memoryview, offset: int = 0) -> Resources:
+        """Decode the index of image resource blocks held in the provided buffer from
+        the specified offset, such as following the APP13 "Photoshop 3.0" prefix. The
+        resource data is held as zero-copy slices of the buffer, and is not decoded."""
+
+        view: memoryview = value if isinstance(value, memoryview) else memoryview(value)
+
+        if not view.format == "B":
+            view = view.cast("B")
+
+        resources = Resources()
+
+        end: int = len(view)
+
+        while offset + 12 <= end:
+            start: int = offset
+
+            (signature, id) = Resource._header.unpack_from(view, offset)
+
+            if not signature in cls.signatures:
+                logger.debug(
+                    "%s.decode() Unknown resource signature %r at offset %d",
+                    cls.__name__,
+                    signature,
+                    offset,
+                )
+                break
+
+            count: int = view[offset + 6]
+
+            name: bytes = view[offset + 7 : offset + 7 + count].tobytes()
+
+            # The name length byte and the name characters are padded to an even length
+            offset += 6 + count + 1 + ((count + 1) % 2)
+
+            if offset + 4 > end:
+                break
+
+            (length,) = Resource._length.unpack_from(view, offset)
+
+            offset += 4
+
+            following: int = offset + length + (length % 2)
+
+            # Some encoders, including earlier versions of this library, recorded an
+            # incorrect length for the IPTC resource; if the length does not lead to
+            # another resource, the IPTC resource is taken to extend to the end of the
+            # data, while other resources retain their recorded length, so that any
+            # trailing padding or data is not absorbed into them
+            if following < end and not (
+                view[following : following + 4].tobytes() in cls.signatures
+            ):
+                if id == 0x0404:
+                    length = end - offset
+                    following = end
+                elif any(view[following:end]):
+                    logger.warning(
+                        "%s.decode() The length of resource 0x%04x does not lead to another resource; %d bytes following it will be ignored!",
+                        cls.__name__,
+                        id,
+                        end - following,
+                    )
+
+            length = min(length, end - offset)
+
+            resources._resources.append(
+                Resource(
+                    id=id,
+                    name=name,
+                    signature=signature,
+                    data=view[offset : offset + length],
+                    offset=offset,
+                    raw=view[start : min(following, end)],
+                )
+            )
+
+            offset = following
+
+        return resources
+
+
 class Records(object):
     """The IPTC class represents the IPTC metadata container.
 
@@ -52,16 +433,145 @@ class Records(object):
         self._records.append(record)
 
     def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
-        encoded: list[bytes] = []
+        # Encode each record's value once, so that the exact size of the encoded records
+        # is known before the records are written into a single preallocated buffer
+        encoded: list[tuple[RecordID, bytes]] = [
+            (record.id, record.value.encode(order=order)) for record in self._records
+        ]
+
+        buffer: bytearray = bytearray(
+            sum(Record.size(len(data)) for (id, data) in encoded)
+        )
+
+        offset: int = 0
 
-        for record in self._records:
-            encoded.append(record.encode(order=order))
+        for id, data in encoded:
+            offset = Record.pack_into(buffer, offset, id=id, data=data)
 
-        return b"".join(encoded)
+        return bytes(buffer)
 
     @classmethod
-    def decode(cls, value: bytes, order: ByteOrder = ByteOrder.MSB) -> Records:
-        raise NotImplementedError
+    def scan(
+        cls, value: bytes | bytearray | memoryview, offset: int = 0
+    ) -> typing.Generator[tuple[int, int, int, int, int], None, None]:
+        """Scan the IPTC records held in the provided buffer without copying or decoding
+        them, yielding the record number, dataset number, offset of the start of each
+        record, the offset of the start of its data, and the length of its data, so that
+        the record's data can be accessed as a zero-copy slice of the buffer. Any bytes
+        between records, such as trailing padding, are skipped."""
+
+        view: memoryview = value if isinstance(value, memoryview) else memoryview(value)
+
+        if not view.format == "B":
+            view = view.cast("B")
+
+        end: int = len(view)
+
+        while offset + 5 <= end:
+            if not view[offset] == 0x1C:
+                offset += 1
+                continue
+
+            start: int = offset
+
+            (record_id, dataset_id, length) = Record._header.unpack_from(
+                view, offset + 1
+            )
+
+            offset += 5
+
+            # If the high bit of the length is set, the remaining bits denote the count
+            # of bytes that follow which hold the length of the data, such as 0x8004
+            if length & 0x8000:
+                count: int = length & 0x7FFF
+
+                if offset + count > end:
+                    raise ValueError(
+                        "The IPTC record at offset %d has a truncated length!" % (start)
+                    )
+
+                length = int.from_bytes(view[offset : offset + count], "big")
+
+                offset += count
+
+            if offset + length > end:
+                raise ValueError(
+                    "The IPTC record at offset %d has a length (%d) exceeding the data!"
+                    % (start, length)
+                )
+
+            yield (record_id, dataset_id, start, offset, length)
+
+            offset += length
+
+    @classmethod
+    def read(
+        cls, handle: typing.BinaryIO, offset: int, end: int
+    ) -> typing.Generator[tuple[int, int, int, int, int], None, None]:
+        """Read the IPTC record headers held by the file handle between the specified
+        offsets incrementally, yielding the same values as the scan() method, without
+        reading the records' data, so that the caller can read just the records needed.
+        The file handle is repositioned before each read, so the caller may read from
+        the file handle between iterations."""
+
+        while offset + 5 <= end:
+            handle.seek(offset)
+
+            header: bytes = handle.read(5)
+
+            if len(header) < 5:
+                break
+
+            if not header[0] == 0x1C:
+                offset += 1
+                continue
+
+            start: int = offset
+
+            (record_id, dataset_id, length) = Record._header.unpack_from(header, 1)
+
+            offset += 5
+
+            # If the high bit of the length is set, the remaining bits denote the count
+            # of bytes that follow which hold the length of the data, such as 0x8004
+            if length & 0x8000:
+                count: int = length & 0x7FFF
+
+                if offset + count > end:
+                    raise ValueError(
+                        "The IPTC record at offset %d has a truncated length!" % (start)
+                    )
+
+                length = int.from_bytes(handle.read(count), "big")
+
+                offset += count
+
+            if offset + length > end:
+                raise ValueError(
+                    "The IPTC record at offset %d has a length (%d) exceeding the data!"
+                    % (start, length)
+                )
+
+            yield (record_id, dataset_id, start, offset, length)
+
+            offset += length
+
+    @classmethod
+    def decode(
+        cls, value: bytes | bytearray | memoryview, order: ByteOrder = ByteOrder.MSB
+    ) -> Records:
+        """Decode the IPTC records held in the provided buffer, passing zero-copy slices
+        of the buffer to the Record class for decoding."""
+
+        view: memoryview = value if isinstance(value, memoryview) else memoryview(value)
+
+        records = Records()
+
+        for record_id, dataset_id, start, offset, length in cls.scan(view):
+            if record := Record.decode(view[start : offset + length], order=order):
+                records.record = record
+
+        return records
 
 
 class Record(object):
@@ -90,6 +600,8 @@ class Record(object):
     _id: RecordID = None
     _value: Value = None
     _level: int = 0
+    _header: struct.Struct = struct.Struct(">BBH")
+    _extended: struct.Struct = struct.Struct(">BBBHI")
 
     def __init__(self, id: RecordID, value: Value):
         if not isinstance(id, RecordID):
@@ -124,45 +636,92 @@ class Record(object):
     def length(self) -> UInt:
         return UInt(len(self._value))
 
-    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
-        logger.debug("%s.encode(order: %s)" % (self.__class__.__name__, order))
+    @classmethod
+    def size(cls, length: int) -> int:
+        """Return the encoded size of a record in bytes for data of the specified length,
+        accounting for the extended length encoding used for data of 0x8000+ bytes."""
+
+        if length < 0x8000:
+            return cls._header.size + 1 + length
+        else:
+            return cls._extended.size + length
 
-        encoded: list[bytes] = []
+    @classmethod
+    def pack_into(
+        cls,
+        buffer: bytearray,
+        offset: int,
+        id: RecordID,
+        data: bytes | memoryview,
+    ) -> int:
+        """Write a record for the specified record ID and encoded data into the buffer
+        at the specified offset, returning the offset at which the record ends. IPTC-IIM
+        record headers are always encoded in big-endian (MSB) byte order."""
+
+        length: int = len(data)
+
+        if length < 0x8000:
+            buffer[offset] = 0x1C
+
+            cls._header.pack_into(
+                buffer,
+                offset + 1,
+                int(id.record_id),
+                int(id.dataset_id),
+                length,
+            )
 
-        # Each IPTC record is denoted with an 0x1c byte
-        encoded.append(bytes([0x1C]))
+            offset += cls._header.size + 1
+        else:
+            cls._extended.pack_into(
+                buffer,
+                offset,
+                0x1C,
+                int(id.record_id),
+                int(id.dataset_id),
+                0x8004,
+                length,
+            )
 
-        # This is followed by the record ID tag
-        encoded.append(self.id.record_id.encode(order=order))
+            offset += cls._extended.size
 
-        # This is followed by the dataset ID
-        encoded.append(self.id.dataset_id.encode(order=order))
+        buffer[offset : offset + length] = data
 
-        # This is followed by the encoded length of the data value
-        if self.length < 0x8000:
-            encoded.append(UInt16(self.length).encode(order=order))
-        else:
-            encoded.append(bytes([0x80, 0x04]))
-            encoded.append(UInt32(self.length).encode(order=order))
+        return offset + length
+
+    def encode(self, order: ByteOrder = ByteOrder.MSB) -> bytes:
+        logger.debug("%s.encode(order: %s)" % (self.__class__.__name__, order))
+
+        data: bytes = self.value.encode(order=order)
+
+        encoded: bytearray = bytearray(self.size(len(data)))
 
-        # This is followed by the encoded data
-        encoded.append(self.value.encode(order=order))
+        self.pack_into(encoded, 0, id=self.id, data=data)
 
-        # TODO: Can this be simplified with say bytes(bytearray(encoded))?
-        return b"".join(encoded)
+        return bytes(encoded)
 
     @classmethod
-    def decode(cls, value: bytes) -> Record:
-        if not isinstance(value, bytes):
+    def decode(
+        cls, value: bytes | memoryview, order: ByteOrder = ByteOrder.MSB
+    ) -> Record:
+        if isinstance(value, (bytes, bytearray)):
+            value = memoryview(value)
+        elif not isinstance(value, memoryview):
             raise TypeError("The 'value' argument must have a bytes value!")
 
-        if not value[0] == 0x1C:
+        if not (len(value) >= 5 and value[0] == 0x1C):
             raise ValueError(
                 "The 'value' does not begin with the expected 0x1c IPTC record marker!"
             )
 
-        record_id: UInt8 = UInt8(int(value[1]))
-        dataset_id: UInt8 = UInt8(int(value[2]))
+        # IPTC-IIM record headers are always encoded in big-endian (MSB) byte order
+        (record_id, dataset_id, length) = cls._header.unpack_from(value, 1)
+
+        from exifdata.models.iptc import IPTC
+
+        # Ensure the fields of the record's namespace have been created, so that their
+        # RecordID enumeration options have been registered and can be reconciled
+        IPTC.namespace_by_record_id(record_id)
 
         if not isinstance(
             id := RecordID.reconcile(record_id=record_id, dataset_id=dataset_id),
@@ -181,15 +740,6 @@ class Record(object):
             id.type,
         )
 
-        from exifdata.models.iptc import IPTC
-
-        # if not id.type in locals():
-        #     raise ValueError(
-        #         f"The 'Value' subclass, '{id.type}', associated with '{id}' cannot be found in the current scope!"
-        #     )
-
-        # klass = locals()[id.value.type]
-
         if not isinstance(klass := IPTC.type_by_name(id.type), type):
             raise ValueError(
                 f"The 'Value' subclass, '{id.type}', associated with '{id}' has not been registered with the 'IPTC' metadata class!"
@@ -200,38 +750,26 @@ class Record(object):
                 f"The subclass, '{id.type}', associated with '{id}' is not a 'Value' subclass!"
             )
 
-        length: Int16 = Int16.decode(value[3 : 3 + 2], order=ByteOrder.MSB)
+        # For values of 0x8000 (32,768) bytes or longer, the high bit of the length is
+        # set and the remaining bits note the count of bytes that follow which hold the
+        # length of the value; typically this is the special marker 0x80 0x04 noting the
+        # length is encoded into the four bytes that follow as a 32-bit unsigned integer
+        # so the data section is offset from the start of the record by those bytes too:
+        offset: int = 5
 
-        offset: int = 0
+        if length & 0x8000:
+            count: int = length & 0x7FFF
 
-        # logger.debug("length[0] => 0x%02x, length[1] => 0x%02x" % (length[0], length[1]))
-
-        # For values longer than 0x8000 (32,768) bytes, the length is prefixed by the
-        # special fixed marker 0x80 0x04 to note that the length that follows is encoded
-        # into four bytes as an signed 32 bit integer, as 32,767 is the largest number
-        # that can fit into a signed 16 bit integer; as such the data section is offset
-        # by an additional four bytes from the start of the record (two bytes for the
-        # special fixed marker and the two additional bytes of the 32 bit unsigned int):
-        if length[0] == 0x80 and length[1] == 0x04:
-            length: Int32 = Int32(value[5 : 5 + 2])
-            # For records with a length more than or equal to 0x8000 (32, 768) bytes,
-            # the preamble of the record is one byte for the record ID, one byte for the
-            # dataset ID, the two byte fixed marker denoting the four byte length, then
-            # the length encoded as four bytes, then the remainder of the bytes are the
-            # value; thus the combined length of the preamble is eight bytes:
-            offset = 9
-        else:
-            # For records with a length less than 0x8000 (32,768) bytes, the preamble of
-            # the record is one byte for the record ID, one byte for the dataset ID, two
-            # bytes for the length, then the remainder of the bytes are the value; thus
-            # the combined length of the preamble is four bytes (one + one + two)
-            offset = 5
+            length = int.from_bytes(value[offset : offset + count], "big")
+
+            offset += count
 
-        if not len(value[offset:]) == length:
+        if not len(value) - offset == length:
             raise ValueError(
-                f"The raw data length ({len(value[offset:])}) does not match the expected length ({length})!"
+                f"The raw data length ({len(value) - offset}) does not match the expected length ({length})!"
             )
 
+        # The value is decoded from a zero-copy slice of the raw record
         record = Record(id=id, value=klass.decode(value[offset:]))
 
         logger.debug("%s.decode() record.value => %r", cls.__name__, record.value)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import unicodedata
-
 from exifdata.logging import logger
 
 from exifdata.framework import (
     Value,
+    Transliterator,
 )
 
 from deliciousbytes import (
@@ -27,8 +26,10 @@ class Value(Value):
 
 class Short(UnsignedShort, Value):
     @classmethod
-    def decode(cls, value: bytes, **kwargs) -> Short:
-        if not isinstance(value, bytes):
+    def decode(cls, value: bytes | memoryview, **kwargs) -> Short:
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        elif not isinstance(value, bytes):
             raise TypeError("The 'value' argument must have a 'bytes' value!")
 
         return Short(Int.decode(value, **kwargs))
@@ -36,8 +37,10 @@ class Short(UnsignedShort, Value):
 
 class Long(UnsignedLong, Value):
     @classmethod
-    def decode(cls, value: bytes, **kwargs) -> Long:
-        if not isinstance(value, bytes):
+    def decode(cls, value: bytes | memoryview, **kwargs) -> Long:
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        elif not isinstance(value, bytes):
             raise TypeError("The 'value' argument must have a 'bytes' value!")
 
         return Long(Int.decode(value, **kwargs))
@@ -50,6 +53,8 @@ class String(String, Value):
         # the traditionally used ASCII-compatible "(c)" replacement:
         "©": "(c)",
     }
+    _transliterator: Transliterator = Transliterator(_replacements)
+    _encoded: tuple[int, bytes] = None
 
     def __new__(cls, value: str, **kwargs):
         # As the String class from deliciousbytes subclasses 'str' we can only pass the
@@ -84,7 +89,7 @@ class String(String, Value):
                     "The 'replacement' argument must contain an ASCII-compatible string value!"
                 )
 
-        cls._replacements[search] = replacement
+        cls._transliterator.add(search=search, replacement=replacement)
 
     def __len__(self) -> int:
         """Return the length of the encoded string to ensure any normalisation or string
@@ -98,22 +103,22 @@ class String(String, Value):
                 "The %s class does not have a string value!" % (self.__class__.__name__)
             )
 
-        # Normalise non-ASCII characters where possible to their closest ASCII equivalents
-        value = unicodedata.normalize("NFKD", value)
-
-        # Filter out the combining characters from the expanded form, such as diacritics
-        value = "".join([char for char in value if not unicodedata.combining(char)])
+        # Reuse the encoded value if the string has already been encoded, such as when
+        # the length of the value was determined, unless the replacements have changed
+        if not (encoded := self._encoded) is None:
+            if encoded[0] == self._transliterator.generation:
+                return encoded[1]
 
-        # Check the string value for the presence of any of the search strings; if
-        # one or more are found, replace them with their replacements before encoding;
+        # Normalise non-ASCII characters where possible to their closest ASCII equivalents
+        # removing any combining characters, such as diacritics, and replace any of the
+        # search strings with their replacements, via the compiled transliteration table;
         # to avoid replacements reformatted strings can be provided that are ASCII-only:
-        for search, replacement in self.__class__._replacements.items():
-            value = value.replace(search, replacement)
+        value = self._transliterator.transliterate(value)
 
         # Encode the source string, replacing any other characters outside of the ASCII
         # range with a "?" placeholder to indicate the presence of a character that was
         # supplied to the method but should not have been present in an ASCII string:
-        encoded: bytes = value.encode("ASCII", errors="replace")
+        encoded: bytes = str.encode(value, "ASCII", errors="replace")
 
         # IPTC-IIM strings do not need to end with a NUL byte as the length is provided
         # as part of the encoding of the record, immediately before the string value, so
@@ -126,11 +131,15 @@ class String(String, Value):
             # encoded = bytes(reversed(bytearray(encoded)))
             pass
 
+        self._encoded = (self._transliterator.generation, encoded)
+
         return encoded
 
     @classmethod
-    def decode(cls, value: bytes, order: ByteOrder = ByteOrder.MSB) -> String:
-        if not isinstance(value, bytes):
+    def decode(
+        cls, value: bytes | memoryview, order: ByteOrder = ByteOrder.MSB
+    ) -> String:
+        if not isinstance(value, (bytes, memoryview)):
             raise TypeError("The 'value' argument must have a bytes value!")
 
         # Byte order is not relevant for data types that have individual values which
@@ -139,9 +148,11 @@ class String(String, Value):
             # value = bytes(reversed(bytearray(value)))
             pass
 
+        # The string is decoded directly from the buffer, which may be a memoryview
+        # slice of a larger payload, so that the string data does not need to be copied
         try:
-            decoded: str = value.decode("ASCII")
+            decoded: str = str(value, "ASCII")
         except UnicodeError:
-            decoded: str = value.decode("UTF-8")
+            decoded: str = str(value, "UTF-8")
 
         return String(value=decoded)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import json
 import maxml
 
 from exifdata.logging import logger
@@ -11,6 +10,7 @@ from exifdata.framework import (
     Metadata,
     Type,
     Namespace,
+    Schema,
     Structure,
     Value,
 )
@@ -85,11 +85,19 @@ class XMP(Metadata):
         if cls._setup is True:
             return super().__new__(cls)
 
-        with open(
-            os.path.join(os.path.dirname(__file__), "data", "schema.json"), "r"
-        ) as handle:
+        schema = Schema(
+            filepath=os.path.join(os.path.dirname(__file__), "data", "schema.json")
+        )
+
+        # If a precompiled copy of the schema is available, restore the namespaces,
+        # structures and aliases from it rather than rebuilding them from the schema:
+        if isinstance(cached := schema.load(), dict):
+            cls._namespaces = cached["namespaces"]
+            cls._structures = cached["structures"]
+            cls._aliases = cached["aliases"]
+        else:
             # Ensure the model configuration file is valid
-            if not isinstance(namespacesdata := json.load(handle), dict):
+            if not isinstance(namespacesdata := schema.parse(), dict):
                 raise TypeError("The 'namespaces' dictionary isn't valid!")
 
             # Dynamically create the model namespaces based on the provided configuration
@@ -128,33 +136,32 @@ class XMP(Metadata):
                         **namespacedata,  # pass the properties via dictionary expansion
                     )
 
-                    # Now iterate over the fields and add them to the relevant namespace
-                    for fieldid, fielddata in fieldsdata.items():
-                        # logger.debug("  - Field: %s (%s)" % (fieldid, fielddata.get("name")))
+                    # Defer the creation of the fields until the namespace is first used
+                    namespace.defer(Field, fieldsdata)
 
-                        namespace.field = field = Field(
-                            namespace=namespace,
-                            identifier=fieldid,
-                            **fielddata,  # pass the properties via dictionary expansion
-                        )
+            schema.save(
+                namespaces=cls._namespaces,
+                structures=cls._structures,
+                aliases=cls._aliases,
+            )
 
-            # Define the required top-level document namespaces
-            namespaces = {
-                # "x": "adobe:ns:meta/",
-                "xmlns": "http://ns.adobe.com/xmlns/1.0",
-                # "rdf":   "http://ns.adobe.com/rdf/1.0",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            }
+        # Define the required top-level document namespaces
+        namespaces = {
+            # "x": "adobe:ns:meta/",
+            "xmlns": "http://ns.adobe.com/xmlns/1.0",
+            # "rdf":   "http://ns.adobe.com/rdf/1.0",
+            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+        }
 
-            # maxml.Element.register_namespace("rdf", "http://www.w3.org/1999/02/22-rdf-syntax-ns#")
+        # maxml.Element.register_namespace("rdf", "http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 
-            # Register the required top-level document namespaces
-            for prefix, uri in namespaces.items():
-                maxml.Element.register_namespace(prefix, uri, promoted=True)
+        # Register the required top-level document namespaces
+        for prefix, uri in namespaces.items():
+            maxml.Element.register_namespace(prefix, uri, promoted=True)
 
-            # Register the required document schema namespaces, sourced from configuration
-            for namespace in cls._namespaces.values():
-                maxml.Element.register_namespace(namespace.prefix, namespace.uri)
+        # Register the required document schema namespaces, sourced from configuration
+        for namespace in cls._namespaces.values():
+            maxml.Element.register_namespace(namespace.prefix, namespace.uri)
 
         cls._setup = True
 
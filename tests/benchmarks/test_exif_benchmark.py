@@ -0,0 +1,179 @@
+import struct
+import time
+
+from exifdata.models.exif import EXIF
+
+
+def payload() -> bytes:
+    """Assemble a big-endian APP1 payload resembling that of a typical camera, holding
+    IFD0, the EXIF and GPS IFDs, a 12KB maker note, and IFD1 with an 8KB thumbnail."""
+
+    tags: dict[str, list[tuple[int, int, int, bytes]]] = {
+        "IFD0": [
+            (0x010F, 2, 6, b"Canon\x00"),
+            (0x0110, 2, 13, b"Canon EOS R5\x00"),
+            (0x0112, 3, 1, struct.pack(">H", 1)),
+            (0x011A, 5, 1, struct.pack(">II", 72, 1)),
+            (0x011B, 5, 1, struct.pack(">II", 72, 1)),
+            (0x0128, 3, 1, struct.pack(">H", 2)),
+            (0x0131, 2, 10, b"Firmware1\x00"),
+            (0x0132, 2, 20, b"2025:01:01 12:00:00\x00"),
+            (0x013B, 2, 7, b"Author\x00"),
+            (0x8298, 2, 10, b"Copyright\x00"),
+        ],
+        "EXIF": [
+            (0x829A, 5, 1, struct.pack(">II", 1, 250)),
+            (0x829D, 5, 1, struct.pack(">II", 28, 10)),
+            (0x8822, 3, 1, struct.pack(">H", 3)),
+            (0x8827, 3, 1, struct.pack(">H", 400)),
+            (0x9000, 7, 4, b"0231"),
+            (0x9003, 2, 20, b"2025:01:01 12:00:00\x00"),
+            (0x9004, 2, 20, b"2025:01:01 12:00:00\x00"),
+            (0x9201, 10, 1, struct.pack(">ii", 8, 1)),
+            (0x9202, 5, 1, struct.pack(">II", 3, 1)),
+            (0x9204, 10, 1, struct.pack(">ii", 0, 1)),
+            (0x9207, 3, 1, struct.pack(">H", 5)),
+            (0x9209, 3, 1, struct.pack(">H", 16)),
+            (0x920A, 5, 1, struct.pack(">II", 50, 1)),
+            (0x927C, 7, 12288, bytes(12288)),
+            (0xA001, 3, 1, struct.pack(">H", 1)),
+            (0xA002, 4, 1, struct.pack(">I", 8192)),
+            (0xA003, 4, 1, struct.pack(">I", 5464)),
+            (0xA402, 3, 1, struct.pack(">H", 0)),
+            (0xA403, 3, 1, struct.pack(">H", 0)),
+            (0xA406, 3, 1, struct.pack(">H", 0)),
+        ],
+        "GPS": [
+            (0x0000, 1, 4, bytes([2, 3, 0, 0])),
+            (0x0001, 2, 2, b"N\x00"),
+            (0x0002, 5, 3, struct.pack(">IIIIII", 51, 1, 30, 1, 0, 1)),
+            (0x0003, 2, 2, b"W\x00"),
+            (0x0004, 5, 3, struct.pack(">IIIIII", 0, 1, 7, 1, 0, 1)),
+        ],
+        "IFD1": [
+            (0x0103, 3, 1, struct.pack(">H", 6)),
+            (0x0201, 4, 1, b""),  # Patched below with the thumbnail offset
+            (0x0202, 4, 1, struct.pack(">I", 8192)),
+        ],
+    }
+
+    # Add the pointer tags for the EXIF and GPS IFDs, patched below with their offsets
+    tags["IFD0"] += [(0x8769, 4, 1, b""), (0x8825, 4, 1, b"")]
+
+    offsets: dict[str, int] = {}
+
+    offset: int = 8
+
+    # Lay out each IFD followed by its out-of-line data, word aligned
+    for name, entries in tags.items():
+        offsets[name] = offset
+
+        offset += 2 + len(entries) * 12 + 4
+
+        for tagid, type, count, data in entries:
+            if len(data) > 4:
+                offset += len(data) + (len(data) % 2)
+
+    thumbnail: int = offset
+
+    encoded = bytearray(b"MM" + struct.pack(">HI", 42, 8))
+
+    for index, (name, entries) in enumerate(tags.items()):
+        data: bytearray = bytearray()
+
+        following: int = offsets[name] + 2 + len(entries) * 12 + 4
+
+        encoded += struct.pack(">H", len(entries))
+
+        for tagid, type, count, value in entries:
+            if tagid == 0x8769:
+                value = struct.pack(">I", offsets["EXIF"])
+            elif tagid == 0x8825:
+                value = struct.pack(">I", offsets["GPS"])
+            elif tagid == 0x0201:
+                value = struct.pack(">I", thumbnail)
+
+            if len(value) > 4:
+                encoded += struct.pack(">HHII", tagid, type, count, following)
+                data += value + bytes(len(value) % 2)
+                following += len(value) + (len(value) % 2)
+            else:
+                encoded += struct.pack(">HHI", tagid, type, count)
+                encoded += value + bytes(4 - len(value))
+
+        # Only IFD0 links to the next IFD, IFD1
+        encoded += struct.pack(">I", offsets["IFD1"] if name == "IFD0" else 0)
+        encoded += data
+
+    encoded += bytes(8192)
+
+    return b"Exif\x00\x00" + bytes(encoded)
+
+
+def test_benchmark_exif_decode():
+    """Benchmark decoding a typical camera APP1 payload, both when only scanning the
+    IFDs and when every decoded value is accessed. Run with 'pytest -s' to see the
+    timings reported for the current environment."""
+
+    data: bytes = payload()
+
+    runs: int = 25
+
+    scanned: list[float] = []
+    accessed: list[float] = []
+
+    for run in range(runs):
+        started = time.perf_counter()
+
+        decoded = EXIF.decode(data)
+
+        scanned.append((time.perf_counter() - started) * 1000)
+
+        assert list(decoded._ifds.keys()) == ["IFD0", "EXIF", "GPS", "IFD1"]
+
+        values = list(decoded._values.values())
+
+        accessed.append((time.perf_counter() - started) * 1000)
+
+    assert decoded.exif.Make == "Canon"
+    assert decoded.exif.GPSLatitudeRef == "N"
+    assert len(values) > 30
+
+    scanned.sort()
+    accessed.sort()
+
+    print(
+        "\nEXIF decode of a %.1fKB APP1 payload (median of %d): %.3fms scanned, %.3fms accessed"
+        % (len(data) / 1024, runs, scanned[runs // 2], accessed[runs // 2])
+    )
+
+
+def test_benchmark_exif_thumbnail():
+    """Benchmark extracting the IFD1 thumbnail from a typical camera APP1 payload,
+    which only requires IFD0 and IFD1 to be scanned. Run with 'pytest -s' to see the
+    timings reported for the current environment."""
+
+    data: bytes = payload()
+
+    runs: int = 25
+
+    timings: list[float] = []
+
+    for run in range(runs):
+        started = time.perf_counter()
+
+        thumbnail = EXIF.extract_thumbnail(data)
+
+        timings.append((time.perf_counter() - started) * 1000)
+
+    assert isinstance(thumbnail, memoryview)
+    assert len(thumbnail) == 8192
+
+    assert thumbnail == EXIF.decode(data).thumbnail
+
+    timings.sort()
+
+    print(
+        "\nEXIF thumbnail extraction of a %.1fKB APP1 payload (median of %d): %.1fus"
+        % (len(data) / 1024, runs, timings[runs // 2] * 1000)
+    )
@@ -0,0 +1,56 @@
+import time
+
+from exifdata.models.iptc import IPTC, IPTCFormat
+from exifdata.models.iptc.structures import Records
+
+from deliciousbytes import ByteOrder
+
+
+def payload(count: int) -> bytes:
+    """Assemble a RAW IPTC payload holding the specified number of Keywords records."""
+
+    records: list[bytes] = [bytes.fromhex("1c020000020004")]
+
+    for index in range(count - 1):
+        keyword: bytes = b"keyword%04d" % (index)
+
+        records.append(bytes([0x1C, 0x02, 0x19, 0x00, len(keyword)]) + keyword)
+
+    return b"".join(records)
+
+
+def test_benchmark_iptc_encode():
+    """Benchmark encoding decoded IPTC models holding 10, 100 and 1000 records, where
+    one field has been assigned, in both the APP13 and RAW formats. Run with 'pytest -s'
+    to see the timings reported for the current environment."""
+
+    runs: int = 25
+
+    for count in (10, 100, 1000):
+        for format in (IPTCFormat.APP13, IPTCFormat.RAW):
+            iptc = IPTC.decode(
+                payload(count), order=ByteOrder.MSB, format=IPTCFormat.RAW
+            )
+
+            iptc.application.ObjectName = "Benchmark"
+
+            timings: list[float] = []
+
+            for run in range(runs):
+                started = time.perf_counter()
+
+                encoded = iptc.encode(order=ByteOrder.MSB, format=format)
+
+                timings.append((time.perf_counter() - started) * 1000)
+
+            assert len(encoded) % 4 == 0
+
+            if format is IPTCFormat.RAW:
+                assert len(list(Records.scan(encoded))) == count + 1
+
+            timings.sort()
+
+            print(
+                "\nIPTC encode of %d records (%s, median of %d): %.3fms"
+                % (count + 1, format.name, runs, timings[runs // 2])
+            )
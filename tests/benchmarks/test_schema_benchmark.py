@@ -0,0 +1,67 @@
+import os
+import sys
+import subprocess
+
+# The script run in a fresh interpreter to measure the cold first-model creation time
+script: str = """
+import time
+
+from exifdata import EXIF, IPTC, XMP
+
+started = time.perf_counter()
+
+for model in (EXIF, IPTC, XMP):
+    model()
+
+print("%.3f" % ((time.perf_counter() - started) * 1000))
+"""
+
+
+def measure(cache: str) -> float:
+    """Measure the cold first-model creation time in milliseconds in a new process."""
+
+    environment: dict[str, str] = dict(
+        os.environ,
+        EXIFDATA_CACHE=cache,
+        PYTHONPATH=os.path.join(os.path.dirname(__file__), "..", "..", "source"),
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=environment,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return float(result.stdout.strip())
+
+
+def test_benchmark_schema_cold_start(tmp_path):
+    """Benchmark the cold first-model creation time for the EXIF, IPTC and XMP models
+    before the precompiled schemas have been cached, and after they have been cached.
+    Run with 'pytest -s' to see the timings reported for the current environment."""
+
+    runs: int = 5
+
+    before: list[float] = []
+    after: list[float] = []
+
+    for run in range(runs):
+        cache: str = str(tmp_path / f"cache{run}")
+
+        # The first process builds the models from the schema files, caching them
+        before.append(measure(cache=cache))
+
+        assert len(os.listdir(cache)) == 3
+
+        # The second process restores the models from the cached precompiled schemas
+        after.append(measure(cache=cache))
+
+    before.sort()
+    after.sort()
+
+    print(
+        "\nCold first-model creation (median of %d): %.3fms before, %.3fms after"
+        % (runs, before[runs // 2], after[runs // 2])
+    )
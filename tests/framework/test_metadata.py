@@ -0,0 +1,139 @@
+from exifdata.models.exif import EXIF
+from exifdata.models.iptc import IPTC
+from exifdata.models.xmp import XMP
+
+
+def test_metadata_field_indexes():
+    """Test that fields can be looked up via the class-level field indexes by their
+    identifiers, names, aliases, tag IDs and IPTC record IDs, where the identifiers and
+    names are matched exactly, and the 'names' property case-insensitively."""
+
+    assert isinstance(XMP(), XMP)
+
+    (namespace, field) = XMP.field_by_id("xmp:Label")
+
+    assert namespace.id == "basic"
+    assert field.name == "Label"
+
+    assert XMP.field_by_id("XMP:LABEL") is None
+    assert XMP.field_by_name("label") is None
+    assert XMP.field_by_property(property="names", value="label") == (namespace, field)
+
+    assert XMP.field_by_id("xmp:DoesNotExist") is None
+    assert XMP.field_by_name("DoesNotExist") is None
+
+    assert isinstance(EXIF(), EXIF)
+
+    (namespace, field) = EXIF.field_by_property(property="tagid", value=0x010F)
+
+    assert field.name == "Make"
+
+    assert isinstance(IPTC(), IPTC)
+
+    (namespace, field) = IPTC.field_by_id("application:ObjectName")
+
+    assert IPTC.field_by_property(property="record_id", value=field.record_id) == (
+        namespace,
+        field,
+    )
+
+    # Each model class holds its own indexes
+    assert EXIF.field_by_id("xmp:Label") is None
+
+
+def test_metadata_set_resolution():
+    """Test that values can be set by field name, alias or Field reference, including
+    where the field name is shared by several namespaces and a namespace is specified.
+    """
+
+    xmp = XMP()
+
+    xmp.set(name="xmp:Label", value="Labelled")
+
+    assert xmp.basic.Label == "Labelled"
+
+    # The 'Identifier' field name is held by both the 'basic' and 'dc' namespaces, so
+    # without a namespace restriction the first defined namespace takes precedence
+    xmp.set(name="Identifier", value="ABC")
+
+    assert xmp.basic.Identifier == "ABC"
+
+    xmp.set(name="Identifier", value="XYZ", namespace=XMP._namespaces["dc"])
+
+    assert xmp.dc.Identifier == "XYZ"
+
+    (namespace, field) = XMP.field_by_id("xmp:Rating")
+
+    xmp.set(field=field, value=3)
+
+    assert xmp.basic.Rating == 3
+
+    # A field cannot be set via a namespace that it does not belong to
+    try:
+        xmp.set(field=field, value=4, namespace=XMP._namespaces["dc"])
+    except AttributeError:
+        pass
+    else:
+        assert False, "Expected an AttributeError to be raised!"
+
+
+def test_metadata_field_instance_namespaces():
+    """Test that fields held by namespaces added to a model instance, which are not held
+    by the class-level field indexes, can still be looked up via the model instance."""
+
+    from exifdata.framework import Namespace
+    from exifdata.models.xmp.framework.field import Field
+
+    xmp = XMP()
+
+    namespace = Namespace(identifier="custom", name="Custom", uri="urn:custom:")
+
+    namespace.field = field = Field(
+        namespace=namespace,
+        identifier="custom:Reference",
+        name="Reference",
+        type="Text",
+    )
+
+    xmp.namespace = namespace
+
+    assert xmp.field_by_id("custom:Reference") == (namespace, field)
+    assert xmp.field_by_name("Reference") == (namespace, field)
+    assert xmp.field_by_property(property="names", value="reference") == (
+        namespace,
+        field,
+    )
+
+    # The namespace was only added to the instance, so it is not held by the class
+    assert XMP.field_by_id("custom:Reference") is None
+
+    # The namespaces held by the class are still found via the indexes
+    assert xmp.field_by_id("xmp:Label") == XMP.field_by_id("xmp:Label")
+
+
+def test_metadata_set_instance_namespaces():
+    """Test that values can be set on the fields of namespaces added to an instance."""
+
+    from exifdata.framework import Namespace
+    from exifdata.models.xmp.framework.field import Field
+
+    xmp = XMP()
+
+    namespace = Namespace(identifier="custom", name="Custom", uri="urn:custom:")
+
+    namespace.field = field = Field(
+        namespace=namespace,
+        identifier="custom:Reference",
+        name="Reference",
+        type="Text",
+    )
+
+    xmp.namespace = namespace
+
+    xmp.set(name="Reference", value="ABC")
+
+    assert xmp._values["custom:Reference"].value == "ABC"
+
+    xmp.set(field=field, value="XYZ", namespace=namespace)
+
+    assert xmp._values["custom:Reference"].value == "XYZ"
@@ -0,0 +1,80 @@
+import os
+import sys
+import subprocess
+
+from exifdata.framework import Namespace, Field
+
+
+def test_namespace_deferred_fields():
+    """Test that a namespace's fields are only created when the namespace is used."""
+
+    namespace = Namespace(identifier="test", name="Test", prefix="test")
+
+    namespace.defer(
+        Field,
+        {
+            "test:Title": {"name": "Title", "type": "Text", "alias": "Heading"},
+            "test:Rating": {"name": "Rating", "type": "Integer"},
+        },
+    )
+
+    assert namespace.materialized is False
+    assert len(namespace._fields) == 0
+
+    # Accessing the fields materializes the namespace
+    assert len(namespace.fields) == 2
+    assert namespace.materialized is True
+
+    assert "Title" in namespace
+    assert "Heading" in namespace
+    assert namespace.fields["Rating"].id == "test:Rating"
+
+    # Materializing the namespace again has no further effect
+    assert namespace.materialize() is namespace
+    assert len(namespace.fields) == 2
+
+
+def test_model_lazy_namespaces():
+    """Test that a metadata model only materializes the namespaces that are used, in a
+    separate process so that namespaces materialized by other tests do not interfere."""
+
+    script: str = """
+from exifdata.models.xmp import XMP
+from exifdata.models.iptc import IPTC
+from deliciousbytes import ByteOrder
+
+xmp = XMP()
+
+assert not any(namespace.materialized for namespace in XMP._namespaces.values())
+
+xmp.basic.label = "Test"
+
+materialized = [ns.id for ns in XMP._namespaces.values() if ns.materialized]
+
+assert materialized == ["basic"], materialized
+
+iptc = IPTC()
+iptc.set(name="ObjectName", value="Object")
+
+encoded = iptc.encode(order=ByteOrder.MSB)
+
+# Decode the payload, reconciling its records against the materialized record IDs
+decoded = IPTC.decode(encoded, order=ByteOrder.MSB)
+
+assert decoded.application.ObjectName == "Object"
+"""
+
+    environment: dict[str, str] = dict(os.environ)
+
+    environment["PYTHONPATH"] = os.path.join(
+        os.path.dirname(__file__), "..", "..", "source"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,217 @@
+import os
+import json
+import pickle
+
+from exifdata.framework import Schema, Namespace, Field
+from exifdata.models.xmp import XMP
+
+from deliciousbytes import Encoding
+
+
+def test_schema_cache_round_trip(tmp_path):
+    """Test that the namespaces, structures and aliases built from a metadata model's
+    schema can be cached in their precompiled form and restored from the cache."""
+
+    # Ensure that the model has built its namespaces from the schema
+    assert isinstance(XMP(), XMP)
+
+    import exifdata.models.xmp as module
+
+    filepath: str = os.path.join(
+        os.path.dirname(module.__file__), "data", "schema.json"
+    )
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    # As the cache directory is empty, there is no precompiled schema to load yet
+    assert schema.load() is None
+
+    assert schema.save(
+        namespaces=XMP._namespaces,
+        structures=XMP._structures,
+        aliases=XMP._aliases,
+    )
+
+    assert os.path.exists(schema.cachepath)
+    assert schema.digest in os.path.basename(schema.cachepath)
+
+    cached = schema.load()
+
+    assert isinstance(cached, dict)
+    assert cached["digest"] == schema.digest
+    assert cached["aliases"] == XMP._aliases
+    assert list(cached["namespaces"].keys()) == list(XMP._namespaces.keys())
+
+    # Ensure that the restored namespaces and fields match those built from the schema
+    for name, namespace in cached["namespaces"].items():
+        assert isinstance(namespace, Namespace)
+        assert namespace.id == XMP._namespaces[name].id
+        assert namespace.metadata is None
+
+        for identifier, field in namespace.fields.items():
+            assert isinstance(field, Field)
+            assert field.namespace is namespace
+            assert field.names == XMP._namespaces[name].fields[identifier].names
+
+    # Ensure that the restored namespaces retain their case-insensitive field lookups
+    assert "Title" in cached["namespaces"]["dc"]
+    assert "title" in cached["namespaces"]["dc"]
+
+    # Ensure that enumeration options are restored when the fields are unpickled
+    assert cached["namespaces"]["photoshop"].fields["Category"].encoding is (
+        Encoding.ASCII
+    )
+
+
+def test_schema_cache_invalidation(tmp_path):
+    """Test that a precompiled schema is keyed by the schema file's hash, so that any
+    changes to the schema file result in the previously cached schema being ignored."""
+
+    filepath: str = os.path.join(str(tmp_path), "schema.json")
+
+    with open(filepath, "w") as handle:
+        json.dump({"@aliases": {"a": "b:c"}}, handle)
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    assert schema.save(namespaces={}, structures={}, aliases={"a": "b:c"})
+    assert isinstance(schema.load(), dict)
+
+    with open(filepath, "w") as handle:
+        json.dump({"@aliases": {"a": "b:d"}}, handle)
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    assert schema.load() is None
+    assert schema.parse() == {"@aliases": {"a": "b:d"}}
+
+
+def test_schema_cache_version(tmp_path, monkeypatch):
+    """Test that a precompiled schema is keyed by the library version, so that caches
+    created by another version of the library, whose framework classes may differ in
+    shape, are ignored even when the schema file has not changed."""
+
+    filepath: str = os.path.join(str(tmp_path), "schema.json")
+
+    with open(filepath, "w") as handle:
+        json.dump({"@aliases": {"a": "b:c"}}, handle)
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    with open(
+        os.path.join(
+            os.path.dirname(__file__), "..", "..", "source", "exifdata", "version.txt"
+        )
+    ) as handle:
+        assert schema.version == handle.read().strip()
+
+    assert schema.version in os.path.basename(schema.cachepath)
+
+    assert schema.save(namespaces={}, structures={}, aliases={"a": "b:c"})
+    assert isinstance(schema.load(), dict)
+
+    monkeypatch.setattr(Schema, "_version", "0.0.0")
+
+    assert schema.load() is None
+
+    monkeypatch.undo()
+
+    assert isinstance(cached := schema.load(), dict)
+
+    # A cache recording another library version is ignored, whatever its file name
+    cached["version"] = "0.0.0"
+
+    with open(schema.cachepath, "wb") as handle:
+        pickle.dump(cached, handle)
+
+    assert schema.load() is None
+
+
+def test_schema_cache_unwritable(tmp_path):
+    """Test that failing to write the precompiled schema is not treated as an error."""
+
+    filepath: str = os.path.join(str(tmp_path), "schema.json")
+
+    with open(filepath, "w") as handle:
+        json.dump({}, handle)
+
+    # Use an existing file as the cache directory so that the cache cannot be written
+    schema = Schema(filepath=filepath, directory=filepath)
+
+    assert schema.save(namespaces={}, structures={}, aliases={}) is False
+    assert schema.load() is None
+
+
+def test_schema_cache_prune(tmp_path):
+    """Test that once a precompiled schema has been written, the schema's out of date
+    cache files are removed, while those of other schemas and runtimes are retained."""
+
+    import sys
+
+    import exifdata.models.xmp as module
+
+    schema = Schema(
+        filepath=os.path.join(os.path.dirname(module.__file__), "data", "schema.json"),
+        directory=str(tmp_path),
+    )
+
+    # The cache files of the packaged schemas are named after their path in the package
+    assert schema.name == "models.xmp.data.schema"
+
+    filepath: str = os.path.join(str(tmp_path), "schema.json")
+
+    with open(filepath, "w") as handle:
+        json.dump({"@aliases": {"a": "b:c"}}, handle)
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    assert schema.save(namespaces={}, structures={}, aliases={"a": "b:c"})
+
+    stale: str = schema.cachepath
+
+    tag: str = sys.implementation.cache_tag
+
+    retained: list[str] = [
+        # The cache files of other schemas, which may share the cache directory
+        "models.exif.data.schema.%s.v%d.0.0.0.abc.pickle" % (tag, Schema._format),
+        # The cache files written by other Python implementations
+        "%s.other-39.v%d.0.0.0.abc.pickle" % (schema.name, Schema._format),
+    ]
+
+    for filename in retained:
+        with open(os.path.join(str(tmp_path), filename), "wb") as handle:
+            handle.write(b"")
+
+    with open(filepath, "w") as handle:
+        json.dump({"@aliases": {"a": "b:d"}}, handle)
+
+    schema = Schema(filepath=filepath, directory=str(tmp_path))
+
+    assert schema.save(namespaces={}, structures={}, aliases={"a": "b:d"})
+
+    assert os.path.exists(schema.cachepath)
+    assert not os.path.exists(stale)
+
+    for filename in retained:
+        assert os.path.exists(os.path.join(str(tmp_path), filename))
+
+    # Nothing further is removed while the cache is up to date
+    assert schema.prune() == 0
+    assert isinstance(schema.load(), dict)
+
+    # Within the schema's own cache folder, files named after the schema file alone
+    # by earlier versions of the library are also removed
+    directory: str = os.path.join(str(tmp_path), "__pycache__")
+
+    schema = Schema(filepath=filepath, directory=directory)
+
+    legacy: str = os.path.join(directory, "schema.%s.v2.abc.pickle" % (tag))
+
+    os.makedirs(directory)
+
+    with open(legacy, "wb") as handle:
+        handle.write(b"")
+
+    assert schema.save(namespaces={}, structures={}, aliases={"a": "b:d"})
+
+    assert not os.path.exists(legacy)
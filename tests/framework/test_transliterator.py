@@ -0,0 +1,57 @@
+import unicodedata
+
+from exifdata.framework import Transliterator
+
+
+def sequential(replacements: dict[str, str], value: str) -> str:
+    """Transliterate the value by applying each of the replacements in turn, in the
+    order they were added, after normalising the value and removing any combining
+    characters, against which the compiled transliteration steps are compared."""
+
+    value = unicodedata.normalize("NFKD", value)
+
+    value = "".join([char for char in value if not unicodedata.combining(char)])
+
+    for search, replacement in replacements.items():
+        value = value.replace(search, replacement)
+
+    return value
+
+
+def test_transliterator_order():
+    """Test that the replacements are applied in the order they were added, including
+    where the replacements overlap, or where one produces the text that another matches.
+    """
+
+    cases: list[tuple[dict[str, str], str, str]] = [
+        # A longer search string, added first, produces the character a later one replaces
+        ({"oe": "œ", "œ": "oe"}, "Cœur oeuvre", "Coeur oeuvre"),
+        # A single character replacement produces the character a later one replaces
+        ({"©": "®", "®": "(r)"}, "© ®", "(r) (r)"),
+        # A replacement produces the text matched by a later longer search string
+        ({"©": "(c)", "(c)": "copyright"}, "© (c)", "copyright copyright"),
+        # The later replacements cannot match text replaced by those before them
+        ({"®": "(r)", "©": "®"}, "© ®", "® (r)"),
+        # A replacement produces a combining character that a later one replaces
+        ({"©": "ć", "́": "'"}, "© é", "c' e"),
+        # Replacements producing non-ASCII text are applied to ASCII strings too
+        ({"(c)": "©", "©": "(C)"}, "(c) 2025", "(C) 2025"),
+    ]
+
+    for replacements, value, expected in cases:
+        transliterator = Transliterator(dict(replacements))
+
+        assert sequential(replacements, value) == expected
+
+        assert transliterator.transliterate(value) == expected
+
+    transliterator = Transliterator({"©": "(c)"})
+
+    generation: int = transliterator.generation
+
+    transliterator.add("(c)", "copyright")
+
+    assert transliterator.generation > generation
+
+    assert transliterator.transliterate("© 2025") == "copyright 2025"
+    assert transliterator.transliterate("(c) 2025") == "copyright 2025"
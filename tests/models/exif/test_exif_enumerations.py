@@ -0,0 +1,13 @@
+from exifdata.models.exif.enumerations import Tags, TagID
+
+
+def test_exif_tags_reconcile():
+    assert isinstance(info := Tags.reconcile(0x010F), dict)
+    assert info["name"] == "Make"
+
+    assert Tags.reconcile(TagID.EXIFIFDPointer)["name"] == "EXIFIFDPointer"
+
+    # The GPS version tag has a tag ID of zero
+    assert Tags.reconcile(0x0000)["name"] == "GPSVersionID"
+
+    assert Tags.reconcile(0xFFFE) is None
@@ -0,0 +1,564 @@
+import struct
+
+from exifdata.models.exif import EXIF
+from exifdata.models.exif.structures import IFD
+
+from deliciousbytes import ByteOrder
+
+
+def test_exif_model_decode(path: callable):
+    """Test decoding the EXIF metadata held in the IFDs of a TIFF file, where the values
+    are only decoded from the payload when they are first accessed."""
+
+    with open(path("test.tiff"), "rb") as handle:
+        payload: bytes = handle.read()
+
+    decoded = EXIF.decode(payload)
+
+    assert isinstance(decoded, EXIF)
+
+    # The IFD0 and EXIF IFDs were scanned, via the EXIF IFD pointer tag
+    assert list(decoded._ifds.keys()) == ["IFD0", "EXIF"]
+
+    # The values have not been decoded until they are accessed
+    assert decoded._values.deferred("exif:Software") is True
+
+    assert decoded.exif.Software == "Pixelmator Pro 3.6.17"
+
+    assert decoded._values.deferred("exif:Software") is False
+
+    assert decoded.exif.ImageWidth == 3
+    assert decoded.exif.BitsPerSample == [8, 8, 8]
+    assert decoded.exif.XResolution == "300/1"
+
+    # The DateTimeDigitized tag is held in the EXIF IFD
+    assert decoded.exif.DateTimeDigitized == "2025:05:16 00:04:24"
+
+    # The pointer tags are not mapped to fields, as they are recomputed when encoding
+    assert decoded.exif.EXIFIFDPointer is None
+
+    # APP1 payloads with the "Exif" prefix are also supported
+    decoded = EXIF.decode(b"Exif\x00\x00" + payload)
+
+    assert decoded.exif.Software == "Pixelmator Pro 3.6.17"
+
+
+def test_exif_model_decode_little_endian():
+    """Test decoding a little-endian EXIF payload, holding IFD0 and a GPS IFD."""
+
+    make: bytes = b"Example\x00"
+
+    payload: bytes = b"".join(
+        [
+            b"II" + struct.pack("<HI", 42, 8),
+            # IFD0, holding the Make and GPS IFD pointer tags
+            struct.pack("<H", 2),
+            struct.pack("<HHII", 0x010F, 2, len(make), 38),
+            struct.pack("<HHII", 0x8825, 4, 1, 46),
+            struct.pack("<I", 0),
+            make,
+            # GPS IFD, holding the GPSLatitudeRef and GPSAltitude tags
+            struct.pack("<H", 2),
+            struct.pack("<HHI2sxx", 0x0001, 2, 2, b"N\x00"),
+            struct.pack("<HHII", 0x0006, 5, 1, 76),
+            struct.pack("<I", 0),
+            struct.pack("<II", 1234, 10),
+        ]
+    )
+
+    decoded = EXIF.decode(payload, order=ByteOrder.MSB)
+
+    assert list(decoded._ifds.keys()) == ["IFD0", "GPS"]
+
+    assert decoded.exif.Make == "Example"
+    assert decoded.exif.GPSLatitudeRef == "N"
+    assert decoded.exif.GPSAltitude == "1234/10"
+
+    # The tags of each IFD are held in a map keyed by tag ID
+    assert decoded._ifds["GPS"].parent is decoded._ifds["IFD0"]
+    assert decoded._ifds["GPS"].tags[0x0001][0:3] == (0x0001, 2, 2)
+
+    # IFDs that are not requested, such as the GPS IFD here, are not scanned
+    decoded = EXIF.decode(payload, ifds=["EXIF"])
+
+    assert list(decoded._ifds.keys()) == ["IFD0"]
+
+    assert decoded.exif.Make == "Example"
+    assert decoded.exif.GPSLatitudeRef is None
+
+
+def test_exif_model_byte_order():
+    """Test that the byte order is detected from the TIFF header of the payload, and is
+    retained when re-encoding, unless another byte order is specified."""
+
+    exif = EXIF()
+
+    exif.exif.Make = "Example"
+    exif.exif.XResolution = "300/1"
+
+    # New models are encoded in big-endian byte order by default
+    assert exif.order is None
+    assert EXIF.byteorder(exif.encode()) is ByteOrder.MSB
+
+    encoded: bytes = exif.encode(order=ByteOrder.LSB)
+
+    assert EXIF.byteorder(encoded) is ByteOrder.LSB
+    assert EXIF.byteorder(b"Exif\x00\x00XX") is None
+
+    # The byte order hint is ignored in favour of the payload's own byte order
+    decoded = EXIF.decode(encoded, order=ByteOrder.MSB)
+
+    assert decoded.order is ByteOrder.LSB
+
+    # Re-encoding retains the native byte order, so the payload is unchanged
+    assert decoded.encode() == encoded
+
+    assert EXIF.byteorder(decoded.encode(order=ByteOrder.MSB)) is ByteOrder.MSB
+
+    decoded.exif.Make = "Changed"
+
+    reencoded = EXIF.decode(decoded.encode())
+
+    assert reencoded.order is ByteOrder.LSB
+    assert reencoded.exif.Make == "Changed"
+    assert reencoded.exif.XResolution == "300/1"
+
+
+def test_exif_model_encode():
+    """Test encoding EXIF metadata into IFD0 and the EXIF and GPS IFDs, linked via the
+    pointer tags, with each out-of-line value written at its recorded offset."""
+
+    exif = EXIF()
+
+    exif.exif.Make = "Example"
+    exif.exif.ImageWidth = 300
+    exif.exif.DateTimeOriginal = "2025:01:01 12:00:00"
+    exif.exif.GPSLatitudeRef = "N"
+    exif.exif.GPSLatitude = [51, 30, 0]
+
+    for order in (ByteOrder.MSB, ByteOrder.LSB):
+        encoded: bytes = exif.encode(order=order)
+
+        assert encoded.startswith(b"Exif\x00\x00")
+
+        payload: memoryview = memoryview(encoded)[6:]
+
+        assert IFD.header(payload) == (order, 8, False)
+
+        (tags, next) = IFD.scan(payload, offset=8, order=order)
+
+        # The tags are sorted by tag ID, and the pointer tags have been emitted
+        assert [tag[0] for tag in tags] == [0x0100, 0x010F, 0x8769, 0x8825]
+
+        # Each IFD and out-of-line value begins on a word boundary
+        for tagid, type, count, offset in tags:
+            assert offset % 2 == 0
+
+        prefix: str = ">" if order is ByteOrder.MSB else "<"
+
+        pointer: int = struct.unpack_from(prefix + "I", payload, tags[2][3])[0]
+
+        assert pointer % 2 == 0
+        assert IFD.scan(payload, offset=pointer, order=order)[0][0][0] == 0x9003
+
+        decoded = EXIF.decode(encoded)
+
+        assert list(decoded._ifds.keys()) == ["IFD0", "EXIF", "GPS"]
+
+        assert decoded.exif.Make == "Example"
+        assert decoded.exif.ImageWidth == 300
+        assert decoded.exif.DateTimeOriginal == "2025:01:01 12:00:00"
+        assert decoded.exif.GPSLatitudeRef == "N"
+        assert decoded.exif.GPSLatitude == ["51/1", "30/1", "0/1"]
+
+
+def test_exif_model_thumbnail():
+    """Test extracting the IFD1 thumbnail as a zero-copy slice of the payload."""
+
+    thumbnail: bytes = b"\xff\xd8" + bytes(range(32)) + b"\xff\xd9"
+
+    payload: bytearray = bytearray(
+        b"".join(
+            [
+                b"MM" + struct.pack(">HI", 42, 8),
+                # IFD0, holding the Orientation tag, linking to IFD1 at offset 26
+                struct.pack(">H", 1),
+                struct.pack(">HHIHxx", 0x0112, 3, 1, 1),
+                struct.pack(">I", 26),
+                # IFD1, holding the thumbnail's offset and length
+                struct.pack(">H", 2),
+                struct.pack(">HHII", 0x0201, 4, 1, 56),
+                struct.pack(">HHII", 0x0202, 4, 1, len(thumbnail)),
+                struct.pack(">I", 0),
+                thumbnail,
+            ]
+        )
+    )
+
+    decoded = EXIF.decode(payload)
+
+    assert list(decoded._ifds.keys()) == ["IFD0", "IFD1"]
+
+    assert isinstance(preview := decoded.thumbnail, memoryview)
+
+    assert preview == thumbnail
+
+    # The thumbnail references the payload rather than a copy of it
+    payload[56] = 0x00
+
+    assert preview[0] == 0x00
+
+    # No values were decoded to extract the thumbnail
+    assert decoded._values.deferred("exif:Orientation") is True
+
+    # The thumbnail can also be extracted without creating a model
+    assert EXIF.extract_thumbnail(b"Exif\x00\x00" + payload) == preview
+
+    # Models that were not decoded from a payload have no thumbnail
+    assert EXIF().thumbnail is None
+
+
+def test_exif_model_encode_multiple_values():
+    """Test encoding and decoding the values of multi-count tags in both byte orders."""
+
+    exif = EXIF()
+
+    exif.exif.BitsPerSample = [8, 8, 8]
+    exif.exif.LensSpecification = ["24/1", "70/1", "28/10", "28/10"]
+    exif.exif.GPSLongitude = [0, 7, "123/10"]
+
+    for order in (ByteOrder.MSB, ByteOrder.LSB):
+        encoded: bytes = exif.encode(order=order)
+
+        prefix: str = ">" if order is ByteOrder.MSB else "<"
+
+        (tags, next) = IFD.scan(memoryview(encoded)[6:], offset=8, order=order)
+
+        # BitsPerSample holds three shorts, which are written out-of-line
+        assert tags[0][0:3] == (0x0102, 3, 3)
+
+        assert struct.unpack_from(prefix + "3H", encoded, 6 + tags[0][3]) == (8, 8, 8)
+
+        decoded = EXIF.decode(encoded)
+
+        assert decoded.exif.BitsPerSample == [8, 8, 8]
+        assert decoded.exif.LensSpecification == ["24/1", "70/1", "14/5", "14/5"]
+        assert decoded.exif.GPSLongitude == ["0/1", "7/1", "123/10"]
+
+
+def test_exif_model_interoperability():
+    """Test that the tags of the Interoperability IFD, whose tag IDs overlap with those
+    of the GPS IFD, are not mapped to the GPS fields, and that encoding routes each of
+    the fields into the IFD named by its schema definition."""
+
+    payload: bytes = b"".join(
+        [
+            b"MM" + struct.pack(">HI", 42, 8),
+            # IFD0, holding the EXIF IFD pointer tag
+            struct.pack(">H", 1),
+            struct.pack(">HHII", 0x8769, 4, 1, 26),
+            struct.pack(">I", 0),
+            # EXIF IFD, holding the ExifVersion and Interoperability IFD pointer tags
+            struct.pack(">H", 2),
+            struct.pack(">HHI4s", 0x9000, 7, 4, b"0232"),
+            struct.pack(">HHII", 0xA005, 4, 1, 56),
+            struct.pack(">I", 0),
+            # Interoperability IFD, holding the InteroperabilityIndex tag, 0x0001
+            struct.pack(">H", 1),
+            struct.pack(">HHI4s", 0x0001, 2, 4, b"R98\x00"),
+            struct.pack(">I", 0),
+        ]
+    )
+
+    decoded = EXIF.decode(payload)
+
+    assert list(decoded._ifds.keys()) == ["IFD0", "EXIF", "Interop"]
+
+    assert decoded._ifds["Interop"].parent is decoded._ifds["EXIF"]
+
+    assert decoded.exif.ExifVersion == b"0232"
+
+    # The InteroperabilityIndex tag shares its tag ID with the GPSLatitudeRef tag
+    assert decoded.exif.GPSLatitudeRef is None
+
+    decoded.exif.GPSLatitudeRef = "S"
+
+    encoded = EXIF.decode(decoded.encode())
+
+    assert list(encoded._ifds.keys()) == ["IFD0", "EXIF", "GPS"]
+
+    assert list(encoded._ifds["EXIF"].tags) == [0x9000]
+    assert list(encoded._ifds["GPS"].tags) == [0x0001]
+
+    assert encoded.exif.GPSLatitudeRef == "S"
+
+
+def test_exif_model_encode_bigtiff():
+    """Test encoding and decoding EXIF metadata using the BigTIFF structure, with its
+    16-byte header, 20-byte tag entries and 64-bit counts and offsets."""
+
+    exif = EXIF()
+
+    exif.exif.Make = "Example"
+    exif.exif.DateTimeOriginal = "2025:01:01 12:00:00"
+    exif.exif.GPSLatitude = [51, 30, 0]
+
+    for order in (ByteOrder.MSB, ByteOrder.LSB):
+        encoded: bytes = exif.encode(order=order, big=True)
+
+        payload: memoryview = memoryview(encoded)[6:]
+
+        prefix: str = ">" if order is ByteOrder.MSB else "<"
+
+        assert struct.unpack_from(prefix + "HHHQ", payload, 2) == (43, 8, 0, 16)
+
+        assert IFD.header(payload) == (order, 16, True)
+
+        (tags, next) = IFD.scan(payload, offset=16, order=order, big=True)
+
+        # The pointer tags use the IFD8 type, holding 64-bit offsets
+        assert [tag[0:3] for tag in tags] == [
+            (0x010F, 2, 8),
+            (0x8769, 18, 1),
+            (0x8825, 18, 1),
+        ]
+
+        # The IFD comprises an 8-byte count, 20-byte entries and an 8-byte next offset,
+        # and the 8-byte Make value is held inline, so the EXIF IFD follows directly
+        assert struct.unpack_from(prefix + "Q", payload, tags[1][3])[0] == (
+            16 + 8 + 3 * 20 + 8
+        )
+
+        decoded = EXIF.decode(encoded)
+
+        assert decoded._big is True
+
+        assert decoded.exif.Make == "Example"
+        assert decoded.exif.DateTimeOriginal == "2025:01:01 12:00:00"
+        assert decoded.exif.GPSLatitude == ["51/1", "30/1", "0/1"]
+
+        # The BigTIFF structure is retained when re-encoding a decoded model
+        assert decoded.encode(order=order)[8:10] == encoded[8:10]
+
+    # Values of the BigTIFF Long8 type, such as 64-bit strip offsets, are decoded
+    payload: bytes = b"".join(
+        [
+            b"II" + struct.pack("<HHHQ", 43, 8, 0, 16),
+            struct.pack("<Q", 1),
+            struct.pack("<HHQQ", 0x0111, 16, 1, 0x123456789),
+            struct.pack("<Q", 0),
+        ]
+    )
+
+    assert EXIF.decode(payload).exif.StripOffsets == 0x123456789
+
+
+def test_exif_model_encode_makernote():
+    """Test that a decoded MakerNote is passed through as an opaque slice, pinned at its
+    original offset when possible, and otherwise relocated with its offsets patched."""
+
+    # A Canon-style MakerNote, a header-less IFD whose offsets are absolute, that is
+    # they are relative to the start of the enclosing TIFF structure, at offset 62
+    makernote: bytes = b"".join(
+        [
+            struct.pack(">H", 1),
+            struct.pack(">HHII", 0x0006, 2, 8, 62 + 18),
+            struct.pack(">I", 0),
+            b"Example\x00",
+        ]
+    )
+
+    payload: bytes = b"".join(
+        [
+            b"MM" + struct.pack(">HI", 42, 8),
+            # IFD0, holding the Make and EXIF IFD pointer tags
+            struct.pack(">H", 2),
+            struct.pack(">HHII", 0x010F, 2, 6, 38),
+            struct.pack(">HHII", 0x8769, 4, 1, 44),
+            struct.pack(">I", 0),
+            b"Canon\x00",
+            # EXIF IFD, holding the MakerNote tag
+            struct.pack(">H", 1),
+            struct.pack(">HHII", 0x927C, 7, len(makernote), 62),
+            struct.pack(">I", 0),
+            makernote,
+        ]
+    )
+
+    decoded = EXIF.decode(payload)
+
+    assert isinstance(decoded.makernote, memoryview)
+    assert decoded.makernote == makernote
+
+    # Assigning a field to IFD0 grows it, so the EXIF IFD overlaps the MakerNote
+    decoded.exif.Copyright = "Copyright Example"
+
+    encoded: bytes = decoded.encode(order=ByteOrder.MSB)
+
+    # The MakerNote has not been decoded to encode the model
+    assert decoded._values.deferred("exif:MakerNote") is True
+
+    reencoded = EXIF.decode(encoded)
+
+    # The MakerNote remains at its original offset, with its contents unchanged
+    assert reencoded._ifds["EXIF"].tags[0x927C][3] == 62
+    assert reencoded.makernote == makernote
+
+    assert reencoded.exif.Copyright == "Copyright Example"
+    assert reencoded.exif.Make == "Canon"
+
+    # The MakerNote must be moved when switching to BigTIFF, so its offsets are patched
+    encoded: bytes = decoded.encode(order=ByteOrder.MSB, big=True)
+
+    reencoded = EXIF.decode(encoded)
+
+    offset: int = reencoded._ifds["EXIF"].tags[0x927C][3]
+
+    assert not offset == 62
+
+    relocated: bytes = reencoded.makernote.tobytes()
+
+    assert relocated[0:8] == makernote[0:8]
+
+    # The absolute offset held by the MakerNote references its value at the new offset
+    (location,) = struct.unpack_from(">I", relocated, 10)
+
+    assert location == offset + 18
+
+    assert encoded[6 + location : 6 + location + 8] == b"Example\x00"
+
+    # A reassigned MakerNote is encoded from its value instead
+    decoded.exif.MakerNote = b"Reassigned"
+
+    reencoded = EXIF.decode(decoded.encode(order=ByteOrder.MSB))
+
+    assert reencoded.makernote == b"Reassigned"
+
+
+def test_exif_model_encoded_size():
+    """Test that the encoded size computed from the layout of the IFDs matches the
+    length of the encoded payload, for both byte orders and TIFF structures, and for
+    decoded payloads holding a MakerNote which is pinned or relocated."""
+
+    exif = EXIF()
+
+    assert exif.encoded_size() == 0
+
+    exif.exif.Make = "Example"
+    exif.exif.ImageWidth = 300
+    exif.exif.XResolution = "300/1"
+    exif.exif.DateTimeOriginal = "2025:01:01 12:00:00"
+    exif.exif.LensSpecification = ["24/1", "70/1", "28/10", "28/10"]
+    exif.exif.GPSLatitudeRef = "N"
+    exif.exif.GPSLatitude = [51, 30, 0]
+
+    for order in (ByteOrder.MSB, ByteOrder.LSB):
+        for big in (False, True):
+            assert exif.encoded_size(order=order, big=big) == len(
+                exif.encode(order=order, big=big)
+            )
+
+    payload: bytes = b"".join(
+        [
+            b"II" + struct.pack("<HI", 42, 8),
+            # IFD0, holding the Make and EXIF IFD pointer tags
+            struct.pack("<H", 2),
+            struct.pack("<HHII", 0x010F, 2, 6, 38),
+            struct.pack("<HHII", 0x8769, 4, 1, 44),
+            struct.pack("<I", 0),
+            b"Canon\x00",
+            # EXIF IFD, holding the MakerNote tag
+            struct.pack("<H", 1),
+            struct.pack("<HHII", 0x927C, 7, 64, 62),
+            struct.pack("<I", 0),
+            bytes(64),
+        ]
+    )
+
+    decoded = EXIF.decode(payload)
+
+    decoded.exif.Copyright = "Copyright Example"
+
+    assert decoded.encoded_size() == len(decoded.encode())
+    assert decoded.encoded_size(big=True) == len(decoded.encode(big=True))
+
+    # Measuring the size does not decode the passed through MakerNote
+    assert decoded._values.deferred("exif:MakerNote") is True
+
+
+def test_exif_model_encode_assigned_fields(monkeypatch):
+    """Test that only the fields that have been assigned values are laid out, so that
+    the IFD of a field is only validated once the field has been assigned a value."""
+
+    exif = EXIF()
+
+    exif.exif.Make = "Example"
+
+    (namespace, field) = EXIF.field_by_name("Model")
+
+    monkeypatch.setattr(field, "_ifd", "Unsupported")
+
+    assert EXIF.decode(exif.encode()).exif.Make == "Example"
+
+    exif.exif.Model = "Example"
+
+    try:
+        exif.encode()
+    except ValueError as exception:
+        assert "Unsupported" in str(exception)
+    else:
+        assert False, "Expected a ValueError to be raised!"
+
+
+def test_exif_model_encode_thumbnail():
+    """Test that the IFD1 of a decoded payload, along with its JPEG thumbnail, is
+    retained when the model is re-encoded, in either byte order or TIFF structure."""
+
+    thumbnail: bytes = b"\xff\xd8" + bytes(range(32)) + b"\xff\xd9"
+
+    payload: bytes = b"".join(
+        [
+            b"MM" + struct.pack(">HI", 42, 8),
+            # IFD0, holding the Orientation tag, linking to IFD1 at offset 26
+            struct.pack(">H", 1),
+            struct.pack(">HHIHxx", 0x0112, 3, 1, 1),
+            struct.pack(">I", 26),
+            # IFD1, holding the thumbnail's offset and length, and its resolution
+            struct.pack(">H", 3),
+            struct.pack(">HHII", 0x011A, 5, 1, 68),
+            struct.pack(">HHII", 0x0201, 4, 1, 76),
+            struct.pack(">HHII", 0x0202, 4, 1, len(thumbnail)),
+            struct.pack(">I", 0),
+            struct.pack(">II", 72, 1),
+            thumbnail,
+        ]
+    )
+
+    decoded = EXIF.decode(payload)
+
+    assert decoded.thumbnail == thumbnail
+
+    decoded.exif.Make = "Example"
+
+    for order in (ByteOrder.MSB, ByteOrder.LSB):
+        for big in (False, True):
+            encoded: bytes = decoded.encode(order=order, big=big)
+
+            assert decoded.encoded_size(order=order, big=big) == len(encoded)
+
+            assert EXIF.extract_thumbnail(encoded) == thumbnail
+
+            redecoded = EXIF.decode(encoded)
+
+            assert list(redecoded._ifds.keys()) == ["IFD0", "IFD1"]
+
+            assert redecoded.thumbnail == thumbnail
+            assert redecoded.exif.Make == "Example"
+            assert redecoded.exif.Orientation == 1
+
+            # The other IFD1 tags are passed through, repacked in the byte order
+            (tagid, type, count, offset) = redecoded._ifds["IFD1"].tags[0x011A]
+
+            assert IFD.unpack(redecoded._payload, type, count, offset, order) == (
+                (72, 1),
+            )
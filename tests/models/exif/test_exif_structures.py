@@ -0,0 +1,74 @@
+import pytest
+import struct
+
+from exifdata.models.exif.structures import IFD, IFDTag
+
+from deliciousbytes import ByteOrder
+
+
+def test_exif_structures_ifd_encode():
+    """Test encoding an IFD via its object API, where the values longer than the tag's
+    value field are written to the data area following the IFD, for both the classic
+    TIFF and BigTIFF structures, so that the encoded IFD can be scanned again."""
+
+    for big in (False, True):
+        for order in (ByteOrder.MSB, ByteOrder.LSB):
+            prefix: str = ">" if order is ByteOrder.MSB else "<"
+
+            ifd = IFD(
+                tags=[
+                    IFDTag(id=0x010F, type=2, count=8, data=b"Example\x00", big=big),
+                    IFDTag(
+                        id=0x011A,
+                        type=5,
+                        count=1,
+                        data=struct.pack(prefix + "II", 72, 1),
+                        big=big,
+                    ),
+                    IFDTag(id=0x0112, type=3, count=1, data=b"\x00\x01", big=big),
+                ],
+                count=3,
+                big=big,
+            )
+
+            header: int = 16 if big else 8
+
+            encoded: bytes = ifd.encode(order=order, offset=header)
+
+            payload: memoryview = memoryview(bytes(header) + encoded)
+
+            (tags, next) = IFD.scan(payload, offset=header, order=order, big=big)
+
+            assert next == 0
+
+            assert [tag[0:3] for tag in tags] == [
+                (0x010F, 2, 8),
+                (0x011A, 5, 1),
+                (0x0112, 3, 1),
+            ]
+
+            assert payload[tags[0][3] : tags[0][3] + 8] == b"Example\x00"
+
+            # The Rational fits inline within the eight byte value field of BigTIFF tags
+            assert IFD.unpack(payload, 5, 1, tags[1][3], order) == ((72, 1),)
+
+            # Values that fit are held left-justified within the tag's value field
+            assert payload[tags[2][3] : tags[2][3] + 2] == b"\x00\x01"
+
+
+def test_exif_structures_ifd_tag_encode():
+    """Test encoding a single IFD tag entry, which requires the offset of its data to be
+    specified if the data does not fit within the tag's value field."""
+
+    tag = IFDTag(id=0x0112, type=3, count=1, data=b"\x00\x01")
+
+    assert tag.encode(order=ByteOrder.MSB) == bytes.fromhex("011200030000000100010000")
+
+    tag = IFDTag(id=0x010F, type=2, count=8, data=b"Example\x00")
+
+    assert tag.encode(order=ByteOrder.LSB, offset=38) == bytes.fromhex(
+        "0f0102000800000026000000"
+    )
+
+    with pytest.raises(ValueError):
+        tag.encode(order=ByteOrder.MSB)
@@ -5,8 +5,13 @@ from exifdata.models.exif.types import (
     ASCII,
     UTF8,
     String,
+    Rational,
+    RationalSigned,
+    Float,
 )
 
+from deliciousbytes import ByteOrder
+
 
 def test_type_ascii_add_replacement_valid():
     """Test the EXIF metadata field ASCII data type, by testing the addition of an ASCII
@@ -108,6 +113,26 @@ def test_type_ascii_encoding_example_two():
     assert encoded == b"The Amazing(r) Cafe contains non-ASCII characters like ?\x00"
 
 
+def test_type_ascii_encoding_memoized():
+    """Test the EXIF metadata field ASCII data type, by checking that the encoded value
+    is reused for subsequent encodes, such as when determining the encoded length, and
+    is recomputed if the replacements have since been changed."""
+
+    ascii: ASCII = ASCII("Über †")
+
+    encoded: bytes = ascii.encode()
+
+    assert encoded == b"Uber ?\x00"
+
+    assert len(ascii) == 7
+
+    assert ascii.encode() is encoded
+
+    ASCII.add_replacement(search="†", replacement="+")
+
+    assert ascii.encode() == b"Uber +\x00"
+
+
 def test_type_string_encoding_example_one():
     """Test the EXIF metadata field String psuedo data type, by encoding a string that
     contains only ASCII characters; this must result in the value being encoded using
@@ -159,3 +184,22 @@ def test_type_string_encoding_example_two():
         encoded
         == b"This string contains ASCII and UTF-8 characters like \xe2\x84\x97\x00"
     )
+
+
+def test_type_numeric_encoding_byte_orders():
+    """Test the EXIF metadata field Rational, RationalSigned and Float data types, by
+    encoding and decoding them in both byte orders via the precompiled struct codecs."""
+
+    rational: Rational = Rational(numerator=1, denominator=250)
+
+    assert rational.encode(order=ByteOrder.MSB) == bytes.fromhex("00000001000000fa")
+    assert rational.encode(order=ByteOrder.LSB) == bytes.fromhex("01000000fa000000")
+
+    decoded = RationalSigned.decode(bytes.fromhex("fffffffe00000003"))
+
+    assert isinstance(decoded, RationalSigned)
+    assert decoded.value == "-2/3"
+
+    # Single-precision floats are encoded into four bytes
+    assert Float(1.5).encode(order=ByteOrder.MSB) == bytes.fromhex("3fc00000")
+    assert Float(1.5).encode(order=ByteOrder.LSB) == bytes.fromhex("0000c03f")
@@ -0,0 +1,564 @@
+import os
+import subprocess
+import sys
+
+from exifdata.logging import logger
+from exifdata.framework import Metadata
+from exifdata.models.iptc import IPTC, IPTCFormat, RecordID
+
+from deliciousbytes import ByteOrder
+
+logger = logger.getChild(__name__)
+
+
+def cold(script: str) -> str:
+    """Run the provided script in a new interpreter, in which no model instances have
+    been created, so that the class-level decoding methods are used from a cold start,
+    returning the script's standard output."""
+
+    source: str = os.path.join(os.path.dirname(__file__), "..", "..", "..", "source")
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, PYTHONPATH=os.path.abspath(source)),
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+    return result.stdout.strip()
+
+
+def test_iptc_model_encode():
+    iptc = IPTC()
+
+    assert isinstance(iptc, IPTC)
+    assert isinstance(iptc, Metadata)
+
+    iptc.set(name="ObjectName", value="Object")
+    iptc.set(name="Byline", value="X")
+
+    encoded: bytes = iptc.encode(order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    assert isinstance(encoded, bytes)
+
+    # The Record Version record is added first, followed by the assigned records, and
+    # the payload is padded, if needed, so its length is evenly divisible by four bytes
+    assert encoded == bytes.fromhex(
+        "1c020000020004"  # Record Version
+        "1c020500064f626a656374"  # Object Name
+        "1c0250000158"  # By-line
+    )
+
+    assert len(encoded) % 4 == 0
+
+    # The field record IDs are held in the class-level record ID table once encoded
+    assert isinstance(
+        record_id := IPTC.record_id_by_field_id("application:ObjectName"), RecordID
+    )
+    assert record_id.record_id == 2
+    assert record_id.dataset_id == 5
+
+    assert IPTC.record_id_by_field_id("application:DoesNotExist") is None
+
+    # The APP13 format includes the "Photoshop 3.0" prefix and 8BIM resource header
+    encoded = iptc.encode(order=ByteOrder.MSB, format=IPTCFormat.APP13)
+
+    assert encoded.startswith(b"Photoshop 3.0\x008BIM\x04\x04")
+    assert len(encoded) % 4 == 0
+
+    decoded = IPTC.decode(encoded, order=ByteOrder.MSB)
+
+    assert decoded.application.ObjectName == "Object"
+    assert decoded.application.Byline == "X"
+
+
+def test_iptc_record_id_reconcile():
+    # Ensure the model's namespaces have been set up and the record IDs registered
+    iptc = IPTC()
+
+    (namespace, field) = iptc.field_by_id("application:Keywords")
+
+    assert RecordID.reconcile(record_id=2, dataset_id=25) is field.record_id
+    assert RecordID.reconcile(record_id=2, dataset_id=254) is None
+
+    # Options registered at runtime are also indexed for reconciliation
+    from exifdata.models.iptc.enumerations import RecordInfo
+
+    option = RecordID.register(
+        name="TestRuntimeRecord",
+        value=RecordInfo(record_id=9, dataset_id=99, type="String"),
+    )
+
+    assert RecordID.reconcile(record_id=9, dataset_id=99) is option
+    assert RecordID.reconcile(info=option.value) is option
+
+
+def test_iptc_model_decode_buffers(tmp_path):
+    import io
+    import mmap
+
+    # An APP13 payload as encoded by earlier versions of the library, which recorded a
+    # fixed, incorrect, length for the IPTC resource
+    payload: bytes = bytes.fromhex(
+        "50686f746f73686f7020332e3000"  # Photoshop 3.0 prefix
+        "3842494d0404000000000000003a"  # 8BIM resource header
+        "1c020000020004"  # Record Version
+        "1c020500064f626a656374"  # Object Name
+        "1c0250000158"  # By-line
+    )
+
+    filepath = tmp_path / "payload.bin"
+    filepath.write_bytes(payload)
+
+    with open(filepath, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffers = [
+                payload,
+                bytearray(payload),
+                memoryview(payload),
+                io.BytesIO(payload),
+                mapped,
+            ]
+
+            for buffer in buffers:
+                decoded = IPTC.decode(buffer, order=ByteOrder.MSB)
+
+                assert isinstance(decoded, IPTC)
+                assert decoded.application.ObjectName == "Object"
+                assert decoded.application.Byline == "X"
+
+                # Immutable bytes payloads are held without being copied, while other
+                # buffers, which may be modified or closed, are detached by a copy
+                if isinstance(buffer, (bytes, memoryview)):
+                    assert decoded._payload.obj is payload
+                else:
+                    assert not decoded._payload.obj is buffer
+
+            # The mapped file can be closed, as the model does not hold a view of it
+            decoded = IPTC.decode(mapped, order=ByteOrder.MSB)
+
+        assert decoded.application.ObjectName == "Object"
+
+
+def test_iptc_model_decode_lazy():
+    payload: bytes = bytes.fromhex(
+        "1c020000020004"  # Record Version
+        "1c020500064f626a656374"  # Object Name
+        "1c0250000158"  # By-line
+    )
+
+    decoded = IPTC.decode(
+        payload, order=ByteOrder.MSB, format=IPTCFormat.RAW, lazy=True
+    )
+
+    assert isinstance(decoded, IPTC)
+
+    # The record values are held in deferred form until they are accessed
+    assert len(decoded._values) == 3
+    assert decoded._values.deferred("application:ObjectName") is True
+    assert decoded._values.deferred("application:Byline") is True
+
+    assert decoded.application.ObjectName == "Object"
+
+    assert decoded._values.deferred("application:ObjectName") is False
+    assert decoded._values.deferred("application:Byline") is True
+
+    # Accessing the values in bulk resolves any remaining deferred values
+    assert [value.value for value in decoded._values.values()] == [4, "Object", "X"]
+    assert decoded._values.deferred("application:Byline") is False
+
+    # A lazily decoded model encodes identically to an eagerly decoded model
+    eager = IPTC.decode(payload, order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    lazy = IPTC.decode(payload, order=ByteOrder.MSB, format=IPTCFormat.RAW, lazy=True)
+
+    assert lazy.dump() == eager.dump()
+
+    assert lazy.encode(order=ByteOrder.MSB, format=IPTCFormat.RAW) == eager.encode(
+        order=ByteOrder.MSB, format=IPTCFormat.RAW
+    )
+
+    # Assigning a value before it has been accessed replaces the deferred value
+    lazy = IPTC.decode(payload, order=ByteOrder.MSB, format=IPTCFormat.RAW, lazy=True)
+
+    lazy.application.ObjectName = "Other"
+
+    assert lazy.application.ObjectName == "Other"
+
+
+def test_iptc_model_encode_passthrough():
+    payload: bytes = bytes.fromhex(
+        "1c020000020004"  # Record Version
+        "1c020500064f626a656374"  # Object Name
+        "1c02fe0003414243"  # Unknown dataset 2:254
+        "1c0250000158"  # By-line
+    )
+
+    for lazy in [False, True]:
+        decoded = IPTC.decode(
+            payload, order=ByteOrder.MSB, format=IPTCFormat.RAW, lazy=lazy
+        )
+
+        assert decoded._values.dirty("application:ObjectName") is False
+
+        # Untouched records, including those for unknown datasets, are copied verbatim
+        assert decoded.encode(order=ByteOrder.MSB, format=IPTCFormat.RAW) == payload
+
+        # Only the assigned field is re-encoded, in the position of its original record
+        decoded.application.Byline = "YZ"
+
+        assert decoded._values.dirty("application:ObjectName") is False
+        assert decoded._values.dirty("application:Byline") is True
+
+        assert decoded.encode(
+            order=ByteOrder.MSB, format=IPTCFormat.RAW
+        ) == bytes.fromhex(
+            "1c020000020004"  # Record Version
+            "1c020500064f626a656374"  # Object Name
+            "1c02fe0003414243"  # Unknown dataset 2:254
+            "1c02500002595a"  # By-line
+            "000000"  # Padding
+        )
+
+
+def test_iptc_model_stream(tmp_path):
+    import io
+    import mmap
+
+    records: bytes = bytes.fromhex(
+        "1c020000020004"  # Record Version
+        "1c020500064f626a656374"  # Object Name
+        "1c0250000158"  # By-line
+    )
+
+    thumbnail: bytes = bytes(100000)
+
+    # An APP13 payload holding a large thumbnail resource ahead of the IPTC resource,
+    # held within a file following some unrelated data
+    payload: bytes = (
+        b"Photoshop 3.0\x00"
+        + b"8BIM\x04\x0c\x00\x00"
+        + len(thumbnail).to_bytes(4, "big")
+        + thumbnail
+        + b"8BIM\x04\x04\x00\x00"
+        + len(records).to_bytes(4, "big")
+        + records
+    )
+
+    filepath = tmp_path / "image.bin"
+    filepath.write_bytes(b"\xff" * 32 + payload + b"\xff" * 32)
+
+    class Handle(io.BytesIO):
+        """Track the number of bytes read from the file handle."""
+
+        count: int = 0
+
+        def read(self, size: int = -1) -> bytes:
+            data = super().read(size)
+            self.count += len(data)
+            return data
+
+    handle = Handle(filepath.read_bytes())
+
+    decoded = IPTC.stream(
+        handle,
+        offset=32,
+        length=len(payload),
+        order=ByteOrder.MSB,
+        fields=["application:ObjectName"],
+    )
+
+    assert isinstance(decoded, IPTC)
+    assert decoded.application.ObjectName == "Object"
+    assert decoded.dump()["Application"]["Byline"] is None
+
+    # Neither the thumbnail nor the records following the requested field were read
+    assert handle.count < 100
+
+    with open(filepath, "rb") as handle:
+        decoded = IPTC.stream(
+            handle, offset=32, length=len(payload), order=ByteOrder.MSB
+        )
+
+        assert decoded.application.ObjectName == "Object"
+        assert decoded.application.Byline == "X"
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoded = IPTC.stream(
+                mapped,
+                offset=32 + len(payload) - len(records),
+                length=len(records),
+                order=ByteOrder.MSB,
+                format=IPTCFormat.RAW,
+                fields=["Byline"],
+            )
+
+            assert decoded.application.Byline == "X"
+
+
+def test_iptc_model_decode_many():
+    payloads: list[bytes] = [
+        bytes.fromhex(
+            "1c020000020004"  # Record Version
+            "1c020500064f626a656374"  # Object Name
+            "1c0250000158"  # By-line
+        ),
+        bytes.fromhex(
+            "1c020000020004"  # Record Version
+            "1c0250000159"  # By-line
+        ),
+        bytes.fromhex("1c020500ff4f"),  # Object Name, with a length exceeding the data
+    ]
+
+    models = IPTC.decode_many(payloads, order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    assert len(models) == 3
+
+    assert models[0].application.ObjectName == "Object"
+    assert models[1].application.Byline == "Y"
+
+    # The malformed payload is skipped rather than aborting the batch
+    assert models[2] is None
+
+    columns = IPTC.decode_many(
+        payloads,
+        order=ByteOrder.MSB,
+        format=IPTCFormat.RAW,
+        fields=["ObjectName", "application:Byline"],
+    )
+
+    assert columns == {
+        "ObjectName": ["Object", None, None],
+        # By-line is a repeatable dataset, so its values are held as lists
+        "application:Byline": [["X"], ["Y"], None],
+    }
+
+
+def test_iptc_model_decode_many_repeatable():
+    """Test that the columnar results hold each occurrence of repeatable datasets."""
+
+    payloads: list[bytes] = [
+        bytes.fromhex(
+            "1c020000020004"  # Record Version
+            "1c021900036f6e65"  # Keywords
+            "1c0219000374776f"  # Keywords
+            "1c021900057468726565"  # Keywords
+            "1c0250000158"  # By-line
+        ),
+        bytes.fromhex(
+            "1c020000020004"  # Record Version
+            "1c0250000159"  # By-line
+        ),
+    ]
+
+    columns = IPTC.decode_many(
+        payloads,
+        order=ByteOrder.MSB,
+        format=IPTCFormat.RAW,
+        fields=["Keywords", "Byline"],
+    )
+
+    assert columns == {
+        "Keywords": [["one", "two", "three"], None],
+        "Byline": [["X"], ["Y"]],
+    }
+
+
+def test_iptc_model_stream_cold():
+    """Test that the requested fields can be resolved by stream() before any IPTC model
+    instances have been created, and so before the schema has been loaded."""
+
+    output: str = cold(
+        "import io\n"
+        "from exifdata.models.iptc import IPTC, IPTCFormat\n"
+        "from deliciousbytes import ByteOrder\n"
+        "payload = bytes.fromhex('1c020000020004' '1c020500064f626a656374')\n"
+        "iptc = IPTC.stream(io.BytesIO(payload), order=ByteOrder.MSB, "
+        "format=IPTCFormat.RAW, fields=['ObjectName'])\n"
+        "print(iptc.application.ObjectName)\n"
+    )
+
+    assert output == "Object"
+
+
+def test_iptc_model_decode_many_cold():
+    """Test that the requested fields can be resolved by decode_many() before any IPTC
+    model instances have been created, and so before the schema has been loaded."""
+
+    output: str = cold(
+        "from exifdata.models.iptc import IPTC, IPTCFormat\n"
+        "from deliciousbytes import ByteOrder\n"
+        "payload = bytes.fromhex('1c020000020004' '1c020500064f626a656374')\n"
+        "print(IPTC.decode_many([payload], order=ByteOrder.MSB, "
+        "format=IPTCFormat.RAW, fields=['ObjectName']))\n"
+    )
+
+    assert output == "{'ObjectName': ['Object']}"
+
+
+def test_iptc_model_encode_splice():
+    caption: bytes = b"A" * 0x9000
+
+    records: bytes = (
+        bytes.fromhex("1c020000020004")  # Record Version
+        + bytes.fromhex("1c02788004")  # Caption, with an extended length
+        + len(caption).to_bytes(4, "big")
+        + caption
+        + bytes.fromhex("1c0250000158")  # By-line
+    )
+
+    # The payload is padded, which is not carried over into the re-encoded payload
+    payload: bytes = records + bytes(-len(records) % 4)
+
+    decoded = IPTC.decode(payload, order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    assert decoded.application.Caption == "A" * 0x9000
+
+    assert decoded.encode(order=ByteOrder.MSB, format=IPTCFormat.RAW) == payload
+
+    # Changing the By-line splices the new record in after the untouched records
+    decoded.application.Byline = "YZ"
+
+    expected: bytes = records[:-6] + bytes.fromhex("1c02500002595a")
+
+    assert decoded.encode(
+        order=ByteOrder.MSB, format=IPTCFormat.RAW
+    ) == expected + bytes(-len(expected) % 4)
+
+    # Changing the Caption replaces the extended length record with a standard record
+    decoded.application.Caption = "Short"
+
+    expected = (
+        bytes.fromhex("1c020000020004")
+        + bytes.fromhex("1c0278000553686f7274")
+        + bytes.fromhex("1c02500002595a")
+    )
+
+    assert decoded.encode(
+        order=ByteOrder.MSB, format=IPTCFormat.RAW
+    ) == expected + bytes(-len(expected) % 4)
+
+
+def test_iptc_model_decode_extended_length():
+    caption: bytes = b"a" * 0x8000
+
+    # Records with data of 0x8000 bytes or longer use the 0x8004 extended length form
+    payload: bytes = (
+        bytes.fromhex("1c020000020004")
+        + bytes.fromhex("1c027880040000" "8000")
+        + caption
+    )
+
+    decoded = IPTC.decode(payload, order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    assert decoded.application.Caption == caption.decode("ASCII")
+
+
+def test_iptc_model_resource_passthrough():
+    from exifdata.models.iptc.structures import Resource
+
+    # A clipping path resource, with a name, and a resolution info resource with data of
+    # an odd length, either side of the IPTC-IIM resource
+    clipping: bytes = Resource(id=0x07D0, name=b"Path 1", data=b"\x01\x02\x03").encode()
+    resolution: bytes = Resource(id=0x03ED, data=b"\x00" * 16).encode()
+
+    records: bytes = bytes.fromhex("1c020000020004" "1c020500064f626a656374")
+
+    payload: bytes = (
+        b"Photoshop 3.0\x00"
+        + clipping
+        + Resource(id=0x0404, data=records).encode()
+        + resolution
+    )
+
+    decoded = IPTC.decode(payload, order=ByteOrder.MSB)
+
+    assert decoded.application.ObjectName == "Object"
+
+    # The resources are indexed by their ID, name, data offset and data length
+    assert [resource.id for resource in decoded.resources] == [0x07D0, 0x0404, 0x03ED]
+
+    resource = decoded.resources.resource(0x07D0)
+
+    assert resource.name == "Path 1"
+    assert resource.length == 3
+    assert (
+        payload[resource.offset : resource.offset + resource.length] == b"\x01\x02\x03"
+    )
+
+    # The other resources are passed through unmodified when the model is re-encoded
+    decoded.application.ObjectName = "Changed"
+
+    encoded: bytes = decoded.encode(order=ByteOrder.MSB)
+
+    assert encoded.startswith(b"Photoshop 3.0\x00" + clipping + b"8BIM\x04\x04")
+    assert resolution in encoded
+
+    redecoded = IPTC.decode(encoded, order=ByteOrder.MSB)
+
+    assert redecoded.application.ObjectName == "Changed"
+    assert [resource.id for resource in redecoded.resources] == [0x07D0, 0x0404, 0x03ED]
+
+
+def test_iptc_model_encoded_size():
+    """Test that the encoded size computed from the record lengths and resources
+    matches the length of the encoded payload in both formats."""
+
+    caption: bytes = b"A" * 0x9000
+
+    records: bytes = (
+        bytes.fromhex("1c020000020004")  # Record Version
+        + bytes.fromhex("1c02788004")  # Caption, with an extended length
+        + len(caption).to_bytes(4, "big")
+        + caption
+        + bytes.fromhex("1c0250000158")  # By-line
+    )
+
+    decoded = IPTC.decode(records, order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    for assignment in (None, "YZ", "Odd"):
+        if assignment:
+            decoded.application.Byline = assignment
+
+        for format in (IPTCFormat.APP13, IPTCFormat.RAW):
+            assert decoded.encoded_size(order=ByteOrder.MSB, format=format) == len(
+                decoded.encode(order=ByteOrder.MSB, format=format)
+            )
+
+    assert IPTC().encoded_size(order=ByteOrder.MSB) == 0
+
+
+def test_iptc_model_resource_lengths(caplog):
+    """Test that only the IPTC-IIM resource is extended to the end of the data when its
+    recorded length does not lead to another resource, while other resources retain
+    their recorded lengths, so trailing padding or data is not absorbed into them."""
+
+    from exifdata.models.iptc.structures import Resource, Resources
+
+    resolution: bytes = Resource(id=0x03ED, data=b"\x01" * 16).encode()
+
+    records: bytes = bytes.fromhex("1c020000020004" "1c020500064f626a656374")
+
+    # Trailing padding following the last resource is not absorbed into it
+    resources = Resources.decode(resolution + bytes(3))
+
+    assert resources.resource(0x03ED).length == 16
+
+    # Trailing data following the last resource is ignored, and noted in the log
+    with caplog.at_level("WARNING", logger="exifdata"):
+        resources = Resources.decode(resolution + b"\xff\xff")
+
+    assert resources.resource(0x03ED).length == 16
+
+    assert "resource 0x03ed does not lead to another resource" in caplog.text
+
+    # An IPTC-IIM resource whose recorded length is too short extends to the end
+    iptc: bytearray = bytearray(Resource(id=0x0404, data=records).encode())
+
+    iptc[10:12] = (len(records) - 4).to_bytes(2, "big")
+
+    resources = Resources.decode(resolution + bytes(iptc))
+
+    assert resources.resource(0x0404).length == len(records)
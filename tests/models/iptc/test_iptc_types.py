@@ -87,3 +87,20 @@ def test_type_string():
 
     assert decoded.value == "hello"
     assert decoded.encode() == b"hello"
+
+
+def test_type_string_transliteration():
+    """Test the IPTC metadata field String data type, by encoding strings that contain
+    diacritics and characters with registered replacements, and that the encoded value
+    is reused for subsequent encodes, such as when determining the record length."""
+
+    encoded = String(value="Café © 2025")
+
+    assert encoded.encode() == b"Cafe (c) 2025"
+
+    assert len(encoded) == 13
+
+    assert encoded.encode() is encoded.encode()
+
+    # Strings holding only ASCII characters are encoded as-is
+    assert String(value="plain").encode() == b"plain"
@@ -3,6 +3,7 @@ from exifdata import (
     Metadata,
     EXIF,
     IPTC,
+    IPTCFormat,
     XMP,
 )
 
@@ -10,6 +11,8 @@ from exifdata.adapters import (
     TIFFData,
 )
 
+from deliciousbytes import ByteOrder
+
 
 def test_exifdata_models_initialisation(path: callable):
     filepath: str = path("test.tiff")
@@ -26,3 +29,215 @@ def test_exifdata_models_initialisation(path: callable):
 
     assert isinstance(models.xmp, XMP)
     assert isinstance(models.xmp, Metadata)
+
+
+def test_exifdata_models_compile(path: callable):
+    filepath: str = path("test.tiff")
+
+    models = Models.adapt(TIFFData).open(filepath, decode=False)
+
+    plan = Models.compile(
+        {
+            "title": "xmp:dc:title",
+            "object": "iptc:ObjectName",
+            "copyright": "Copyright",
+            "unknown": "Unknown:DoesNotExist",
+        }
+    )
+
+    assert len(plan) == 3
+    assert plan.unresolved == ["Unknown:DoesNotExist"]
+
+    plan.apply(
+        models,
+        {
+            "title": "Title",
+            "object": "Object",
+            "copyright": "Copyright",
+            "unknown": "Ignored",
+        },
+    )
+
+    assert models.xmp.dc.title == "Title"
+    assert models.iptc.application.ObjectName == "Object"
+
+    # The unprefixed 'Copyright' name resolves to fields on each of the models
+    assert models.exif.Copyright == "Copyright"
+    assert models.iptc.application.Copyright == "Copyright"
+    assert models.xmp.tiff.Copyright == "Copyright"
+
+
+def test_exifdata_models_encoded_size(path: callable):
+    filepath: str = path("test.tiff")
+
+    models = Models.adapt(TIFFData).open(filepath, decode=False)
+
+    assert models.encoded_size() == {"EXIF": 0, "IPTC": 0, "XMP": 0}
+
+    models.exif.Make = "Example"
+    models.iptc.application.ObjectName = "Object"
+    models.xmp.basic.label = "Label"
+
+    sizes: dict[str, int] = models.encoded_size(iptc=dict(format=IPTCFormat.RAW))
+
+    assert sizes["EXIF"] == len(models.exif.encode())
+    assert sizes["IPTC"] == len(
+        models.iptc.encode(order=ByteOrder.MSB, format=IPTCFormat.RAW)
+    )
+    assert sizes["XMP"] == len(models.xmp.encode())
+
+
+def test_exifdata_models_encoded_size_options(path: callable, monkeypatch):
+    """Test that the sizes are computed with the options that the adapter encodes each
+    model with, that the per-model options take precedence, and that the byte order is
+    only applied to all of the models when it is specified."""
+
+    filepath: str = path("test.tiff")
+
+    models = Models.adapt(TIFFData).open(filepath, decode=False)
+
+    models.iptc.application.ObjectName = "Object"
+
+    arguments: list[dict[str, object]] = []
+
+    encoded_size = IPTC.encoded_size
+
+    def spy(self, **kwargs) -> int:
+        arguments.append(kwargs)
+
+        return encoded_size(self, **kwargs)
+
+    monkeypatch.setattr(IPTC, "encoded_size", spy)
+
+    order: ByteOrder = models.adapter.byteorder()
+
+    sizes: dict[str, int] = models.encoded_size()
+
+    assert arguments.pop() == dict(order=order, format=IPTCFormat.RAW)
+
+    assert sizes["IPTC"] == len(models.iptc.encode(order=order, format=IPTCFormat.RAW))
+
+    models.encoded_size(order=ByteOrder.LSB, iptc=dict(order=ByteOrder.MSB))
+
+    assert arguments.pop() == dict(order=ByteOrder.MSB, format=IPTCFormat.RAW)
+
+    sizes = models.encoded_size(iptc=dict(format=IPTCFormat.APP13))
+
+    assert arguments.pop() == dict(order=order, format=IPTCFormat.APP13)
+
+    assert sizes["IPTC"] == len(
+        models.iptc.encode(order=order, format=IPTCFormat.APP13)
+    )
+
+
+def test_exifdata_models_vips_byte_order(monkeypatch):
+    """Test that the byte order of a little-endian EXIF payload is retained through the
+    VIPS adapter, while the IPTC payload remains big-endian, as IPTC-IIM requires; the
+    PyVIPS library is optional, so a minimal stand-in for its image class is used."""
+
+    import types
+
+    from exifdata.adapters import VIPS
+    from exifdata.adapters import vips as module
+
+    class Image(object):
+        def __init__(self, blobs: dict[str, bytes]):
+            self.blobs = blobs
+
+        def get_fields(self) -> list[str]:
+            return list(self.blobs)
+
+        def get(self, name: str) -> bytes:
+            return self.blobs[name]
+
+        def set_type(self, type: str, name: str, value: bytes):
+            self.blobs[name] = value
+
+        def remove(self, name: str):
+            self.blobs.pop(name, None)
+
+    monkeypatch.setattr(
+        module,
+        "vips",
+        types.SimpleNamespace(Image=Image, type_from_name=lambda name: name),
+    )
+
+    exif = EXIF()
+    exif.exif.Make = "Example"
+
+    image = Image({"exif-data": exif.encode(order=ByteOrder.LSB)})
+
+    models = Models.adapt(VIPS).load(image)
+
+    assert models.adapter.byteorder() is ByteOrder.LSB
+    assert models.exif.order is ByteOrder.LSB
+    assert models.exif.Make == "Example"
+
+    # The IPTC model is created afresh, so its Record Version record is encoded too
+    models.iptc.application.ObjectName = "Object"
+
+    models.encode()
+
+    assert EXIF.byteorder(image.blobs["exif-data"]) is ByteOrder.LSB
+
+    # The IPTC payload written to the image can be decoded again through the adapter
+    models = Models.adapt(VIPS).load(image)
+
+    assert models.iptc.application.ObjectName == "Object"
+
+    decoded = IPTC.decode(
+        image.blobs["iptc-data"], order=ByteOrder.MSB, format=IPTCFormat.RAW
+    )
+
+    assert decoded.application.RecordVersion == 4
+    assert decoded.application.ObjectName == "Object"
+
+
+def test_exifdata_models_assign_prefixes(path: callable, caplog, monkeypatch):
+    """Test that model name prefixes are determined from the models held, so that with
+    only the XMP model present, the 'exif' prefix names the XMP model's EXIF namespace,
+    and that resolving names does not create model instances once set up."""
+
+    filepath: str = path("test.tiff")
+
+    models = Models.adapt(TIFFData).open(filepath, decode=False)
+
+    models._models = [model for model in models if isinstance(model, XMP)]
+
+    models.assign("exif:ExposureTime", "1/100")
+
+    assert models.xmp.exif.ExposureTime == "1/100"
+
+    assert [model.name for model in models] == ["XMP"]
+
+    # The full field name, including any prefix, is reported if it cannot be found
+    with caplog.at_level("WARNING", logger="exifdata"):
+        models.assign("iptc:DoesNotExist", "Ignored")
+
+    assert "'iptc:DoesNotExist' field could not be found" in caplog.text
+
+    def instantiate(cls, *args, **kwargs):
+        raise AssertionError("The %s model should not be instantiated!" % (cls))
+
+    for modeltype in (EXIF, IPTC, XMP):
+        monkeypatch.setattr(modeltype, "__new__", instantiate)
+
+    assert [match[0] for match in Models.resolve("xmp:dc:title")] == [XMP]
+
+
+def test_exifdata_adapters_exiftool_byteorder():
+    """Test that the EXIFTool adapter's byte order is determined from the reported
+    'ExifByteOrder' field, and the misspelled method name is deprecated."""
+
+    import pytest
+
+    from exifdata.adapters.exiftool import EXIFTool
+
+    adapter = EXIFTool(metadata={"ExifByteOrder": "Little-endian (Intel, II)"})
+
+    assert adapter.byteorder() is ByteOrder.LSB
+
+    assert EXIFTool(metadata={}).byteorder() is ByteOrder.MSB
+
+    with pytest.warns(DeprecationWarning):
+        assert adapter.byteoder() is ByteOrder.LSB